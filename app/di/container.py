@@ -1,26 +1,115 @@
 from core.infrastructure.di.core_container import CoreContainer
 from dependency_injector import providers
 
+from core.infrastructure.buffer.aggregation_buffer import init_aggregation_buffer
+from core.infrastructure.cache.invalidation import init_invalidation_subscriber
+from core.infrastructure.cache.near_cache import NearCache
+from core.infrastructure.tasks.periodic import init_periodic_task
+from core.infrastructure.tasks.startup import init_startup_task
+
 from app.keywords.infrastructure.repositories.keyword_repository import KeywordRepository
 from app.keywords.infrastructure.repositories.redis_repository import KeywordRedisRepository
+from app.keywords.infrastructure.repositories.popular_search_gate import create_popular_search_gate
 
 from app.keywords.application.services.keyword_service import KeywordService
 
 class Container(CoreContainer):
     keyword_repository = providers.Singleton(
         KeywordRepository,
-        session=CoreContainer.database.provided.session
+        session=CoreContainer.database.provided.session,
+        read_router=CoreContainer.database_read_router,
+        rollup_windows=CoreContainer.config.POPULAR_SEARCH_ROLLUP_WINDOWS,
+    )
+
+    popular_search_gate = providers.Singleton(
+        create_popular_search_gate,
+        capacity=CoreContainer.config.POPULAR_SEARCH_SKETCH_CAPACITY,
+        promote_threshold=CoreContainer.config.POPULAR_SEARCH_PROMOTE_THRESHOLD,
     )
 
     keyword_redis_repository = providers.Singleton(
         KeywordRedisRepository,
-        client=CoreContainer.redis_client
+        client=CoreContainer.redis_client,
+        read_router=CoreContainer.redis_read_router,
+        autocomplete_max_prefix_length=CoreContainer.config.AUTOCOMPLETE_MAX_PREFIX_LENGTH,
+        autocomplete_per_prefix=CoreContainer.config.AUTOCOMPLETE_PER_PREFIX,
+        popular_search_gate=popular_search_gate,
+        popular_search_max_members=CoreContainer.config.POPULAR_SEARCH_MAX_MEMBERS,
+        recent_search_anonymous_ttl_seconds=CoreContainer.config.RECENT_SEARCH_ANONYMOUS_TTL_SECONDS,
+        invalidation_publisher=CoreContainer.cache_invalidation_publisher,
+    )
+
+    popular_search_buffer = providers.Resource(
+        init_aggregation_buffer,
+        flush_func=keyword_repository.provided.bulk_update_popular_search,
+        flush_interval_ms=CoreContainer.config.POPULAR_SEARCH_FLUSH_INTERVAL_MS,
+        max_entries=CoreContainer.config.POPULAR_SEARCH_FLUSH_MAX_ENTRIES,
+        max_attempts=CoreContainer.config.POPULAR_SEARCH_FLUSH_MAX_ATTEMPTS,
+        max_backoff_seconds=CoreContainer.config.POPULAR_SEARCH_FLUSH_MAX_BACKOFF_SECONDS,
+        name="popular_search",
+    )
+
+    popular_window_materializer = providers.Resource(
+        init_periodic_task,
+        job=keyword_redis_repository.provided.materialize_popular_windows,
+        interval_seconds=CoreContainer.config.POPULAR_WINDOW_REFRESH_SECONDS,
+        name="popular_window_materializer",
+    )
+
+    popular_search_trimmer = providers.Resource(
+        init_periodic_task,
+        job=keyword_redis_repository.provided.trim_popular_searches,
+        interval_seconds=CoreContainer.config.POPULAR_SEARCH_TRIM_INTERVAL_SECONDS,
+        name="popular_search_trimmer",
+    )
+
+    # 날짜가 바뀌면 rollup window를 하루씩 민다 (여러 워커가 돌아도 상태 행 잠금으로 한 번만 반영)
+    popular_search_rollup_advancer = providers.Resource(
+        init_periodic_task,
+        job=keyword_repository.provided.advance_popular_search_rollups,
+        interval_seconds=CoreContainer.config.POPULAR_SEARCH_ROLLUP_INTERVAL_SECONDS,
+        name="popular_search_rollup_advancer",
+    )
+
+    popular_search_cache = providers.Singleton(
+        NearCache,
+        ttl_seconds=CoreContainer.config.POPULAR_SEARCH_CACHE_TTL_SECONDS,
+        stale_ttl_seconds=CoreContainer.config.POPULAR_SEARCH_CACHE_STALE_SECONDS,
+        max_size=CoreContainer.config.POPULAR_SEARCH_CACHE_MAX_SIZE,
+        name="popular_search",
+    )
+
+    recent_search_cache = providers.Singleton(
+        NearCache,
+        ttl_seconds=CoreContainer.config.RECENT_SEARCH_CACHE_TTL_SECONDS,
+        max_size=CoreContainer.config.RECENT_SEARCH_CACHE_MAX_SIZE,
+        name="recent_search",
+    )
+
+    # 다른 워커가 바꾼 키를 pub/sub으로 받아 이 워커의 near-cache에서 지운다
+    near_cache_invalidation_subscriber = providers.Resource(
+        init_invalidation_subscriber,
+        client=CoreContainer.redis_client,
+        caches=providers.List(popular_search_cache, recent_search_cache),
+        channel=CoreContainer.config.NEAR_CACHE_INVALIDATION_CHANNEL,
+        enabled=CoreContainer.config.NEAR_CACHE_INVALIDATION_ENABLED,
     )
 
     # ------------------------------------------
 
-    keyword_service = providers.Factory(
+    # 상태가 없는 서비스이므로 요청마다 새로 만들지 않는다
+    keyword_service = providers.Singleton(
         KeywordService,
         keyword_repository=keyword_repository,
-        keyword_redis_repository=keyword_redis_repository
-    )
\ No newline at end of file
+        keyword_redis_repository=keyword_redis_repository,
+        popular_search_buffer=popular_search_buffer,
+        popular_search_cache=popular_search_cache,
+        recent_search_cache=recent_search_cache,
+    )
+
+    popular_search_warmup = providers.Resource(
+        init_startup_task,
+        job=keyword_service.provided.warm_up_popular_searches,
+        enabled=CoreContainer.config.POPULAR_SEARCH_REBUILD_ON_STARTUP,
+        name="popular_search_warmup",
+    )
@@ -1,3 +1,7 @@
+from typing import List, Optional
+
+from pydantic import Field
+
 from core.applications.dtos.dto import BaseRequest, BaseResponse
 
 class PopularSearchResponseDto(BaseResponse):
@@ -7,4 +11,33 @@ class PopularSearchResponseDto(BaseResponse):
 
 class UpdatePopularRequestDto(BaseRequest):
     term: str
-    category: str
\ No newline at end of file
+    category: str
+
+class AutocompleteResponseDto(BaseResponse):
+    term: str
+    count: int
+
+class RecentSearchResponseDto(BaseResponse):
+    term: str
+    category: str
+
+
+class KeywordEventRequestDto(BaseRequest):
+    term: str
+    category: str
+
+
+class BatchKeywordEventRequestDto(BaseRequest):
+    events: List[KeywordEventRequestDto] = Field(..., min_length=1, max_length=1000)
+
+
+class KeywordEventResultDto(BaseResponse):
+    index: int
+    status: str
+    detail: Optional[str] = None
+
+
+class BatchKeywordEventResponseDto(BaseResponse):
+    accepted: int
+    rejected: int
+    results: List[KeywordEventResultDto]
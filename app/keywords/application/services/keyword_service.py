@@ -1,37 +1,208 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from core.infrastructure.buffer.aggregation_buffer import AggregationBuffer
+from core.infrastructure.cache.near_cache import NearCache
+from core.setting.settings import get_settings
+
 from app.keywords.infrastructure.repositories.keyword_repository import KeywordRepository
 from app.keywords.infrastructure.repositories.redis_repository import KeywordRedisRepository
 
 from app.keywords.application.dto.keyword_dto import (
+    BatchKeywordEventRequestDto,
+    BatchKeywordEventResponseDto,
+    KeywordEventResultDto,
     UpdatePopularRequestDto
 )
 
 class KeywordService:
     def __init__(self, 
                  keyword_repository: KeywordRepository,
-                 keyword_redis_repository: KeywordRedisRepository):
+                 keyword_redis_repository: KeywordRedisRepository,
+                 popular_search_buffer: AggregationBuffer,
+                 popular_search_cache: NearCache,
+                 recent_search_cache: NearCache):
         self.rdb_repo = keyword_repository
         self.redis_repo = keyword_redis_repository
+        self.popular_search_buffer = popular_search_buffer
+        # 워커 메모리 캐시. 원본 redis 키를 태그로 달아 두고 pub/sub 무효화로 해당 항목만 지운다
+        self.popular_search_cache = popular_search_cache
+        self.recent_search_cache = recent_search_cache
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def get_popular_searches(self, category=None, limit=10, window=None):
+        return await self.popular_search_cache.get_or_load(
+            (category, limit, window),
+            lambda: self._load_popular_searches(category, limit, window),
+            tags=(self.redis_repo.popular_source_key(category, window),),
+        )
 
-    async def get_popular_searches(self, category=None, limit=10):
-        return await self.redis_repo.get_popular_searches(category, limit)
+    async def _load_popular_searches(self, category, limit, window):
+        # 응답 모양의 dict로 한 번만 직렬화해 캐시한다 (캐시 hit는 모델 변환 없이 바로 JSON 인코딩)
+        searches = await self.redis_repo.get_popular_searches(category, limit, window)
+        return [search.model_dump(mode="json", by_alias=True) for search in searches]
 
-    async def update_popular_search(self, update_data: UpdatePopularRequestDto):
-        await self.rdb_repo.update_popular_search(term=update_data.term, category=update_data.category)
-        await self.redis_repo.inc_popular_search(term=update_data.term, category=update_data.category)
+    async def autocomplete(self, query, limit=10):
+        return await self.redis_repo.autocomplete(query, limit)
+
+    async def update_popular_search(self, update_data: UpdatePopularRequestDto, redis_key=None):
+        # 인기 검색어 카운터와 최근 검색어를 redis round trip 한 번에 반영.
+        # 카운트가 반영되지 않은 실패만 예외로 올린다 (반영된 뒤의 실패를 올리면 재시도가 중복 집계된다)
+        error = await self.redis_repo.record_keyword_event(
+            term=update_data.term, category=update_data.category, recent_key=redis_key
+        )
+        if error:
+            self.logger.warning(f"검색어 집계 후 부수 쓰기 실패: {error!r}")
+        # DB 반영은 버퍼에서 (term, category, date) 단위로 합산 후 일괄 flush
+        today = datetime.now(get_settings().TIMEZONE_KST).date()
+        self.popular_search_buffer.add((update_data.term, update_data.category, today))
+        self._invalidate_recent_searches(redis_key)
         return {"status": "success"}
 
-    async def add_recent_search(self, db, redis_key, term, category, user_info=None):
+    async def batch_update_popular_search(self, batch: BatchKeywordEventRequestDto, redis_key=None):
+        """
+        이벤트별 결과: success / partial(카운트는 반영, 최근 검색어 등 부수 쓰기 실패 - 재시도 금지)
+        / failed(카운트 미반영 - 재시도 가능) / invalid.
+        최근 검색어 키는 요청의 anonymous_id 쿠키로만 정한다 (본문으로 받으면 남의 목록에 쓸 수 있다).
+        """
+        results = [None] * len(batch.events)
+        valid = []
+        for index, event in enumerate(batch.events):
+            reason = self.validate_keyword_event(event)
+            if reason:
+                results[index] = KeywordEventResultDto(index=index, status="invalid", detail=reason)
+            else:
+                valid.append((index, event))
+
+        # redis 쓰기는 pipeline 한 번, DB 쓰기는 버퍼에서 합산 후 MERGE 한 번
+        outcomes = await self.redis_repo.record_keyword_events(
+            [(event.term, event.category, redis_key) for _, event in valid]
+        ) if valid else []
+
+        today = datetime.now(get_settings().TIMEZONE_KST).date()
+        for (index, event), (counted, error) in zip(valid, outcomes):
+            if not counted:
+                results[index] = KeywordEventResultDto(index=index, status="failed", detail=str(error))
+                continue
+            self.popular_search_buffer.add((event.term, event.category, today))
+            if error:
+                results[index] = KeywordEventResultDto(index=index, status="partial", detail=str(error))
+            else:
+                results[index] = KeywordEventResultDto(index=index, status="success")
+        if valid:
+            self._invalidate_recent_searches(redis_key)
+
+        accepted = sum(1 for result in results if result.status in ("success", "partial"))
+        return BatchKeywordEventResponseDto(
+            accepted=accepted, rejected=len(results) - accepted, results=results
+        )
+
+    @staticmethod
+    def validate_keyword_event(event, strict_category=True):
+        """
+        거절 사유 (정상이면 None).
+        ':'가 든 category는 일괄 API에서만 거절한다. 단건 /update_popular_search는 이전처럼 받고
+        redis member에는 인코딩해서 넣는다 (redis_keys.popular_member)
+        """
+        if not event.term.strip():
+            return "term is empty"
+        if not event.category.strip():
+            return "category is empty"
+        if strict_category and ":" in event.category:
+            return "category must not contain ':'"
+        return None
+
+    async def rebuild_popular_searches(self, only_if_empty=False):
+        """
+        MSSQL 일별 집계로 redis 전체/카테고리 leaderboard를 다시 만든다.
+        임시 키에 적재 후 RENAME으로 교체하므로 조회는 중단되지 않는다.
+        """
+        if only_if_empty and await self.redis_repo.count_popular_searches():
+            return {"status": "skipped"}
+
+        lock_name, lock_ttl = "popular_searches_rebuild", 600
+        lock = await self.redis_repo.acquire_lock(lock_name, ttl_seconds=lock_ttl)
+        if not lock:
+            return {"status": "locked"}
+
+        start = time.monotonic()
+        # 재생성이 TTL보다 길어져도 다른 워커가 락을 가져가지 않도록 주기적으로 연장한다
+        keep_alive = asyncio.create_task(self._keep_lock_alive(lock_name, lock, lock_ttl))
+        try:
+            # 이 워커 버퍼의 증가분을 먼저 DB에 내보내 스냅샷에 포함시킨다.
+            # 다른 워커 버퍼에 남은 증가분(최대 flush 주기만큼)은 이번 스냅샷에 빠질 수 있다
+            await self.popular_search_buffer.flush()
+            chunks = self.rdb_repo.stream_popular_search_totals(
+                chunk_size=get_settings().POPULAR_SEARCH_REBUILD_CHUNK_SIZE
+            )
+            rows = await self.redis_repo.replace_popular_searches(
+                chunks,
+                on_chunk=lambda loaded: self.logger.info(f"인기 검색어 leaderboard 재생성 중: {loaded}건 적재"),
+                lock=(lock_name, lock),
+            )
+            if rows is None:
+                self.logger.error("인기 검색어 재생성 중 락을 잃어 교체하지 않음")
+                return {"status": "lock_lost"}
+            indexed = await self.redis_repo.rebuild_autocomplete_index() if rows else 0
+        finally:
+            keep_alive.cancel()
+            await self.redis_repo.release_lock(lock_name, lock)
+
+        self.popular_search_cache.clear()
+        return {
+            "status": "success",
+            "rows": rows,
+            "autocomplete_terms": indexed,
+            "duration_ms": int((time.monotonic() - start) * 1000),
+        }
+
+    async def _keep_lock_alive(self, name, token, ttl_seconds):
+        while True:
+            await asyncio.sleep(ttl_seconds / 3)
+            try:
+                if not await self.redis_repo.extend_lock(name, token, ttl_seconds):
+                    return
+            except Exception as e:
+                self.logger.warning(f"락 연장 실패 ({name}): {e!r}")
+
+    async def warm_up_popular_searches(self):
+        # redis가 비어 있을 때(flush/failover 직후)만 재생성
+        return await self.rebuild_popular_searches(only_if_empty=True)
+
+    async def add_recent_search(self, redis_key, term, category, db=None, user_info=None):
         if user_info: 
             await self.rdb_repo.add_recent_search(db, user_info.UserId, term, category)
         else:  
             pass
-        await self.redis_repo.add_recent_search(redis_key, term, category)
+        await self.redis_repo.add_recent_search(redis_key, term, category, anonymous=user_info is None)
+        self._invalidate_recent_searches(redis_key, anonymous=user_info is None)
         return {"status": "success"}
 
+    def _invalidate_recent_searches(self, redis_key, anonymous=True):
+        # 같은 워커는 pub/sub 메시지를 기다리지 않고 바로 지운다 (다른 워커는 구독으로)
+        if redis_key:
+            self.recent_search_cache.invalidate_tags([self.redis_repo.recent_source_key(redis_key, anonymous)])
+
     async def get_recent_searches(self, redis_key, db=None, user_id=None, category=None):
-        # 우선 redis에서
-        result = await self.redis_repo.get_recent_searches(redis_key, category)
+        # 우선 redis에서 (바뀌기 전까지는 워커 메모리에서)
+        anonymous = user_id is None
+        result = list(await self.recent_search_cache.get_or_load(
+            (redis_key, category, anonymous),
+            lambda: self.redis_repo.get_recent_searches(redis_key, category, anonymous=anonymous),
+            tags=(self.redis_repo.recent_source_key(redis_key, anonymous),),
+        ))
         if len(result) < 20 and db and user_id:
             db_result = await self.rdb_repo.get_user_recent_searches(db, user_id, category, 20 - len(result))
             result += db_result
         return result[:20]
+
+    def get_popular_search_buffer_stats(self):
+        return self.popular_search_buffer.stats()
+
+    def get_popular_search_cache_stats(self):
+        return self.popular_search_cache.stats()
+
+    def get_recent_search_cache_stats(self):
+        return self.recent_search_cache.stats()
@@ -3,4 +3,8 @@ from core.infrastructure.entities.entity import Entity
 class PopularSearchEntity(Entity):
     term: str
     category: str
-    count: int
\ No newline at end of file
+    count: int
+
+class AutocompleteEntity(Entity):
+    term: str
+    count: int
@@ -0,0 +1,41 @@
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+# 초성 1개당 중성 21 x 종성 28 = 588 음절
+SYLLABLES_PER_CHOSUNG = 21 * 28
+
+CHOSUNG = (
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)
+
+
+def is_hangul_syllable(char: str) -> bool:
+    return HANGUL_SYLLABLE_START <= ord(char) <= HANGUL_SYLLABLE_END
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절은 초성으로 바꾸고 나머지 문자는 그대로 둔다. ex) 삼성전자 -> ㅅㅅㅈㅈ"""
+    return "".join(
+        CHOSUNG[(ord(char) - HANGUL_SYLLABLE_START) // SYLLABLES_PER_CHOSUNG]
+        if is_hangul_syllable(char) else char
+        for char in text
+    )
+
+
+def normalize_autocomplete_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def autocomplete_prefixes(term: str, max_length: int):
+    """
+    자동완성 색인용 prefix 목록. 원문 prefix와 (한글이 있으면) 공백을 뺀 초성 prefix를 함께 만든다.
+    """
+    normalized = normalize_autocomplete_text(term)
+    prefixes = {normalized[:i] for i in range(1, min(len(normalized), max_length) + 1)}
+
+    if any(is_hangul_syllable(char) for char in normalized):
+        chosung = to_chosung(normalized.replace(" ", ""))
+        prefixes.update(chosung[:i] for i in range(1, min(len(chosung), max_length) + 1))
+
+    # 조회 시 query 끝 공백은 정규화로 사라지므로 색인하지 않는다
+    return sorted(prefix for prefix in prefixes if not prefix.endswith(" "))
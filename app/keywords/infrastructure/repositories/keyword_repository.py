@@ -1,63 +1,260 @@
 from contextlib import AbstractAsyncContextManager
-from typing import Callable
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Optional
 
-from sqlalchemy import select, and_, func
-from core.models.model import PopularSearches
+from sqlalchemy import select, func, text
+from core.models.model import PopularSearchRollup, PopularSearchRollupState, PopularSearches
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.infrastructure.replica.router import ReplicaRouter
+from core.setting.settings import get_settings
+
 SessionFactory = Callable[..., AbstractAsyncContextManager[AsyncSession]]
 
+POPULAR_SEARCHES_TABLE = PopularSearches.__table__.name
+ROLLUP_TABLE = PopularSearchRollup.__table__.name
+ROLLUP_STATE_TABLE = PopularSearchRollupState.__table__.name
+
+# SQL Server 파라미터 최대 2100개 -> 행당 4개
+MERGE_BATCH_ROWS = 500
+
+# (term, category, date) unique 제약 + HOLDLOCK 으로 동시 증가에도 중복 행이 생기지 않는다
+MERGE_POPULAR_SEARCH_SQL = """
+MERGE {table} WITH (HOLDLOCK) AS target
+USING (VALUES {values}) AS source (search_term, search_category, search_date, search_count)
+   ON target.search_term = source.search_term
+  AND target.search_category = source.search_category
+  AND target.search_date = source.search_date
+ WHEN MATCHED THEN
+      UPDATE SET target.search_count = target.search_count + source.search_count
+ WHEN NOT MATCHED THEN
+      INSERT (search_term, search_category, search_date, search_count)
+      VALUES (source.search_term, source.search_category, source.search_date, source.search_count);
+"""
+
+# 증가분 중 각 window 시작일 이후 날짜만 rollup에 더한다.
+# 상태 행을 HOLDLOCK으로 읽으므로 같은 window를 밀거나 재생성하는 작업과 겹치지 않는다
+MERGE_ROLLUP_SQL = """
+MERGE {rollup} WITH (HOLDLOCK) AS target
+USING (
+    SELECT state.window_days, v.search_term, v.search_category, SUM(v.search_count)
+      FROM (VALUES {values}) AS v (search_term, search_category, search_date, search_count)
+      JOIN {state} AS state WITH (HOLDLOCK) ON v.search_date >= state.window_start
+     GROUP BY state.window_days, v.search_term, v.search_category
+) AS source (window_days, search_term, search_category, search_count)
+   ON target.window_days = source.window_days
+  AND target.search_term = source.search_term
+  AND target.search_category = source.search_category
+ WHEN MATCHED THEN
+      UPDATE SET target.total_count = target.total_count + source.search_count
+ WHEN NOT MATCHED THEN
+      INSERT (window_days, search_term, search_category, total_count)
+      VALUES (source.window_days, source.search_term, source.search_category, source.search_count);
+"""
+
+# window 시작일을 하루 밀고 빠지는 날짜를 돌려준다. 상태 행 갱신을 먼저 해서 (X lock)
+# 증가분 반영과 잠금 순서를 state -> rollup -> PopularSearches로 맞춘다
+ADVANCE_ROLLUP_STATE_SQL = f"""
+UPDATE {ROLLUP_STATE_TABLE}
+   SET window_start = DATEADD(day, 1, window_start), updated_at = SYSUTCDATETIME()
+OUTPUT deleted.window_start
+ WHERE window_days = :window_days AND window_start < :target_start
+"""
+
+SUBTRACT_ROLLUP_DAY_SQL = f"""
+UPDATE r
+   SET r.total_count = r.total_count - p.search_count
+  FROM {ROLLUP_TABLE} r
+  JOIN {POPULAR_SEARCHES_TABLE} p
+    ON p.search_term = r.search_term
+   AND p.search_category = r.search_category
+ WHERE r.window_days = :window_days AND p.search_date = :expired_date;
+
+DELETE FROM {ROLLUP_TABLE} WHERE window_days = :window_days AND total_count <= 0
+"""
+
+RESET_ROLLUP_STATE_SQL = f"""
+MERGE {ROLLUP_STATE_TABLE} WITH (HOLDLOCK) AS target
+USING (VALUES (:window_days, :window_start)) AS source (window_days, window_start)
+   ON target.window_days = source.window_days
+ WHEN MATCHED THEN
+      UPDATE SET target.window_start = source.window_start, target.updated_at = SYSUTCDATETIME()
+ WHEN NOT MATCHED THEN
+      INSERT (window_days, window_start, updated_at)
+      VALUES (source.window_days, source.window_start, SYSUTCDATETIME());
+"""
+
+REBUILD_ROLLUP_SQL = f"""
+DELETE FROM {ROLLUP_TABLE} WHERE window_days = :window_days;
+
+INSERT INTO {ROLLUP_TABLE} (window_days, search_term, search_category, total_count)
+SELECT :window_days, search_term, search_category, SUM(search_count)
+  FROM {POPULAR_SEARCHES_TABLE}
+ WHERE search_date >= :window_start
+ GROUP BY search_term, search_category
+HAVING SUM(search_count) > 0
+"""
+
+
+def _merge_values(rows):
+    values, params = [], {}
+    for i, (term, category, search_date, count) in enumerate(rows):
+        values.append(f"(:term_{i}, :category_{i}, :date_{i}, :count_{i})")
+        params.update({
+            f"term_{i}": term,
+            f"category_{i}": category,
+            f"date_{i}": search_date,
+            f"count_{i}": count,
+        })
+    return ", ".join(values), params
+
+
+def build_merge_popular_search(rows):
+    """rows: [(term, category, date, count), ...] -> 다중 행 MERGE statement와 파라미터"""
+    values, params = _merge_values(rows)
+    return text(MERGE_POPULAR_SEARCH_SQL.format(table=POPULAR_SEARCHES_TABLE, values=values)), params
+
+
+def build_merge_popular_search_rollup(rows):
+    """build_merge_popular_search와 같은 rows로 window별 rollup 증가 MERGE를 만든다"""
+    values, params = _merge_values(rows)
+    sql = MERGE_ROLLUP_SQL.format(rollup=ROLLUP_TABLE, state=ROLLUP_STATE_TABLE, values=values)
+    return text(sql), params
+
+
 class KeywordRepository:
-    def __init__(self, session: SessionFactory) -> None:
+    def __init__(self,
+                 session: SessionFactory,
+                 read_router: Optional[ReplicaRouter] = None,
+                 rollup_windows: Iterable[int] = ()) -> None:
         self.session = session
+        self.read_router = read_router
+        # rollup으로 미리 합산해 두는 기간(일). 이 기간의 조회는 GROUP BY 없이 rollup에서 읽는다
+        self.rollup_windows = tuple(rollup_windows)
+
+    def read_session(self):
+        # 무거운 집계 조회는 replica에서 (replica가 없거나 비정상이면 primary)
+        return self.read_router.session() if self.read_router else self.session()
 
     async def get_popular_searches(self, duration_days=30, limit=100):
-        today = func.current_date()
-        duration_ago = func.current_date() - duration_days
-        async with self.session as session:
+        if duration_days in self.rollup_windows:
+            # (window_days, total_count) 인덱스를 역순으로 limit 행만 읽는다
             query = (
                 select(
-                    PopularSearches.search_term,
-                    PopularSearches.search_category,
-                    func.sum(PopularSearches.search_count).label("total_count"),
+                    PopularSearchRollup.search_term,
+                    PopularSearchRollup.search_category,
+                    PopularSearchRollup.total_count,
                 )
-                .where(PopularSearches.search_date >= duration_ago)
-                .group_by(PopularSearches.search_term, PopularSearches.search_category)
+                .where(PopularSearchRollup.window_days == duration_days)
+                .order_by(PopularSearchRollup.total_count.desc())
+                .limit(limit)
+            )
+        else:
+            query = (
+                self._popular_search_totals_query(duration_days)
                 .order_by(func.sum(PopularSearches.search_count).desc())
                 .limit(limit)
             )
+        async with self.read_session() as session:
             result = await session.execute(query)
             return result.fetchall()
 
-    async def update_popular_search(self, term, category, today):
-        async with self.session as session:
-            result = await session.execute(
-                select(PopularSearches).where(
-                    and_(
-                        PopularSearches.search_term == term,
-                        PopularSearches.search_category == category,
-                        PopularSearches.search_date == today,
-                    )
+    async def stream_popular_search_totals(self, duration_days=None, chunk_size=5000):
+        """
+        (term, category, total_count) 집계를 chunk 단위로 흘려보낸다. 전체를 메모리에 올리지 않는다.
+        duration_days가 없으면 전체 기간.
+        """
+        async with self.read_session() as session:
+            query = self._popular_search_totals_query(duration_days).execution_options(yield_per=chunk_size)
+            result = await session.stream(query)
+            async for partition in result.partitions(chunk_size):
+                yield [(row.search_term, row.search_category, int(row.total_count)) for row in partition]
+
+    @staticmethod
+    def _popular_search_totals_query(duration_days=None):
+        query = select(
+            PopularSearches.search_term,
+            PopularSearches.search_category,
+            func.sum(PopularSearches.search_count).label("total_count"),
+        )
+        if duration_days:
+            query = query.where(PopularSearches.search_date >= KeywordRepository._window_start(duration_days))
+        return query.group_by(PopularSearches.search_term, PopularSearches.search_category)
+
+    @staticmethod
+    def _window_start(duration_days):
+        return datetime.now(get_settings().TIMEZONE_KST).date() - timedelta(days=duration_days)
+
+    async def update_popular_search(self, term, category, today, count=1):
+        await self.bulk_update_popular_search([((term, category, today), count)])
+
+    async def bulk_update_popular_search(self, increments):
+        """
+        [((term, category, date), count), ...] 형태의 증가분을 다중 행 MERGE로 반영
+        """
+        # 같은 대상 행이 source에 두 번 나오면 MERGE가 실패하므로 먼저 합산
+        merged = {}
+        for key, count in increments:
+            merged[key] = merged.get(key, 0) + count
+        rows = [(term, category, search_date, count) for (term, category, search_date), count in merged.items()]
+        if not rows:
+            return
+        async with self.session() as session:
+            for i in range(0, len(rows), MERGE_BATCH_ROWS):
+                batch = rows[i:i + MERGE_BATCH_ROWS]
+                # rollup을 먼저 (잠금 순서를 window 이동 작업과 같게) 같은 트랜잭션에서 반영
+                if self.rollup_windows:
+                    statement, params = build_merge_popular_search_rollup(batch)
+                    await session.execute(statement, params)
+                statement, params = build_merge_popular_search(batch)
+                await session.execute(statement, params)
+            await session.commit()
+
+    async def advance_popular_search_rollups(self):
+        """
+        window마다 기간 밖으로 밀려난 날짜를 하루씩 (날짜마다 트랜잭션 하나) rollup에서 뺀다.
+        상태가 없거나 window 길이보다 많이 밀렸으면 PopularSearches에서 다시 합산한다.
+        """
+        advanced = {}
+        for window_days in self.rollup_windows:
+            target_start = self._window_start(window_days)
+            async with self.session() as session:
+                window_start = await session.scalar(
+                    select(PopularSearchRollupState.window_start)
+                    .where(PopularSearchRollupState.window_days == window_days)
                 )
+            if window_start is None or (target_start - window_start).days > window_days:
+                await self.rebuild_popular_search_rollup(window_days)
+                advanced[window_days] = "rebuilt"
+                continue
+
+            days = 0
+            while await self._advance_rollup_one_day(window_days, target_start):
+                days += 1
+            advanced[window_days] = days
+        return advanced
+
+    async def _advance_rollup_one_day(self, window_days, target_start):
+        async with self.session() as session:
+            expired_date = await session.scalar(
+                text(ADVANCE_ROLLUP_STATE_SQL),
+                {"window_days": window_days, "target_start": target_start},
+            )
+            if expired_date is None:  # 이미 최신 (다른 워커가 먼저 밀었을 수도 있다)
+                await session.commit()
+                return False
+            await session.execute(
+                text(SUBTRACT_ROLLUP_DAY_SQL),
+                {"window_days": window_days, "expired_date": expired_date},
             )
+            await session.commit()
+            return True
 
-            existing_searches = result.fetchall()  # 모든 결과 가져오기
-
-            if existing_searches:
-                # 첫 번째 레코드만 업데이트하고 나머지는 삭제
-                first_search = existing_searches[0][0]  # first()[0]로 실제 객체 가져오기
-                first_search.search_count += 1
-
-                # 중복된 레코드가 있다면 삭제
-                if len(existing_searches) > 1:
-                    for duplicate in existing_searches[1:]:
-                        await session.delete(duplicate[0])
-            else:
-                # 새 레코드 추가
-                new_search = PopularSearches(
-                    search_term=term,
-                    search_category=category,
-                    search_date=today,
-                    search_count=1,
-                )
-                session.add(new_search)
+    async def rebuild_popular_search_rollup(self, window_days):
+        """window_days 기간 rollup을 PopularSearches에서 다시 합산 (covering index 범위 탐색)"""
+        window_start = self._window_start(window_days)
+        params = {"window_days": window_days, "window_start": window_start}
+        async with self.session() as session:
+            await session.execute(text(RESET_ROLLUP_STATE_SQL), params)
+            await session.execute(text(REBUILD_ROLLUP_SQL), params)
+            await session.commit()
@@ -0,0 +1,38 @@
+from typing import Dict, Optional
+
+from core.infrastructure.sketch.space_saving import SpaceSaving
+
+
+class PopularSearchGate:
+    """
+    redis leaderboard 앞단의 heavy hitter 필터.
+    Space-Saving의 보장 하한(추정치 - 밀려난 최소값에서 물려받은 error)이 promote_threshold 이상이 된
+    member만 redis에 반영하고, 처음 승격될 때는 그 하한을 한 번에 넘긴다.
+    추정치를 그대로 쓰면 sketch가 가득 찬 뒤 새 member가 min_count + 1로 시작해 바로 승격되고
+    물려받은 오차까지 redis에 더해진다. 하한만 넘기므로 redis 값은 실제 횟수를 넘지 않는다.
+    """
+
+    def __init__(self, capacity: int, promote_threshold: int) -> None:
+        self.sketch = SpaceSaving(capacity)
+        self.promote_threshold = promote_threshold
+        # member별로 redis에 이미 넘긴 양 (sketch에 남아 있는 member만 유지)
+        self._forwarded: Dict[str, int] = {}
+
+    def admit(self, member: str, amount: int = 1) -> int:
+        """redis에 반영할 증가량을 반환 (0이면 아직 승격 전)"""
+        count, evicted = self.sketch.offer(member, amount)
+        if evicted is not None:
+            self._forwarded.pop(evicted, None)
+        guaranteed = count - self.sketch.error(member)
+        if guaranteed < self.promote_threshold:
+            return 0
+        forwarded = self._forwarded.get(member, 0)
+        self._forwarded[member] = guaranteed
+        return guaranteed - forwarded
+
+
+def create_popular_search_gate(capacity: int, promote_threshold: int) -> Optional[PopularSearchGate]:
+    # capacity 0이면 모든 증가를 그대로 redis에 반영 (제한 없음 모드)
+    if capacity <= 0:
+        return None
+    return PopularSearchGate(capacity=capacity, promote_threshold=promote_threshold)
@@ -0,0 +1,65 @@
+import time
+
+POPULAR_SEARCHES_KEY = "popular_searches"
+
+
+def popular_category_key(category) -> str:
+    """카테고리별 인기 검색어 zset 키 (member: term)"""
+    return f"{POPULAR_SEARCHES_KEY}:c:{category}"
+
+
+def popular_member(term, category) -> str:
+    """
+    전체 인기 검색어 zset member (term:category).
+    category 안의 '%', ':'는 %25, %3A로 바꿔 마지막 ':'가 항상 구분자가 되게 한다 (없으면 기존 member와 같다)
+    """
+    category = str(category).replace("%", "%25").replace(":", "%3A")
+    return f"{term}:{category}"
+
+
+def split_popular_member(member: str):
+    """term:category member를 (term, category)로 분리. term 안의 ':'는 보존"""
+    term, _, category = member.rpartition(":")
+    return term, category.replace("%3A", ":").replace("%25", "%")
+
+
+POPULAR_CATEGORIES_KEY = f"{POPULAR_SEARCHES_KEY}:categories"
+
+
+# 시간 버킷을 합쳐 만드는 기간별 인기 검색어 (window -> 시간 수)
+POPULAR_WINDOWS = {"1h": 1, "24h": 24, "7d": 24 * 7}
+# 가장 긴 기간 + 기간 시작 쪽 부분 버킷(현재 시간 경과 비율만큼 가중) + 여유 1시간
+POPULAR_BUCKET_TTL_SECONDS = (max(POPULAR_WINDOWS.values()) + 2) * 3600
+
+
+def current_hour() -> int:
+    """epoch 기준 시간 번호 (시간 버킷 키에 사용)"""
+    return int(time.time() // 3600)
+
+
+def popular_bucket_key(hour: int, category=None) -> str:
+    key = f"{POPULAR_SEARCHES_KEY}:h:{hour}"
+    return f"{key}:c:{category}" if category else key
+
+
+def popular_window_key(window: str, category=None) -> str:
+    key = f"{POPULAR_SEARCHES_KEY}:w:{window}"
+    return f"{key}:c:{category}" if category else key
+
+
+RECENT_SEARCH_LIMIT = 20
+
+
+def recent_search_key(owner, anonymous=True) -> str:
+    """
+    최근 검색어 zset 키 (member: term:category, score: 검색 시각).
+    이전에는 owner 이름 그대로의 list였다 (KeywordRedisRepository.migrate_legacy_recent_searches로 옮긴다)
+    """
+    return f"recent_searches:{'anon' if anonymous else 'user'}:{owner}"
+
+
+AUTOCOMPLETE_TERMS_KEY = "autocomplete:terms"
+
+
+def autocomplete_prefix_key(prefix: str) -> str:
+    return f"autocomplete:p:{prefix}"
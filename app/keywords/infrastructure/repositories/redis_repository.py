@@ -1,42 +1,561 @@
-from core.infrastructure.redis.client import RedisClient
+import time
+import uuid
+from typing import Optional
+
+from redis.exceptions import NoScriptError
 
-from itertools import islice
+from core.infrastructure.cache.invalidation import CacheInvalidationPublisher
+from core.infrastructure.redis.client import RedisClient
+from core.infrastructure.replica.router import ReplicaRouter
 
 from app.keywords.infrastructure.entities.entity import (
+    AutocompleteEntity,
     PopularSearchEntity
 )
+from app.keywords.infrastructure.hangul import autocomplete_prefixes, normalize_autocomplete_text
+from app.keywords.infrastructure.repositories.popular_search_gate import PopularSearchGate
+from app.keywords.infrastructure.repositories.redis_keys import (
+    AUTOCOMPLETE_TERMS_KEY,
+    POPULAR_BUCKET_TTL_SECONDS,
+    POPULAR_CATEGORIES_KEY,
+    POPULAR_SEARCHES_KEY,
+    POPULAR_WINDOWS,
+    RECENT_SEARCH_LIMIT,
+    autocomplete_prefix_key,
+    current_hour,
+    popular_bucket_key,
+    popular_category_key,
+    popular_member,
+    popular_window_key,
+    recent_search_key,
+    split_popular_member,
+)
+
+# KEYS[1]: term별 누적 점수 zset, KEYS[2..]: prefix zset / ARGV: term, 증가량, prefix당 최대 개수
+AUTOCOMPLETE_INDEX_SCRIPT = """
+local score = redis.call('ZINCRBY', KEYS[1], ARGV[2], ARGV[1])
+local cap = tonumber(ARGV[3])
+for i = 2, #KEYS do
+    redis.call('ZADD', KEYS[i], score, ARGV[1])
+    if redis.call('ZCARD', KEYS[i]) > cap then
+        redis.call('ZREMRANGEBYRANK', KEYS[i], 0, -(cap + 1))
+    end
+end
+return score
+"""
+
+# KEYS[1]: 락 키 / ARGV[1]: 토큰. 내 토큰일 때만 지운다 (GET 후 DEL 사이에 만료/재획득되는 경쟁 방지)
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# KEYS[1]: 락 키 / ARGV[1]: 토큰, ARGV[2]: 새 TTL(ms). 내 토큰일 때만 연장하고 보유 여부를 돌려준다
+EXTEND_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS[1]: 이전 최근 검색어 list (원래 redis_key 그대로), KEYS[2]: 새 zset / ARGV: 최대 개수, TTL(초, 0이면 안 건다)
+# list 앞쪽이 최근이다. 검색 시각이 없으므로 순서만 남도록 0, -1, -2 ... 를 score로 쓰고 (새로 쓴 검색보다 항상 오래됨)
+# 새 zset에 이미 있는 member는 그대로 둔다. 옮긴 뒤 list는 지운다
+MIGRATE_RECENT_SEARCH_SCRIPT = """
+if redis.call('TYPE', KEYS[1]).ok ~= 'list' then
+    return 0
+end
+local searches = redis.call('LRANGE', KEYS[1], 0, -1)
+local migrated = 0
+for i, search in ipairs(searches) do
+    migrated = migrated + redis.call('ZADD', KEYS[2], 'NX', 1 - i, search)
+end
+redis.call('DEL', KEYS[1])
+redis.call('ZREMRANGEBYRANK', KEYS[2], 0, -(tonumber(ARGV[1]) + 1))
+if tonumber(ARGV[2]) > 0 and redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+end
+return migrated
+"""
+
 
 class KeywordRedisRepository:
-    def __init__(self, client: RedisClient):
+    def __init__(self,
+                 client: RedisClient,
+                 read_router: Optional[ReplicaRouter] = None,
+                 autocomplete_max_prefix_length=15,
+                 autocomplete_per_prefix=10,
+                 popular_search_gate: Optional[PopularSearchGate] = None,
+                 popular_search_max_members=0,
+                 recent_search_anonymous_ttl_seconds=14 * 24 * 3600,
+                 invalidation_publisher: Optional[CacheInvalidationPublisher] = None):
         self.client = client
+        self.read_router = read_router
+        self.autocomplete_max_prefix_length = autocomplete_max_prefix_length
+        self.autocomplete_per_prefix = autocomplete_per_prefix
+        self.popular_search_gate = popular_search_gate
+        self.popular_search_max_members = popular_search_max_members
+        self.recent_search_anonymous_ttl_seconds = recent_search_anonymous_ttl_seconds
+        # 값이 바뀐 키를 다른 워커의 near-cache에 알린다 (없으면 TTL로만 갱신)
+        self.invalidation_publisher = invalidation_publisher
+        self._autocomplete_sha = None
+        # 이 워커가 현재 시간에 이미 TTL을 건 버킷 키와 등록한 카테고리
+        self._seen_hour = None
+        self._seen_in_hour = set()
+
+    async def _read(self, operation):
+        # 읽기 전용 명령은 replica로 (replica가 없거나 비정상/연결 오류면 primary)
+        if self.read_router is None:
+            return await operation(self.client)
+        return await self.read_router.run(operation)
+
+    @staticmethod
+    def popular_source_key(category=None, window=None):
+        """인기 검색어 조회가 읽는 zset 키 (near-cache 무효화 태그로도 쓴다)"""
+        if window:
+            return popular_window_key(window, category)
+        if category:
+            return popular_category_key(category)
+        return POPULAR_SEARCHES_KEY
+
+    @staticmethod
+    def recent_source_key(redis_key, anonymous=True):
+        return recent_search_key(redis_key, anonymous)
+
+    async def get_popular_searches(self, category=None, limit=10, window=None):
+        # 카테고리/기간별 zset을 따로 유지하므로 limit 만큼만 읽는다
+        key = self.popular_source_key(category, window)
+        searches = await self._read(lambda client: client.zrevrange(key, 0, limit - 1, withscores=True))
 
-    async def get_popular_searches(self, category=None, limit=10):
-        searches = await self.client.zrevrange("popular_searches", 0, -1, withscores=True)
-        
-        return [
-            PopularSearchEntity(term=term, category=cat, count=int(count))
-            for search, count in searches
-            if (term := search.split(":")[0]) and (cat := search.split(":")[1])
-            and (not category or cat == category)
-        ][:limit]
+        # 카테고리 키의 member는 term, 전체 키의 member는 term:category
+        # 기간별 점수는 가장 오래된 버킷을 가중치로 더하므로 소수일 수 있어 반올림한다
+        # redis에서 읽은 값은 타입이 정해져 있으므로 검증 없이 model_construct로 만든다
+        construct = PopularSearchEntity.model_construct
+        if category:
+            return [
+                construct(term=term, category=category, count=round(count))
+                for term, count in searches
+            ]
+        result = []
+        for search, count in searches:
+            term, cat = split_popular_member(search)
+            result.append(construct(term=term, category=cat, count=round(count)))
+        return result
 
     async def inc_popular_search(self, term, category):
-        await self.client.zincrby("popular_searches", 1, f"{term}:{category}")
+        await self.record_keyword_event(term, category)
+
+    async def record_keyword_event(self, term, category, recent_key=None):
+        """
+        검색 1건에 대한 redis 쓰기를 pipeline 한 번(round trip 1회)으로 처리.
+        전체/카테고리 카운터 증가 + (recent_key가 있으면) 최근 검색어 중복 제거 후 push/trim.
+        카운트가 하나도 반영되지 않았으면 예외를 올리고, 카운트는 반영됐지만 부수 쓰기
+        (최근 검색어/자동완성/TTL)가 실패했으면 그 예외를 돌려준다 (재시도하면 중복 집계된다).
+        """
+        [(counted, error)] = await self.record_keyword_events([(term, category, recent_key)])
+        if error and not counted:
+            raise error
+        return error
+
+    async def record_keyword_events(self, events):
+        """
+        [(term, category, recent_key), ...] 를 pipeline 한 번으로 반영하고
+        이벤트별 (counted, 예외 또는 None) 목록을 돌려준다.
+        counted는 이벤트의 카운터 명령(ZINCRBY/자동완성 색인) 중 하나라도 반영됐는지다.
+        counted가 False면 카운트가 전혀 늘지 않았으므로 재시도해도 중복 집계되지 않는다.
+        """
+        hour = current_hour()
+        autocomplete_sha = await self._load_autocomplete_script()
+        spans = []
+        recent_keys, popular_keys = set(), set()
+        first_seen = []
+        async with self.client.pipeline(transaction=False) as pipe:
+            for term, category, recent_key in events:
+                start = len(pipe)
+                # 시간 버킷은 TTL로 사라지므로 항상 정확히 세고, 전체 기간 leaderboard만 gate를 거친다
+                increment = self._admit_popular_search(term, category)
+                # 카운터 명령의 위치 (부분 실패 시 카운트 반영 여부 판단용)
+                counters = self._queue_hourly_bucket(pipe, hour, term, category, first_seen)
+                if recent_key:
+                    recent_keys.add(self._queue_recent_search(pipe, recent_key, term, category))
+                if increment:
+                    member = popular_member(term, category)
+                    category_key = popular_category_key(category)
+                    counters.extend((len(pipe), len(pipe) + 1, len(pipe) + 2))
+                    pipe.zincrby(POPULAR_SEARCHES_KEY, increment, member)
+                    pipe.zincrby(category_key, increment, term)
+                    popular_keys.update((POPULAR_SEARCHES_KEY, category_key))
+                    # 자동완성 색인은 이벤트의 마지막 명령
+                    pipe.evalsha(autocomplete_sha, *self._autocomplete_script_args(term, increment))
+                spans.append((start, len(pipe), counters, increment))
+            # 최근 검색어는 바로 다음 조회에 보여야 하므로 같은 round trip에 무효화를 싣는다
+            if self.invalidation_publisher and recent_keys:
+                self.invalidation_publisher.queue(pipe, recent_keys)
+            results = await pipe.execute(raise_on_error=False)
+
+        if any(isinstance(result, Exception) for result in results):
+            # TTL/카테고리 등록이 실패했을 수 있으므로 다음 이벤트에서 다시 보낸다
+            self._seen_in_hour.difference_update(first_seen)
+
+        # leaderboard는 매 검색마다 바뀌므로 모아서 주기적으로 발행
+        if self.invalidation_publisher and popular_keys:
+            self.invalidation_publisher.mark(popular_keys)
+
+        outcomes = []
+        for (term, _, _), (start, end, counters, increment) in zip(events, spans):
+            error = await self._event_error(results[start:end], term, increment)
+            counted = error is None or any(not isinstance(results[i], Exception) for i in counters)
+            outcomes.append((counted, error))
+        return outcomes
+
+    def _admit_popular_search(self, term, category):
+        if self.popular_search_gate is None:
+            return 1
+        return self.popular_search_gate.admit(popular_member(term, category))
+
+    async def _load_autocomplete_script(self, force=False):
+        if self._autocomplete_sha is None or force:
+            self._autocomplete_sha = await self.client.script_load(AUTOCOMPLETE_INDEX_SCRIPT)
+        return self._autocomplete_sha
+
+    def _autocomplete_script_args(self, term, increment=1):
+        keys = [AUTOCOMPLETE_TERMS_KEY] + [
+            autocomplete_prefix_key(prefix)
+            for prefix in autocomplete_prefixes(term, self.autocomplete_max_prefix_length)
+        ]
+        return (len(keys), *keys, term, increment, self.autocomplete_per_prefix)
+
+    async def _event_error(self, results, term, increment):
+        if not increment:
+            return next((result for result in results if isinstance(result, Exception)), None)
+
+        *others, autocomplete_result = results
+        for result in others:
+            if isinstance(result, Exception):
+                return result
+        if isinstance(autocomplete_result, NoScriptError):
+            # redis 재시작/SCRIPT FLUSH 이후엔 스크립트를 다시 올리고 색인만 재실행
+            try:
+                sha = await self._load_autocomplete_script(force=True)
+                await self.client.evalsha(sha, *self._autocomplete_script_args(term, increment))
+            except Exception as e:
+                return e
+        elif isinstance(autocomplete_result, Exception):
+            return autocomplete_result
+        return None
+
+    async def autocomplete(self, query, limit=10):
+        prefix = normalize_autocomplete_text(query)[: self.autocomplete_max_prefix_length]
+        if not prefix:
+            return []
+        limit = min(limit, self.autocomplete_per_prefix)
+        key = autocomplete_prefix_key(prefix)
+        completions = await self._read(lambda client: client.zrevrange(key, 0, limit - 1, withscores=True))
+        construct = AutocompleteEntity.model_construct
+        return [construct(term=term, count=int(count)) for term, count in completions]
+
+    async def rebuild_autocomplete_index(self, batch_size=1000):
+        """
+        popular_searches로부터 자동완성 색인을 다시 만든다.
+        term 점수는 카테고리를 합산한 값이며 prefix zset은 상위 N개만 남긴다.
+        """
+        totals = {}
+        async for member, score in self.client.zscan_iter(POPULAR_SEARCHES_KEY, count=batch_size):
+            term, _ = split_popular_member(member)
+            if term:
+                totals[term] = totals.get(term, 0) + score
+
+        items = list(totals.items())
+        for i in range(0, len(items), batch_size):
+            async with self.client.pipeline(transaction=False) as pipe:
+                for term, score in items[i:i + batch_size]:
+                    pipe.zadd(AUTOCOMPLETE_TERMS_KEY, {term: score})
+                    for prefix in autocomplete_prefixes(term, self.autocomplete_max_prefix_length):
+                        key = autocomplete_prefix_key(prefix)
+                        pipe.zadd(key, {term: score})
+                        pipe.zremrangebyrank(key, 0, -(self.autocomplete_per_prefix + 1))
+                await pipe.execute()
+        return len(items)
+
+    def _queue_hourly_bucket(self, pipe, hour, term, category, first_seen):
+        member = popular_member(term, category)
+        global_bucket = popular_bucket_key(hour)
+        category_bucket = popular_bucket_key(hour, category)
+        counters = [len(pipe), len(pipe) + 1]
+        pipe.zincrby(global_bucket, 1, member)
+        pipe.zincrby(category_bucket, 1, term)
+        # TTL과 카테고리 등록은 이 워커에서 시간마다 키별로 한 번만 보낸다 (매 이벤트 EXPIRE/SADD 하지 않는다)
+        if self._first_in_hour(hour, global_bucket, first_seen):
+            pipe.expire(global_bucket, POPULAR_BUCKET_TTL_SECONDS)
+        if self._first_in_hour(hour, category_bucket, first_seen):
+            pipe.expire(category_bucket, POPULAR_BUCKET_TTL_SECONDS)
+        if self._first_in_hour(hour, POPULAR_CATEGORIES_KEY + category, first_seen):
+            pipe.sadd(POPULAR_CATEGORIES_KEY, category)
+        return counters
+
+    def _first_in_hour(self, hour, marker, first_seen):
+        if hour != self._seen_hour:
+            self._seen_hour, self._seen_in_hour = hour, set()
+        if marker in self._seen_in_hour:
+            return False
+        self._seen_in_hour.add(marker)
+        first_seen.append(marker)
+        return True
+
+    async def materialize_popular_windows(self, ttl_seconds=600, lock_seconds=30):
+        """
+        시간 버킷을 ZUNIONSTORE로 합쳐 기간별(1h/24h/7d) 인기 검색어 zset을 미리 만들어 둔다.
+        현재 시간 버킷은 진행 중이므로 기간 시작 쪽 버킷을 (1 - 현재 시간 경과 비율) 가중치로 더해
+        "지금부터 정확히 N시간 전까지"에 가깝게 맞춘다 (버킷 안에서는 고르게 들어왔다고 가정).
+        스케줄러가 다시 돌지 않으면 오래된 결과가 남지 않도록 ttl을 건다.
+        모든 워커가 같은 작업을 돌리므로 SET NX 락(lock_seconds 후 만료, 해제하지 않음)으로 그 사이 한 번만 실행한다.
+        """
+        if not await self.acquire_lock("popular_windows", ttl_seconds=lock_seconds):
+            return False
+        now = time.time() / 3600
+        hour = int(now)
+        # 기간 시작 버킷 중 아직 기간 안에 남아 있는 비율
+        head_weight = 1 - (now - hour)
+        categories = await self.client.smembers(POPULAR_CATEGORIES_KEY)
+        window_keys = []
+        async with self.client.pipeline(transaction=False) as pipe:
+            for window, hours in POPULAR_WINDOWS.items():
+                for category in [None, *categories]:
+                    window_key = popular_window_key(window, category)
+                    buckets = {popular_bucket_key(h, category): 1 for h in range(hour - hours + 1, hour + 1)}
+                    buckets[popular_bucket_key(hour - hours, category)] = head_weight
+                    pipe.zunionstore(window_key, buckets)
+                    pipe.expire(window_key, ttl_seconds)
+                    window_keys.append(window_key)
+            if self.invalidation_publisher:
+                self.invalidation_publisher.queue(pipe, window_keys)
+            await pipe.execute()
+        return True
+
+    async def acquire_lock(self, name, ttl_seconds):
+        """워커 여러 개가 같은 작업을 동시에 하지 않도록 SET NX 락. 획득한 경우 토큰 반환"""
+        token = uuid.uuid4().hex
+        acquired = await self.client.set(f"lock:{name}", token, nx=True, ex=ttl_seconds)
+        return token if acquired else None
+
+    async def release_lock(self, name, token):
+        return bool(await self.client.eval(RELEASE_LOCK_SCRIPT, 1, f"lock:{name}", token))
+
+    async def extend_lock(self, name, token, ttl_seconds):
+        """아직 token이 락을 갖고 있으면 TTL을 연장하고 True"""
+        return bool(await self.client.eval(EXTEND_LOCK_SCRIPT, 1, f"lock:{name}", token, int(ttl_seconds * 1000)))
+
+    async def count_popular_searches(self):
+        return await self.client.zcard(POPULAR_SEARCHES_KEY)
+
+    async def replace_popular_searches(self, chunks, on_chunk=None, temp_ttl_seconds=3600, lock=None):
+        """
+        [(term, category, count), ...] chunk들을 임시 키에 pipelined ZADD로 적재한 뒤
+        MULTI/EXEC 안에서 RENAME으로 live 키와 한 번에 교체한다. 조회 쪽은 반쯤 만들어진 leaderboard를 보지 않는다.
+
+        적재 중에도 live 키는 계속 ZINCRBY 된다. 시작 시점 live 키를 복사해 두고, 교체 트랜잭션에서
+        (live - 시작 시점 복사본) 만큼을 임시 키에 더해 재생성 동안의 증가분을 잃지 않는다.
+        lock=(name, token)을 주면 교체 직전에 락을 아직 갖고 있는지 확인하고, 잃었으면 교체하지 않고 None.
+        """
+        suffix = f"rebuild:{uuid.uuid4().hex}"
+        # live 키 -> 임시 키
+        temp_keys = {}
+        categories = set()
+        baseline_keys = await self._copy_live_popular_searches(suffix, temp_ttl_seconds)
+
+        rows = 0
+        async for chunk in chunks:
+            batches = {}
+            for term, category, count in chunk:
+                batches.setdefault(POPULAR_SEARCHES_KEY, {})[popular_member(term, category)] = count
+                batches.setdefault(popular_category_key(category), {})[term] = count
+                categories.add(category)
+            async with self.client.pipeline(transaction=False) as pipe:
+                for live_key, mapping in batches.items():
+                    pipe.zadd(temp_keys.setdefault(live_key, f"{live_key}:{suffix}"), mapping)
+                # 교체 전에 프로세스가 죽어도 임시 키가 남지 않도록
+                for temp_key in temp_keys.values():
+                    pipe.expire(temp_key, temp_ttl_seconds)
+                await pipe.execute()
+            rows += len(chunk)
+            if on_chunk:
+                on_chunk(rows)
+
+        if not rows or (lock and not await self.extend_lock(*lock, temp_ttl_seconds)):
+            await self._unlink_each([*temp_keys.values(), *baseline_keys.values()])
+            return 0 if not rows else None
+
+        live_keys = {
+            POPULAR_SEARCHES_KEY,
+            *(popular_category_key(c) for c in categories | await self.client.smembers(POPULAR_CATEGORIES_KEY)),
+        }
+        # 이번 재생성에 값이 없는 live 키(비어 버린 카테고리)는 같은 트랜잭션에서 지운다
+        stale_keys = live_keys - temp_keys.keys()
+        async with self.client.pipeline(transaction=True) as pipe:
+            for live_key, temp_key in temp_keys.items():
+                baseline_key = baseline_keys.get(live_key)
+                if baseline_key:
+                    # 재생성 중 증가분 = live - 시작 시점. 그 사이 잘려 나간 member는 음수가 되므로 지운다
+                    pipe.zunionstore(temp_key, {temp_key: 1, live_key: 1, baseline_key: -1})
+                    pipe.zremrangebyscore(temp_key, "-inf", 0)
+                pipe.rename(temp_key, live_key)
+                pipe.persist(live_key)
+            if stale_keys:
+                pipe.delete(*stale_keys)
+            pipe.delete(*baseline_keys.values())
+            await pipe.execute()
+
+        await self.client.sadd(POPULAR_CATEGORIES_KEY, *categories)
+        if self.invalidation_publisher:
+            await self.invalidation_publisher.publish(live_keys)
+        return rows
+
+    async def _copy_live_popular_searches(self, suffix, ttl_seconds):
+        """live leaderboard를 복사해 {live 키: 복사본 키}를 돌려준다"""
+        categories = await self.client.smembers(POPULAR_CATEGORIES_KEY)
+        live_keys = [POPULAR_SEARCHES_KEY, *(popular_category_key(c) for c in categories)]
+        baseline_keys = {key: f"{key}:{suffix}:base" for key in live_keys}
+        async with self.client.pipeline(transaction=False) as pipe:
+            for live_key, baseline_key in baseline_keys.items():
+                # 없는 키는 빈 zset으로 남지 않는다
+                pipe.zunionstore(baseline_key, [live_key])
+                pipe.expire(baseline_key, ttl_seconds)
+            await pipe.execute()
+        return baseline_keys
+
+    async def _unlink_each(self, keys):
+        if keys:
+            await self.client.unlink(*keys)
+
+    async def trim_popular_searches(self):
+        """
+        전체/카테고리 leaderboard와 자동완성 term을 상위 popular_search_max_members 개만 남기고 꼬리를 잘라낸다.
+        잘린 term은 prefix zset에서도 지우므로 (비면 키도 사라진다) prefix 키 수도 term 수에 묶인다.
+        """
+        if self.popular_search_max_members <= 0:
+            return 0
+        keep = self.popular_search_max_members
+        categories = await self.client.smembers(POPULAR_CATEGORIES_KEY)
+        keys = [POPULAR_SEARCHES_KEY, *(popular_category_key(c) for c in categories)]
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.zremrangebyrank(key, 0, -(keep + 1))
+            removed = await pipe.execute()
+        trimmed_keys = {key for key, count in zip(keys, removed) if count}
+        if self.invalidation_publisher and trimmed_keys:
+            self.invalidation_publisher.mark(trimmed_keys)
+        return sum(removed) + await self._trim_autocomplete(keep)
+
+    async def _trim_autocomplete(self, keep, batch_size=500):
+        removed_terms = await self.client.zrange(AUTOCOMPLETE_TERMS_KEY, 0, -(keep + 1))
+        for i in range(0, len(removed_terms), batch_size):
+            batch = removed_terms[i:i + batch_size]
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.zrem(AUTOCOMPLETE_TERMS_KEY, *batch)
+                for term in batch:
+                    for prefix in autocomplete_prefixes(term, self.autocomplete_max_prefix_length):
+                        pipe.zrem(autocomplete_prefix_key(prefix), term)
+                await pipe.execute()
+        return len(removed_terms)
+
+    async def backfill_category_popular_searches(self, batch_size=1000):
+        """
+        기존 popular_searches(term:category)로부터 카테고리별 zset을 채운다.
+        전체 zset을 기준값으로 ZADD 하므로 여러 번 실행해도 결과가 같다.
+        """
+        migrated = 0
+        batch = []
+        async for member, score in self.client.zscan_iter(POPULAR_SEARCHES_KEY, count=batch_size):
+            batch.append((member, score))
+            if len(batch) >= batch_size:
+                migrated += await self._write_category_batch(batch)
+                batch = []
+        if batch:
+            migrated += await self._write_category_batch(batch)
+        return migrated
+
+    async def _write_category_batch(self, batch):
+        by_category = {}
+        for member, score in batch:
+            term, category = split_popular_member(member)
+            if not term or not category:
+                continue
+            by_category.setdefault(category, {})[term] = score
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            for category, mapping in by_category.items():
+                pipe.zadd(popular_category_key(category), mapping)
+            await pipe.execute()
+        return sum(len(mapping) for mapping in by_category.values())
+
+    async def add_recent_search(self, redis_key, term, category, anonymous=True):
+        async with self.client.pipeline(transaction=False) as pipe:
+            key = self._queue_recent_search(pipe, redis_key, term, category, anonymous)
+            if self.invalidation_publisher:
+                self.invalidation_publisher.queue(pipe, [key])
+            await pipe.execute()
+
+    def _queue_recent_search(self, pipe, redis_key, term, category, anonymous=True):
+        # 검색 시각을 score로 쓰는 zset: 같은 검색어는 score만 갱신되어 맨 앞으로 이동
+        key = recent_search_key(redis_key, anonymous)
+        pipe.zadd(key, {popular_member(term, category): time.time()})
+        pipe.zremrangebyrank(key, 0, -(RECENT_SEARCH_LIMIT + 1))  # 최대 20개 유지
+        if anonymous:
+            pipe.expire(key, self.recent_search_anonymous_ttl_seconds)
+        return key
+
+    async def migrate_legacy_recent_searches(self, redis_key, anonymous=True):
+        """
+        redis_key 이름 그대로의 이전 최근 검색어 list가 남아 있으면 새 zset으로 옮기고 list를 지운다.
+        조회에서 새 키가 비어 있을 때 부르며, 옮긴 member 수를 돌려준다 (list가 없으면 0)
+        """
+        ttl = self.recent_search_anonymous_ttl_seconds if anonymous else 0
+        return await self.client.eval(
+            MIGRATE_RECENT_SEARCH_SCRIPT, 2, redis_key, recent_search_key(redis_key, anonymous), RECENT_SEARCH_LIMIT, ttl
+        )
+
+    async def migrate_all_legacy_recent_searches(self, batch_size=1000):
+        """
+        SCAN으로 남은 이전 최근 검색어 list를 모두 찾아 익명 zset(TTL 적용)으로 옮긴다 (일회성 마이그레이션).
+        앱은 다른 list 키를 쓰지 않으므로 list 타입 키는 모두 이전 최근 검색어다.
+        로그인 사용자의 최근 검색어는 DB에도 있으므로 익명 키로 옮겨도 조회에는 DB 값이 보인다.
+        (list 수, 옮긴 member 수)를 돌려준다
+        """
+        keys, migrated = 0, 0
+        batch = []
+        async for key in self.client.scan_iter(count=batch_size, _type="list"):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                keys, migrated = keys + len(batch), migrated + await self._migrate_recent_batch(batch)
+                batch = []
+        if batch:
+            keys, migrated = keys + len(batch), migrated + await self._migrate_recent_batch(batch)
+        return keys, migrated
+
+    async def _migrate_recent_batch(self, keys):
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.eval(
+                    MIGRATE_RECENT_SEARCH_SCRIPT, 2, key, recent_search_key(key), RECENT_SEARCH_LIMIT,
+                    self.recent_search_anonymous_ttl_seconds,
+                )
+            return sum(await pipe.execute())
 
-    async def add_recent_search(self, redis_key, term, category):
-        await self.client.lpush(redis_key, f"{term}:{category}")
-        await self.client.ltrim(redis_key, 0, 19)  # 최대 20개 유지
+    async def get_recent_searches(self, redis_key, category=None, anonymous=True):
+        key = recent_search_key(redis_key, anonymous)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.zrevrange(key, 0, RECENT_SEARCH_LIMIT - 1)
+            if anonymous:
+                pipe.expire(key, self.recent_search_anonymous_ttl_seconds)  # 읽을 때도 TTL 연장
+            searches, *_ = await pipe.execute()
+        if not searches and redis_key and await self.migrate_legacy_recent_searches(redis_key, anonymous):
+            searches = await self.client.zrevrange(key, 0, RECENT_SEARCH_LIMIT - 1)
 
-    async def get_recent_searches(self, redis_key, category=None):
-        searches = await self.client.lrange(redis_key, 0, -1)
-        result, seen = [], set()
+        result = []
         for search in searches:
-            t, c = search.split(":")
+            t, c = split_popular_member(search)
             if not category or c == category:
-                item = (t, c)
-                if item not in seen:
-                    seen.add(item)
-                    result.append({"term": t, "category": c})
-            if len(result) == 20:
-                break
+                result.append({"term": t, "category": c})
         return result
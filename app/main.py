@@ -3,10 +3,18 @@ from fastapi import FastAPI
 from app.di.container import Container
 
 from fastapi.middleware.cors import CORSMiddleware
-from core.infrastructure.middleware.logging import AccessLoggingMiddleware
-from core.setting.settings import Settings
+from core.infrastructure.metrics.http_metrics import MetricsMiddleware
+from core.infrastructure.responses.fast_json import check_fast_json
+from core.infrastructure.middleware.logging import (
+    AccessLoggingMiddleware,
+    start_access_log_listener,
+    stop_access_log_listener,
+)
+from core.infrastructure.tasks.startup import check_startup_budget, init_resources_timed
+from core.setting.settings import get_settings
 
 from router.keyword_router import router as keyword_router
+from router.metrics_router import router as metrics_router
 
 container = None
 
@@ -17,21 +25,33 @@ def register_middleware(app: FastAPI) -> None:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    app.add_middleware(AccessLoggingMiddleware)
+    app.add_middleware(
+        AccessLoggingMiddleware,
+        sample_rate=container.config.ACCESS_LOG_SAMPLE_RATE(),
+        route_sample_rates=container.config.ACCESS_LOG_ROUTE_SAMPLE_RATES(),
+    )
+    if container.config.METRICS_ENABLED():
+        app.add_middleware(MetricsMiddleware)
 
 def register_router(app: FastAPI) -> None:
     app.include_router(keyword_router)
+    if container.config.METRICS_ENABLED():
+        app.include_router(metrics_router)
 
 async def lifespan(app: FastAPI):
-    await container.init_resources()
+    start_access_log_listener()
+    # Resource별 초기화 시간을 기록해 두고 (app.state.startup_timings) 예산 초과 시 경고
+    app.state.startup_timings = await init_resources_timed(container)
+    check_startup_budget(app.state.startup_timings, container.config.STARTUP_LIFESPAN_BUDGET_MS())
+    check_fast_json()
     yield
     await container.shutdown_resources()
+    stop_access_log_listener()
 
 def create_container():
     container = Container()
     container.wire(packages=["router"])
-    setting = Settings()
-    container.config.from_pydantic(setting)
+    container.config.from_pydantic(get_settings())
 
     return container
 
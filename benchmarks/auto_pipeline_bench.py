@@ -0,0 +1,108 @@
+"""
+auto-pipelining 효과 측정: 같은 워크로드를 일반 클라이언트와 AutoPipelineRedis로 돌려
+초당 명령 수, 초당 redis round trip 수, p99를 비교한다.
+
+    python -m benchmarks.auto_pipeline_bench --redis-url redis://127.0.0.1:6379/15 --concurrency 10 100 500
+
+round trip은 커넥션이 요청을 보낸 횟수(send_packed_command)로 센다.
+--redis-url이 없으면 fakeredis를 쓴다 (네트워크가 없어 지연 차이는 작고 round trip 수만 의미 있음).
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import List
+
+from benchmarks.keyword_bench import percentile
+from benchmarks.standins import create_redis
+from benchmarks.workload import ZipfWorkload
+from core.infrastructure.redis.auto_pipeline import AutoPipelineRedis
+
+BENCH_KEY = "bench:auto_pipeline:leaderboard"
+
+
+def count_round_trips(client) -> dict:
+    """pool의 커넥션 클래스를 감싸 요청 전송 횟수를 센다 (벤치마크 전용)"""
+    counter = {"round_trips": 0}
+    pool = client.connection_pool
+    base = pool.connection_class
+
+    class CountingConnection(base):
+        async def send_packed_command(self, command, check_health=True):
+            counter["round_trips"] += 1
+            return await super().send_packed_command(command, check_health)
+
+    pool.connection_class = CountingConnection
+    return counter
+
+
+async def run_mode(client, counter: dict, workload: ZipfWorkload, concurrency: int, operations: int) -> dict:
+    latencies: List[float] = []
+    issued = 0
+
+    async def worker():
+        nonlocal issued
+        while issued < operations:
+            issued += 1
+            term = workload.term()
+            start = time.perf_counter()
+            if workload.random.random() < 0.5:
+                await client.zincrby(BENCH_KEY, 1, term)
+            else:
+                await client.zrevrange(BENCH_KEY, 0, 9, withscores=True)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    counter["round_trips"] = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "ops_per_sec": round(len(latencies) / elapsed, 1),
+        "round_trips_per_sec": round(counter["round_trips"] / elapsed, 1),
+        "ops_per_round_trip": round(len(latencies) / counter["round_trips"], 2) if counter["round_trips"] else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+async def run(args) -> dict:
+    client = await create_redis(args.redis_url)
+    # 커넥션이 만들어지기 전에 감싸야 모든 커넥션이 집계된다
+    await client.connection_pool.disconnect()
+    counter = count_round_trips(client)
+    auto = AutoPipelineRedis(client, window_us=args.window_us, max_batch=args.max_batch)
+    report = {"operations": args.operations, "window_us": args.window_us, "results": {}}
+    try:
+        await client.delete(BENCH_KEY)
+        for concurrency in args.concurrency:
+            plain = await run_mode(client, counter, ZipfWorkload(seed=args.seed), concurrency, args.operations)
+            pipelined = await run_mode(auto, counter, ZipfWorkload(seed=args.seed), concurrency, args.operations)
+            report["results"][concurrency] = {
+                "plain": plain,
+                "auto_pipeline": pipelined,
+                "round_trip_reduction": round(
+                    plain["round_trips_per_sec"] / pipelined["round_trips_per_sec"], 2
+                ) if pipelined["round_trips_per_sec"] else None,
+            }
+        report["auto_pipeline_stats"] = auto.stats()
+        await client.delete(BENCH_KEY)
+    finally:
+        await client.aclose()
+    return report
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="redis auto-pipelining benchmark")
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--operations", type=int, default=20000)
+    parser.add_argument("--window-us", type=int, default=0)
+    parser.add_argument("--max-batch", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args)), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
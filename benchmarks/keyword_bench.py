@@ -0,0 +1,283 @@
+"""
+키워드 API 부하/벤치마크 하네스.
+
+create_app()을 그대로 띄우고 Container의 redis/DB를 로컬 대체물로 바꾼 뒤
+Zipf 분포 워크로드로 엔드포인트를 호출해 처리량과 p50/p95/p99를 JSON으로 출력한다.
+
+    # fakeredis + aiosqlite (pip install fakeredis lupa aiosqlite)
+    python -m benchmarks.keyword_bench --concurrency 64 --requests 20000
+
+    # 로컬 redis-server 사용, 결과를 baseline으로 저장 / 비교
+    python -m benchmarks.keyword_bench --redis-url redis://127.0.0.1:6379/15 --flush-redis \\
+        --save-baseline benchmarks/baseline.json
+    python -m benchmarks.keyword_bench --baseline benchmarks/baseline.json --tolerance 0.1
+
+baseline보다 처리량이 tolerance 이상 낮거나 p99가 tolerance 이상 높으면 종료 코드 1.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.workload import ZipfWorkload
+from core.setting.settings import Settings
+
+DEFAULT_SCENARIOS = ["update_popular_search", "add_recent_search", "get_popular_searches"]
+
+
+def configure_env() -> None:
+    # create_app()이 get_settings()로 Settings를 만들 때 필요한 값만 채운다 (결제 설정은 앱이 읽지 않는다)
+    for name, field in Settings.model_fields.items():
+        if field.is_required():
+            os.environ.setdefault(name, "25" if field.annotation is int else "bench")
+    os.environ.setdefault("METRICS_ENABLED", "false")
+    os.environ.setdefault("ACCESS_LOG_SAMPLE_RATE", "0")
+
+
+def build_requests(workload: ZipfWorkload) -> Dict[str, Callable[[], dict]]:
+    """시나리오 이름 -> httpx request kwargs를 만드는 함수"""
+    def get_popular_searches():
+        category = workload.category() if workload.random.random() < 0.5 else None
+        params = {"limit": 10, **({"category": category} if category else {})}
+        return {"method": "GET", "url": "/keywords/get_popular_searches", "params": params}
+
+    def update_popular_search():
+        return {
+            "method": "POST",
+            "url": "/keywords/update_popular_search",
+            "json": {"term": workload.term(), "category": workload.category()},
+        }
+
+    def add_recent_search():
+        return {
+            "method": "POST",
+            "url": "/keywords/add_recent_search",
+            "json": {"term": workload.term(), "category": workload.category()},
+            # 동시 요청끼리 client cookie jar를 공유하지 않도록 헤더로 직접 보낸다
+            "headers": {"cookie": f"anonymous_id={workload.user()}"},
+        }
+
+    def autocomplete():
+        term = workload.term()
+        return {"method": "GET", "url": "/keywords/autocomplete", "params": {"q": term[: max(1, len(term) // 2)]}}
+
+    return {
+        "get_popular_searches": get_popular_searches,
+        "update_popular_search": update_popular_search,
+        "add_recent_search": add_recent_search,
+        "autocomplete": autocomplete,
+    }
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client, make_request: Callable[[], dict], concurrency: int, total: int) -> dict:
+    latencies: List[float] = []
+    errors = 0
+    issued = 0
+
+    async def worker():
+        nonlocal errors, issued
+        while issued < total:
+            issued += 1
+            request = make_request()
+            start = time.perf_counter()
+            try:
+                response = await client.request(**request)
+                if response.status_code >= 400:
+                    errors += 1
+            except Exception:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+def sketch_accuracy(workload: ZipfWorkload, events: int, capacity: int, top_n: int) -> dict:
+    """heavy hitter sketch 상위 N개가 정확한 상위 N개와 얼마나 겹치는지"""
+    from collections import Counter
+    from core.infrastructure.sketch.space_saving import SpaceSaving
+
+    sketch = SpaceSaving(capacity)
+    exact: Counter = Counter()
+    for term in workload.terms_batch(events):
+        sketch.offer(term)
+        exact[term] += 1
+
+    exact_top = {term for term, _ in exact.most_common(top_n)}
+    sketch_top = {term for term, _ in sketch.top(top_n)}
+    max_error = max(
+        (sketch.estimate(term) - exact[term] for term, _ in sketch.top(top_n)), default=0
+    )
+    return {
+        "events": events,
+        "capacity": capacity,
+        "top_n": top_n,
+        "recall": round(len(exact_top & sketch_top) / top_n, 4),
+        "max_overestimate": max_error,
+    }
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    regressions = []
+    for scenario, current in results.items():
+        previous = baseline.get(scenario)
+        if not previous or "throughput_rps" not in current:
+            continue
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{scenario}: throughput {current['throughput_rps']} < baseline {previous['throughput_rps']}"
+            )
+        if current["p99_ms"] > previous["p99_ms"] * (1 + tolerance):
+            regressions.append(f"{scenario}: p99 {current['p99_ms']}ms > baseline {previous['p99_ms']}ms")
+    return regressions
+
+
+async def override_with_standins(container, redis_url=None, flush_redis=False, auto_pipeline=False):
+    """container의 redis/DB/키워드 repository를 로컬 대체물로 바꾼다. (redis, database) 반환"""
+    from dependency_injector import providers
+
+    from benchmarks.standins import SqliteDatabase, SqliteKeywordRepository, create_redis
+    from core.infrastructure.redis.auto_pipeline import AutoPipelineRedis
+
+    redis = await create_redis(redis_url)
+    if flush_redis or not redis_url:
+        await redis.flushdb()
+    database = SqliteDatabase()
+    await database.create_tables()
+
+    client = AutoPipelineRedis(redis) if auto_pipeline else redis
+    container.redis_client.override(providers.Object(client))
+    container.database.override(providers.Object(database))
+    container.keyword_repository.override(
+        providers.Singleton(SqliteKeywordRepository, session=database.session)
+    )
+    return redis, database
+
+
+async def run_in_process(args, workload: ZipfWorkload) -> dict:
+    import httpx
+
+    import app.main as main_module
+
+    app = main_module.create_app()
+    redis, database = await override_with_standins(
+        main_module.container, args.redis_url, args.flush_redis, auto_pipeline=args.auto_pipeline
+    )
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                return await run_scenarios(client, args, workload)
+    finally:
+        await redis.aclose()
+        await database.engine.dispose()
+
+
+async def run_against_server(args, workload: ZipfWorkload) -> dict:
+    import httpx
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.target_url, limits=limits) as client:
+        return await run_scenarios(client, args, workload)
+
+
+async def run_scenarios(client, args, workload: ZipfWorkload) -> dict:
+    requests = build_requests(workload)
+    results = {}
+    for scenario in args.scenarios:
+        results[scenario] = await run_scenario(client, requests[scenario], args.concurrency, args.requests)
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="keyword endpoint benchmark")
+    parser.add_argument("--scenarios", nargs="+", default=DEFAULT_SCENARIOS,
+                        choices=["get_popular_searches", "update_popular_search", "add_recent_search", "autocomplete"])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=5000, help="시나리오당 요청 수")
+    parser.add_argument("--distinct-terms", type=int, default=10000)
+    parser.add_argument("--zipf-exponent", type=float, default=1.1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--redis-url", default=None, help="미지정 시 fakeredis 사용")
+    parser.add_argument("--flush-redis", action="store_true", help="시작 전 redis db를 비운다")
+    parser.add_argument("--auto-pipeline", action="store_true", help="redis 클라이언트를 AutoPipelineRedis로 감싼다")
+    parser.add_argument("--target-url", default=None, help="이미 떠 있는 서버로 부하를 보낼 때")
+    parser.add_argument("--sketch-capacity", type=int, default=0, help="0보다 크면 sketch 정확도도 보고")
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--save-baseline", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로 (기본: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    configure_env()
+    workload = ZipfWorkload(
+        distinct_terms=args.distinct_terms, exponent=args.zipf_exponent, seed=args.seed
+    )
+
+    runner = run_against_server if args.target_url else run_in_process
+    results = asyncio.run(runner(args, workload))
+
+    report = {
+        "config": {
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "distinct_terms": args.distinct_terms,
+            "zipf_exponent": args.zipf_exponent,
+            "target": args.target_url or "in-process",
+            "auto_pipeline": args.auto_pipeline,
+        },
+        "results": results,
+    }
+    if args.sketch_capacity > 0:
+        report["sketch_accuracy"] = sketch_accuracy(
+            ZipfWorkload(distinct_terms=args.distinct_terms, exponent=args.zipf_exponent, seed=args.seed),
+            events=args.requests * 10,
+            capacity=args.sketch_capacity,
+            top_n=100,
+        )
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["regressions"] = compare_with_baseline(results, baseline.get("results", {}), args.tolerance)
+        exit_code = 1 if report["regressions"] else 0
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
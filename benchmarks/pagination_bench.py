@@ -0,0 +1,116 @@
+"""
+OFFSET 페이지네이션과 keyset(cursor) 페이지네이션의 페이지 깊이별 비용 비교.
+
+aiosqlite in-memory DB의 PopularSearches에 rows 개 행을 넣고, 같은 깊이의 페이지를
+get_datas(page)와 get_datas_by_cursor(cursor)로 읽어 페이지당 시간을 JSON으로 출력한다.
+stream()으로 전체를 순회한 행 수도 함께 확인한다.
+
+    python -m benchmarks.pagination_bench --rows 200000 --page-size 100 --depths 1 100 1000
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, timedelta
+from typing import Type
+
+from sqlalchemy import insert
+
+from benchmarks.standins import SqliteDatabase
+from core.infrastructure.entities.entity import Entity
+from core.infrastructure.repositories.base_repository import BaseRepository
+from core.models.model import PopularSearches
+
+
+class PopularSearchRow(Entity):
+    id: int
+    search_term: str
+    search_category: str
+    search_date: date
+    search_count: int
+
+
+class PopularSearchRowRepository(BaseRepository[PopularSearchRow, PopularSearchRow, PopularSearchRow]):
+    @property
+    def model(self) -> Type[PopularSearches]:
+        return PopularSearches
+
+    @property
+    def entity_cls(self) -> Type[PopularSearchRow]:
+        return PopularSearchRow
+
+    def _to_entity(self, orm_obj) -> PopularSearchRow:
+        return PopularSearchRow.model_validate(orm_obj, from_attributes=True)
+
+
+async def seed(database: SqliteDatabase, rows: int) -> None:
+    start = date(2026, 1, 1)
+    async with database.session() as session:
+        for offset in range(0, rows, 5000):
+            await session.execute(insert(PopularSearches), [
+                {
+                    "search_term": f"term{i}",
+                    "search_category": f"c{i % 10}",
+                    "search_date": start + timedelta(days=i % 365),
+                    "search_count": i % 97,
+                }
+                for i in range(offset, min(offset + 5000, rows))
+            ])
+        await session.commit()
+
+
+async def cursor_at(repository, depth: int, page_size: int):
+    # depth 번째 페이지의 cursor를 얻는다 (측정 대상 아님)
+    cursor = None
+    for _ in range(depth - 1):
+        _, cursor = await repository.get_datas_by_cursor(page_size, cursor)
+    return cursor
+
+
+async def timed(call, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await call()
+    return round((time.perf_counter() - start) / iterations * 1000, 3)
+
+
+async def run(args) -> dict:
+    database = SqliteDatabase()
+    await database.create_tables()
+    await seed(database, args.rows)
+    repository = PopularSearchRowRepository(database.session)
+
+    report = {"rows": args.rows, "page_size": args.page_size, "depths": {}}
+    for depth in args.depths:
+        cursor = await cursor_at(repository, depth, args.page_size)
+        by_offset = await repository.get_datas(depth, args.page_size)
+        by_cursor, _ = await repository.get_datas_by_cursor(args.page_size, cursor)
+        assert [r.id for r in by_offset] == [r.id for r in by_cursor]
+        report["depths"][depth] = {
+            "offset_ms": await timed(lambda: repository.get_datas(depth, args.page_size), args.iterations),
+            "cursor_ms": await timed(
+                lambda: repository.get_datas_by_cursor(args.page_size, cursor), args.iterations
+            ),
+        }
+
+    start = time.perf_counter()
+    streamed = 0
+    async for _ in repository.stream(batch_size=args.page_size * 10):
+        streamed += 1
+    report["stream"] = {"rows": streamed, "seconds": round(time.perf_counter() - start, 3)}
+    await database.engine.dispose()
+    return report
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="offset vs keyset pagination benchmark")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args)), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+redis replica 라우팅 확인 (로컬 redis-server 두 대).
+
+    redis-server --port 6379 &
+    redis-server --port 6380 --replicaof 127.0.0.1 6379 &
+    python -m benchmarks.replica_check --primary-url redis://127.0.0.1:6379/15 \\
+        --replica-url redis://127.0.0.1:6380/15
+
+1) primary에 쓴 인기 검색어를 replica 라우터로 읽어 primary 결과와 같은지 확인하고
+2) 죽은 replica(--dead-replica-url)를 섞어 health check에서 빠지는지,
+3) replica 연결이 끊긴 상태에서 읽기가 primary로 넘어가는지 확인한다.
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+import redis.asyncio as aioredis
+
+from app.keywords.infrastructure.repositories.redis_repository import KeywordRedisRepository
+from core.infrastructure.redis.client import REDIS_FAILOVER_ERRORS, probe_redis_replica
+from core.infrastructure.replica.router import ReplicaRouter
+
+
+def connect(url: str) -> aioredis.Redis:
+    return aioredis.from_url(url, encoding="utf-8", decode_responses=True, socket_connect_timeout=1)
+
+
+async def wait_for_replication(router: ReplicaRouter, timeout: float = 10.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while asyncio.get_running_loop().time() < deadline:
+        status = router.stats()["status"][0]
+        if status and status["healthy"] and not status["lag"]:
+            return
+        await asyncio.sleep(0.1)
+        await router.refresh()
+    raise TimeoutError(f"replica가 따라오지 않았습니다: {router.stats()}")
+
+
+async def run(args) -> dict:
+    primary = connect(args.primary_url)
+    replica = connect(args.replica_url)
+    dead = connect(args.dead_replica_url)
+    report = {}
+    try:
+        await primary.flushdb()
+        router = ReplicaRouter(
+            primary, [replica, dead], probe_redis_replica,
+            max_lag=args.max_lag_bytes, failover_errors=REDIS_FAILOVER_ERRORS, name="redis",
+        )
+        repository = KeywordRedisRepository(primary, read_router=router)
+
+        await repository.record_keyword_events([(f"term{i}", "all", None) for i in range(args.terms) for _ in range(i % 7 + 1)])
+        await router.refresh()
+        await wait_for_replication(router)
+        report["after_refresh"] = router.stats()
+
+        from_replica = await repository.get_popular_searches(limit=10)
+        from_primary = await KeywordRedisRepository(primary).get_popular_searches(limit=10)
+        report["replica_matches_primary"] = [e.__dict__ for e in from_replica] == [e.__dict__ for e in from_primary]
+
+        # 정상으로 판정된 replica의 연결을 끊어도 읽기는 primary로 넘어가야 한다
+        router._set_healthy([dead])
+        fallback = await repository.get_popular_searches(limit=10)
+        report["fallback_matches_primary"] = [e.__dict__ for e in fallback] == [e.__dict__ for e in from_primary]
+        report["after_fallback"] = router.stats()
+    finally:
+        for client in (primary, replica, dead):
+            await client.aclose()
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="redis read replica routing check")
+    parser.add_argument("--primary-url", default="redis://127.0.0.1:6379/15")
+    parser.add_argument("--replica-url", default="redis://127.0.0.1:6380/15")
+    parser.add_argument("--dead-replica-url", default="redis://127.0.0.1:6399/15")
+    parser.add_argument("--max-lag-bytes", type=int, default=1024 * 1024)
+    parser.add_argument("--terms", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+    ok = report.get("replica_matches_primary") and report.get("fallback_matches_primary")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+워커 수에 따른 처리량 확장성 측정.
+
+워커 수별로 benchmarks.standin_server를 uvicorn 멀티 워커(uvloop/httptools)로 띄우고,
+keyword_bench의 --target-url 모드로 부하를 보내 처리량과 확장 효율을 JSON으로 출력한다.
+
+    # 워커 간 데이터를 공유하려면 로컬 redis-server 사용 권장
+    python -m benchmarks.scaling_bench --workers 1 2 4 --redis-url redis://127.0.0.1:6379/15 \\
+        --client-processes 4 --concurrency 64 --requests 20000
+
+부하 발생기도 CPU를 쓰므로 --client-processes 만큼 프로세스를 나눠 보내고 결과를 합친다.
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, port: int, redis_url=None) -> subprocess.Popen:
+    env = os.environ.copy()
+    if redis_url:
+        env["BENCH_REDIS_URL"] = redis_url
+    command = [
+        sys.executable, "-m", "uvicorn", "benchmarks.standin_server:create_app", "--factory",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers),
+        "--no-access-log", "--log-level", "warning",
+    ]
+    if importlib.util.find_spec("uvloop"):
+        command += ["--loop", "uvloop"]
+    if importlib.util.find_spec("httptools"):
+        command += ["--http", "httptools"]
+    return subprocess.Popen(command, cwd=ROOT, env=env)
+
+
+def wait_until_ready(url: str, timeout: float = 60.0) -> None:
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{url}/openapi.json", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"{url} 서버가 {timeout}초 안에 뜨지 않았습니다")
+
+
+def drive(bench_argv: List[str], seed: int) -> dict:
+    """부하 발생 프로세스 하나 (keyword_bench --target-url 모드)"""
+    from benchmarks.keyword_bench import parse_args, run_against_server
+    from benchmarks.workload import ZipfWorkload
+
+    args = parse_args(bench_argv + ["--seed", str(seed)])
+    workload = ZipfWorkload(distinct_terms=args.distinct_terms, exponent=args.zipf_exponent, seed=args.seed)
+    return asyncio.run(run_against_server(args, workload))
+
+
+def merge(results: List[dict]) -> dict:
+    """프로세스별 결과 합산: 처리량은 합, 지연 시간은 가장 나쁜 값"""
+    merged = {}
+    for scenario in results[0]:
+        parts = [result[scenario] for result in results]
+        merged[scenario] = {
+            "requests": sum(part["requests"] for part in parts),
+            "errors": sum(part["errors"] for part in parts),
+            "throughput_rps": round(sum(part["throughput_rps"] for part in parts), 1),
+            "p50_ms": max(part["p50_ms"] for part in parts),
+            "p95_ms": max(part["p95_ms"] for part in parts),
+            "p99_ms": max(part["p99_ms"] for part in parts),
+        }
+    return merged
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="worker scaling benchmark")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--client-processes", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32, help="부하 발생 프로세스당 동시 요청 수")
+    parser.add_argument("--requests", type=int, default=5000, help="부하 발생 프로세스당 시나리오별 요청 수")
+    parser.add_argument("--scenarios", nargs="+", default=["get_popular_searches", "update_popular_search"])
+    args = parser.parse_args(argv)
+
+    from benchmarks.keyword_bench import configure_env
+    configure_env()
+
+    report = {"cpu_count": os.cpu_count(), "runs": {}}
+    for workers in args.workers:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        server = start_server(workers, port, args.redis_url)
+        try:
+            wait_until_ready(url)
+            bench_argv = [
+                "--target-url", url,
+                "--concurrency", str(args.concurrency),
+                "--requests", str(args.requests),
+                "--scenarios", *args.scenarios,
+            ]
+            with ProcessPoolExecutor(max_workers=args.client_processes) as pool:
+                futures = [pool.submit(drive, bench_argv, seed) for seed in range(args.client_processes)]
+                report["runs"][workers] = merge([future.result() for future in futures])
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+    # 확장 효율: N 워커 처리량 / (1 워커 처리량 * N)
+    base_workers = min(report["runs"])
+    for workers, results in report["runs"].items():
+        for scenario, result in results.items():
+            base = report["runs"][base_workers][scenario]["throughput_rps"]
+            ideal = base * workers / base_workers
+            result["scaling_efficiency"] = round(result["throughput_rps"] / ideal, 3) if ideal else 0.0
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+응답 직렬화 경로 비교 (100개 항목 기준).
+
+  - validated: 반환 타입 List[PopularSearchResponseDto]로 FastAPI가 재검증 + jsonable_encoder + json
+  - fast_models: model_construct로 만든 entity를 FastJSONResponse로 직렬화 (항목마다 model_dump)
+  - fast: 서비스가 near-cache에 담아 둔 dict 목록을 FastJSONResponse로 바로 직렬화 (인기 검색어 캐시 hit 경로)
+
+같은 앱 안의 두 라우트를 ASGI로 직접 호출해 요청당 평균 시간을 JSON으로 출력한다.
+
+    python -m benchmarks.serialization_bench --items 100 --iterations 2000
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import List
+
+from app.keywords.application.dto.keyword_dto import PopularSearchResponseDto
+from app.keywords.infrastructure.entities.entity import PopularSearchEntity
+from core.infrastructure.responses.fast_json import FastJSONResponse
+
+
+def build_app(items: int):
+    from fastapi import FastAPI
+
+    rows = [(f"검색어{i}", "all", items - i) for i in range(items)]
+    app = FastAPI()
+
+    @app.get("/validated")
+    async def validated() -> List[PopularSearchResponseDto]:
+        return [PopularSearchEntity(term=t, category=c, count=n) for t, c, n in rows]
+
+    @app.get("/fast_models", response_model=List[PopularSearchResponseDto], response_class=FastJSONResponse)
+    async def fast_models():
+        construct = PopularSearchEntity.model_construct
+        return FastJSONResponse([construct(term=t, category=c, count=n) for t, c, n in rows])
+
+    cached = [
+        PopularSearchEntity.model_construct(term=t, category=c, count=n).model_dump(mode="json", by_alias=True)
+        for t, c, n in rows
+    ]
+
+    @app.get("/fast", response_model=List[PopularSearchResponseDto], response_class=FastJSONResponse)
+    async def fast():
+        return FastJSONResponse(cached)
+
+    return app
+
+
+async def measure(client, path: str, iterations: int) -> dict:
+    for _ in range(50):  # warm up
+        await client.get(path)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        response = await client.get(path)
+        response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    return {"per_request_us": round(elapsed / iterations * 1e6, 1), "bytes": len(response.content)}
+
+
+async def run(items: int, iterations: int) -> dict:
+    import httpx
+
+    app = build_app(items)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        validated = await measure(client, "/validated", iterations)
+        fast_models = await measure(client, "/fast_models", iterations)
+        fast = await measure(client, "/fast", iterations)
+        # 세 경로의 응답 내용이 같은지 확인
+        expected = (await client.get("/validated")).json()
+        assert expected == (await client.get("/fast_models")).json() == (await client.get("/fast")).json()
+    return {
+        "items": items,
+        "iterations": iterations,
+        "validated": validated,
+        "fast_models": fast_models,
+        "fast": fast,
+        "speedup": round(validated["per_request_us"] / fast["per_request_us"], 2),
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="response serialization benchmark")
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args.items, args.iterations)), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+로컬 대체물로 띄우는 벤치마크용 ASGI 앱 팩토리 (멀티 워커 측정용).
+
+    BENCH_REDIS_URL=redis://127.0.0.1:6379/15 \\
+        uvicorn benchmarks.standin_server:create_app --factory --workers 4 --loop uvloop --http httptools
+
+워커마다 lifespan 안에서 redis 클라이언트와 aiosqlite DB를 새로 만든다.
+BENCH_REDIS_URL이 없으면 워커별 fakeredis를 쓰므로 워커 간 데이터는 공유되지 않는다.
+"""
+import os
+from contextlib import asynccontextmanager
+
+from benchmarks.keyword_bench import configure_env, override_with_standins
+
+
+def create_app():
+    configure_env()
+    import app.main as main_module
+
+    app = main_module.create_app()
+    app_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app):
+        redis, database = await override_with_standins(main_module.container, os.getenv("BENCH_REDIS_URL"))
+        try:
+            async with app_lifespan(app):
+                yield
+        finally:
+            await redis.aclose()
+            await database.engine.dispose()
+
+    app.router.lifespan_context = lifespan
+    return app
@@ -0,0 +1,84 @@
+from contextlib import asynccontextmanager
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.infrastructure.database.database import Base
+from core.models.model import PopularSearches
+from app.keywords.infrastructure.repositories.keyword_repository import (
+    MERGE_BATCH_ROWS,
+    KeywordRepository,
+)
+
+
+class SqliteDatabase:
+    """MSSQL 대신 쓰는 aiosqlite in-memory DB. Database와 같은 session() 인터페이스를 제공"""
+
+    def __init__(self, url: str = "sqlite+aiosqlite:///:memory:") -> None:
+        self.engine = create_async_engine(
+            url,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        self.async_session_factory = sessionmaker(
+            bind=self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+
+    async def create_tables(self) -> None:
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    @asynccontextmanager
+    async def session(self):
+        async with self.async_session_factory() as session:
+            try:
+                yield session
+            except Exception as e:
+                await session.rollback()
+                raise e
+            finally:
+                await session.close()
+
+    def pool_stats(self) -> dict:
+        return {}
+
+
+class SqliteKeywordRepository(KeywordRepository):
+    """MERGE 대신 SQLite의 INSERT ... ON CONFLICT DO UPDATE로 같은 의미의 upsert를 한다"""
+
+    async def update_popular_search(self, term, category, today, count=1):
+        await self.bulk_update_popular_search([((term, category, today), count)])
+
+    async def bulk_update_popular_search(self, increments):
+        merged = {}
+        for key, count in increments:
+            merged[key] = merged.get(key, 0) + count
+        rows = [
+            {"search_term": term, "search_category": category, "search_date": search_date, "search_count": count}
+            for (term, category, search_date), count in merged.items()
+        ]
+        if not rows:
+            return
+        async with self.session() as session:
+            for i in range(0, len(rows), MERGE_BATCH_ROWS):
+                statement = sqlite_insert(PopularSearches).values(rows[i:i + MERGE_BATCH_ROWS])
+                statement = statement.on_conflict_do_update(
+                    index_elements=["search_term", "search_category", "search_date"],
+                    set_={"search_count": PopularSearches.search_count + statement.excluded.search_count},
+                )
+                await session.execute(statement)
+            await session.commit()
+
+
+async def create_redis(redis_url=None):
+    """redis_url이 있으면 로컬 redis-server, 없으면 fakeredis (Lua 실행에 lupa 필요)"""
+    if redis_url:
+        import redis.asyncio as aioredis
+        return aioredis.from_url(redis_url, encoding="utf-8", decode_responses=True)
+
+    from fakeredis import aioredis as fake_aioredis
+    return fake_aioredis.FakeRedis(decode_responses=True)
@@ -0,0 +1,108 @@
+"""
+워커 기동 시간 예산 검사.
+
+1) 새 인터프리터에서 `python -X importtime -c "import app.main"`을 실행해 모듈별 import 시간을 모으고
+2) 로컬 대체물(fakeredis/aiosqlite)로 lifespan을 돌려 Resource별 초기화 시간을 잰다.
+
+예산을 넘으면 종료 코드 1. CI나 배포 전에 돌린다.
+
+    python -m benchmarks.startup_budget --import-budget-ms 1500 --lifespan-budget-ms 500 \\
+        --module-budget fastapi=400 --module-budget app.di.container=300
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from benchmarks.keyword_bench import configure_env, override_with_standins
+
+ROOT = Path(__file__).resolve().parent.parent
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_import_times(target: str = "app.main") -> Tuple[float, Dict[str, float]]:
+    """target import 총 시간(ms)과 모듈별 누적 import 시간(ms)"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {target} 실패:\n{completed.stderr[-2000:]}")
+
+    cumulative: Dict[str, float] = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2)) / 1000
+    return cumulative.get(target, 0.0), cumulative
+
+
+async def measure_lifespan_times() -> Dict[str, float]:
+    import app.main as main_module
+
+    app = main_module.create_app()
+    redis, database = await override_with_standins(main_module.container)
+    try:
+        async with app.router.lifespan_context(app):
+            return dict(app.state.startup_timings)
+    finally:
+        await redis.aclose()
+        await database.engine.dispose()
+
+
+def parse_module_budgets(values: List[str]) -> Dict[str, float]:
+    budgets = {}
+    for value in values:
+        name, _, ms = value.partition("=")
+        budgets[name] = float(ms)
+    return budgets
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="worker startup time budget")
+    parser.add_argument("--import-budget-ms", type=float, default=0, help="app.main import 총 시간 예산")
+    parser.add_argument("--lifespan-budget-ms", type=float, default=0, help="lifespan Resource 초기화 총 시간 예산")
+    parser.add_argument("--module-budget", action="append", default=[], metavar="MODULE=MS")
+    parser.add_argument("--top", type=int, default=15, help="보고할 느린 모듈 수")
+    args = parser.parse_args(argv)
+
+    configure_env()
+    import_total, import_times = measure_import_times()
+    lifespan_times = asyncio.run(measure_lifespan_times())
+    lifespan_total = round(sum(lifespan_times.values()), 1)
+
+    failures = []
+    if args.import_budget_ms and import_total > args.import_budget_ms:
+        failures.append(f"import app.main {import_total}ms > {args.import_budget_ms}ms")
+    if args.lifespan_budget_ms and lifespan_total > args.lifespan_budget_ms:
+        failures.append(f"lifespan {lifespan_total}ms > {args.lifespan_budget_ms}ms")
+    for module, budget in parse_module_budgets(args.module_budget).items():
+        spent = import_times.get(module)
+        if spent is not None and spent > budget:
+            failures.append(f"import {module} {spent}ms > {budget}ms")
+
+    slowest = sorted(
+        ((name, ms) for name, ms in import_times.items() if "." not in name or name.split(".")[0] in ("app", "core", "router")),
+        key=lambda item: item[1],
+        reverse=True,
+    )[: args.top]
+    print(json.dumps({
+        "import_ms": import_total,
+        "slowest_imports_ms": dict(slowest),
+        "lifespan_ms": lifespan_total,
+        "lifespan_resources_ms": lifespan_times,
+        "failures": failures,
+    }, ensure_ascii=False, indent=2))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import random
+from itertools import accumulate
+from typing import List, Optional
+
+
+class ZipfWorkload:
+    """
+    검색어 인기 분포를 흉내 낸 Zipf 워크로드. rank r 검색어의 가중치는 1 / r^exponent.
+    seed가 같으면 같은 순서의 이벤트를 만든다.
+    """
+
+    def __init__(
+        self,
+        distinct_terms: int = 10000,
+        exponent: float = 1.1,
+        categories: Optional[List[str]] = None,
+        users: int = 1000,
+        seed: int = 42,
+    ) -> None:
+        self.random = random.Random(seed)
+        self.terms = [f"검색어{rank}" for rank in range(1, distinct_terms + 1)]
+        self.cum_weights = list(accumulate(1 / rank ** exponent for rank in range(1, distinct_terms + 1)))
+        self.categories = categories or ["all", "video", "image", "news", "people"]
+        self.users = [f"bench-user-{i}" for i in range(users)]
+
+    def term(self) -> str:
+        return self.random.choices(self.terms, cum_weights=self.cum_weights)[0]
+
+    def terms_batch(self, size: int) -> List[str]:
+        return self.random.choices(self.terms, cum_weights=self.cum_weights, k=size)
+
+    def category(self) -> str:
+        # 카테고리도 앞쪽일수록 자주 나오도록 치우치게
+        return self.random.choices(self.categories, weights=range(len(self.categories), 0, -1))[0]
+
+    def user(self) -> str:
+        return self.random.choice(self.users)
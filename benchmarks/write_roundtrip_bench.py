@@ -0,0 +1,104 @@
+"""
+BaseRepository 쓰기 작업별 SQL 실행 횟수(round trip)와 평균 시간.
+
+aiosqlite in-memory DB에서 create/create_datas/update/delete를 iterations 번씩 돌리며
+엔진의 before_cursor_execute 이벤트로 문장 수를 센다. COMMIT은 문장으로 세지 않는다.
+
+    python -m benchmarks.write_roundtrip_bench --iterations 500 --bulk-rows 1000 --chunk-size 250
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import date
+from typing import List
+
+from sqlalchemy import event
+
+from benchmarks.pagination_bench import PopularSearchRow, PopularSearchRowRepository
+from benchmarks.standins import SqliteDatabase
+from core.infrastructure.entities.entity import Entity
+
+
+class PopularSearchCreate(Entity):
+    search_term: str
+    search_category: str
+    search_date: date
+    search_count: int = 0
+
+
+class PopularSearchUpdate(Entity):
+    search_count: int
+
+
+def count_statements(database: SqliteDatabase) -> dict:
+    counter = {"statements": 0}
+
+    @event.listens_for(database.engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        counter["statements"] += 1
+
+    return counter
+
+
+async def measure(counter: dict, iterations: int, operation) -> dict:
+    counter["statements"] = 0
+    start = time.perf_counter()
+    for i in range(iterations):
+        await operation(i)
+    elapsed = time.perf_counter() - start
+    return {
+        "statements_per_op": round(counter["statements"] / iterations, 2),
+        "per_op_ms": round(elapsed / iterations * 1000, 3),
+    }
+
+
+async def run(args) -> dict:
+    database = SqliteDatabase()
+    await database.create_tables()
+    counter = count_statements(database)
+    repository = PopularSearchRowRepository(database.session)
+    today = date(2026, 1, 1)
+    created: List[PopularSearchRow] = []
+
+    async def create(i):
+        created.append(await repository.create_data(PopularSearchCreate(
+            search_term=f"single{i}", search_category="all", search_date=today
+        )))
+
+    async def create_many(i):
+        rows = await repository.create_datas([
+            PopularSearchCreate(search_term=f"bulk{i}:{n}", search_category="all", search_date=today)
+            for n in range(args.bulk_rows)
+        ], chunk_size=args.chunk_size)
+        assert [r.search_term for r in rows] == [f"bulk{i}:{n}" for n in range(args.bulk_rows)]
+
+    async def update(i):
+        row = await repository.update_data_by_data_id(created[i].id, PopularSearchUpdate(search_count=i + 1))
+        assert row.search_count == i + 1
+
+    async def remove(i):
+        assert await repository.delete_data_by_data_id(created[i].id)
+
+    report = {
+        "create_data": await measure(counter, args.iterations, create),
+        "create_datas": await measure(counter, max(1, args.iterations // 100), create_many),
+        "update_data_by_data_id": await measure(counter, args.iterations, update),
+        "delete_data_by_data_id": await measure(counter, args.iterations, remove),
+    }
+    report["create_datas"].update(rows=args.bulk_rows, chunk_size=args.chunk_size)
+    await database.engine.dispose()
+    return report
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="BaseRepository write round-trip benchmark")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--bulk-rows", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=250)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(run(args)), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from abc import ABC
+from typing import Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
@@ -19,3 +20,12 @@ class BaseRequest(ABC, BaseModel):
 
 class BaseResponse(ABC, BaseModel):
     model_config = dto_model_config
+
+
+ItemDTO = TypeVar("ItemDTO")
+
+
+class CursorPage(BaseResponse, Generic[ItemDTO]):
+    """keyset 페이지 응답. next_cursor를 다음 요청의 cursor로 넘긴다 (마지막 페이지면 None)"""
+    items: List[ItemDTO]
+    next_cursor: Optional[str] = None
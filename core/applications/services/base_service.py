@@ -1,8 +1,9 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Type, TypeVar, Generic, Optional
+from contextlib import aclosing
+from typing import AsyncIterator, List, Type, TypeVar, Generic, Optional
 
-from core.applications.dtos.dto import BaseRequest, BaseResponse
+from core.applications.dtos.dto import BaseRequest, BaseResponse, CursorPage
 from core.infrastructure.repositories.base_repository import BaseRepository
 
 CreateDTO = TypeVar("CreateDTO", bound=BaseRequest)
@@ -19,14 +20,33 @@ class BaseService(ABC, Generic[CreateDTO, ResponseDTO, UpdateDTO]):
         result = await self.repository.create_data(create_data=data)
         return self._to_response_dto(result)
 
-    async def bulk_create(self, datas: List[CreateDTO]) -> List[ResponseDTO]:
-        results = await self.repository.create_datas(create_datas=datas)
+    async def bulk_create(self, datas: List[CreateDTO], chunk_size: Optional[int] = None) -> List[ResponseDTO]:
+        results = await self.repository.create_datas(create_datas=datas, chunk_size=chunk_size)
         return [self._to_response_dto(r) for r in results]
 
     async def list(self, page: int, page_size: int) -> List[ResponseDTO]:
         results = await self.repository.get_datas(page=page, page_size=page_size)
         return [self._to_response_dto(r) for r in results]
 
+    async def list_by_cursor(
+        self,
+        page_size: int,
+        cursor: Optional[str] = None,
+        sort_key: str = "id",
+        descending: bool = False,
+    ) -> CursorPage[ResponseDTO]:
+        # 깊은 페이지도 첫 페이지와 비용이 같다. 잘못된 cursor는 ValueError
+        results, next_cursor = await self.repository.get_datas_by_cursor(
+            page_size=page_size, cursor=cursor, sort_key=sort_key, descending=descending
+        )
+        return CursorPage(items=[self._to_response_dto(r) for r in results], next_cursor=next_cursor)
+
+    async def stream(self, batch_size: int = 1000) -> AsyncIterator[ResponseDTO]:
+        # 소비하는 쪽이 중간에 멈추고 이 generator를 닫으면 repository 쪽 session도 바로 닫히게 한다
+        async with aclosing(self.repository.stream(batch_size=batch_size)) as results:
+            async for result in results:
+                yield self._to_response_dto(result)
+
     async def get(self, data_id: int) -> Optional[ResponseDTO]:
         result = await self.repository.get_data_by_data_id(data_id=data_id)
         return self._to_response_dto(result) if result else None
@@ -0,0 +1,254 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError, StatementError
+
+logger = logging.getLogger(__name__)
+
+FlushFunc = Callable[[List[Tuple[Hashable, int]]], Awaitable[None]]
+DeadLetterFunc = Callable[[List[Tuple[Hashable, int]]], None]
+
+
+def is_data_error(error: Exception) -> bool:
+    """
+    다시 보내도 같은 행에서 또 실패할 오류인지 판단한다 (제약 위반, 값 오류, 파라미터 변환 실패).
+    연결 끊김/timeout 같은 OperationalError·DBAPIError는 일시적 오류로 본다
+    """
+    if isinstance(error, (IntegrityError, DataError)):
+        return True
+    return isinstance(error, StatementError) and not isinstance(error, DBAPIError)
+
+
+class AggregationBuffer:
+    """
+    같은 key의 증가분을 메모리에서 합산해 두었다가 주기적으로(또는 entry 수가 넘치면)
+    flush_func 한 번으로 내보내는 write-behind 버퍼.
+    - 일시적 오류(DB 장애 등): 증가분을 버퍼로 되돌리고 지수 backoff 뒤 재시도한다. 버리지 않는다
+    - 데이터 오류(is_data_error): 배치째 재시도하다 max_attempts번 연속 실패하면 배치를 반씩 나눠
+      문제 행만 골라 dead_letter로 넘긴다 (기본: error 로그)
+    """
+
+    def __init__(
+        self,
+        flush_func: FlushFunc,
+        flush_interval_ms: int = 500,
+        max_entries: int = 1000,
+        name: str = "aggregation_buffer",
+        max_attempts: int = 5,
+        dead_letter: Optional[DeadLetterFunc] = None,
+        max_backoff_seconds: float = 30.0,
+        is_data_error: Callable[[Exception], bool] = is_data_error,
+    ) -> None:
+        self.flush_func = flush_func
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_entries = max_entries
+        self.name = name
+        self.max_attempts = max(1, max_attempts)
+        self.dead_letter = dead_letter or self._log_dead_letter
+        self.max_backoff = max_backoff_seconds
+        self.is_data_error = is_data_error
+        self._consecutive_failures = 0
+        self._data_failures = 0
+        self._retry_at = 0.0
+
+        self._pending: Dict[Hashable, int] = {}
+        self._oldest_pending_at: Optional[float] = None
+        self._flush_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        self.last_flush_size = 0
+        self.last_flush_duration_ms = 0.0
+        self.last_flush_lag_ms = 0.0
+        self.total_flushed = 0
+        self.flush_count = 0
+        self.flush_failures = 0
+        self.dead_lettered = 0
+
+    def add(self, key: Hashable, amount: int = 1) -> None:
+        if not self._pending:
+            self._oldest_pending_at = time.monotonic()
+        self._pending[key] = self._pending.get(key, 0) + amount
+        # backoff 중에는 entry가 넘쳐도 flush를 앞당기지 않는다
+        if len(self._pending) >= self.max_entries and not self.backing_off:
+            self._flush_event.set()
+
+    def add_many(self, keys: List[Hashable]) -> None:
+        for key in keys:
+            self.add(key)
+
+    @property
+    def lag_ms(self) -> float:
+        if self._oldest_pending_at is None:
+            return 0.0
+        return (time.monotonic() - self._oldest_pending_at) * 1000
+
+    @property
+    def backing_off(self) -> bool:
+        return time.monotonic() < self._retry_at
+
+    async def flush(self, force: bool = False) -> int:
+        """대기 중인 증가분을 내보낸다. backoff 중이면 force일 때만 (종료 시) 보낸다"""
+        async with self._flush_lock:
+            if not self._pending or (self.backing_off and not force):
+                return 0
+
+            pending, oldest = self._pending, self._oldest_pending_at
+            self._pending, self._oldest_pending_at = {}, None
+            items = list(pending.items())
+
+            start = time.monotonic()
+            try:
+                await self.flush_func(items)
+            except Exception as e:
+                self.flush_failures += 1
+                if not self.is_data_error(e):
+                    self._requeue(items, oldest)
+                    self._back_off(e, len(items))
+                    return 0
+                self._data_failures += 1
+                logger.error(
+                    f"[{self.name}] flush 데이터 오류 ({len(items)}건, 연속 {self._data_failures}회): {str(e)}"
+                )
+                if self._data_failures < self.max_attempts:
+                    # 동시 MERGE의 키 충돌처럼 다시 보내면 통과하는 경우가 있어 배치째 재시도한다
+                    self._requeue(items, oldest)
+                    return 0
+                self._data_failures = 0
+                return await self._flush_split(items, start, oldest)
+
+            self._consecutive_failures = self._data_failures = 0
+            self._retry_at = 0.0
+            self._record_flush(len(items), start, oldest)
+            return len(items)
+
+    async def _flush_split(self, items: List[Tuple[Hashable, int]], start: float, oldest: Optional[float]) -> int:
+        """
+        데이터 오류가 계속되는 배치를 반씩 나눠 보내 문제 행만 dead_letter로 넘긴다.
+        문제 행이 k개면 round trip은 약 k*log2(N)번. 도중에 일시적 오류가 나면 남은 행은 버퍼로 되돌린다
+        """
+        chunks, flushed, failed = [items], 0, []
+        while chunks:
+            chunk = chunks.pop()
+            try:
+                await self.flush_func(chunk)
+            except Exception as e:
+                if not self.is_data_error(e):
+                    self._requeue([item for rest in chunks for item in rest] + chunk, oldest)
+                    self._back_off(e, len(chunk))
+                    break
+                if len(chunk) == 1:
+                    failed.extend(chunk)
+                    logger.error(f"[{self.name}] 행 flush 실패 {chunk[0][0]!r}: {str(e)}")
+                else:
+                    middle = len(chunk) // 2
+                    chunks.extend((chunk[middle:], chunk[:middle]))
+                continue
+            flushed += len(chunk)
+
+        if flushed:
+            self._record_flush(flushed, start, oldest)
+        if failed:
+            self.dead_lettered += len(failed)
+            try:
+                self.dead_letter(failed)
+            except Exception:
+                logger.exception(f"[{self.name}] dead letter 처리 실패 ({len(failed)}건)")
+        return flushed
+
+    def _requeue(self, items: List[Tuple[Hashable, int]], oldest: Optional[float]) -> None:
+        # 실패한 증가분은 되돌려서 다음 flush에 합친다
+        for key, amount in items:
+            self._pending[key] = self._pending.get(key, 0) + amount
+        if oldest is not None and items:
+            self._oldest_pending_at = min(oldest, self._oldest_pending_at or oldest)
+
+    def _back_off(self, error: Exception, size: int) -> None:
+        self._consecutive_failures += 1
+        delay = min(self.flush_interval * 2 ** (self._consecutive_failures - 1), self.max_backoff)
+        self._retry_at = time.monotonic() + delay
+        logger.error(
+            f"[{self.name}] flush 실패 ({size}건, 연속 {self._consecutive_failures}회), "
+            f"{delay:.1f}초 뒤 재시도: {str(error)}"
+        )
+
+    def _record_flush(self, size: int, start: float, oldest: Optional[float]) -> None:
+        self.last_flush_size = size
+        self.last_flush_duration_ms = (time.monotonic() - start) * 1000
+        self.last_flush_lag_ms = (start - oldest) * 1000 if oldest is not None else 0.0
+        self.total_flushed += size
+        self.flush_count += 1
+
+    def _log_dead_letter(self, items: List[Tuple[Hashable, int]]) -> None:
+        logger.error(f"[{self.name}] 반영하지 못하고 버린 항목 {len(items)}건: {items[:20]!r}")
+
+    async def _run(self) -> None:
+        while True:
+            timeout = max(self.flush_interval, self._retry_at - time.monotonic())
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"{self.name}-flush")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # 종료 전에 남은 증가분을 모두 내보낸다 (backoff 중이어도 한 번은 시도)
+        await self.flush(force=True)
+        if self._pending:
+            logger.error(f"[{self.name}] 종료 시 flush 되지 못한 항목: {len(self._pending)}건")
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "pending_entries": len(self._pending),
+            "lag_ms": round(self.lag_ms, 1),
+            "last_flush_size": self.last_flush_size,
+            "last_flush_duration_ms": round(self.last_flush_duration_ms, 1),
+            "last_flush_lag_ms": round(self.last_flush_lag_ms, 1),
+            "total_flushed": self.total_flushed,
+            "flush_count": self.flush_count,
+            "flush_failures": self.flush_failures,
+            "dead_lettered": self.dead_lettered,
+            "backoff_remaining_ms": round(max(0.0, self._retry_at - time.monotonic()) * 1000, 1),
+        }
+
+
+async def init_aggregation_buffer(
+    flush_func: FlushFunc,
+    flush_interval_ms: int = 500,
+    max_entries: int = 1000,
+    name: str = "aggregation_buffer",
+    max_attempts: int = 5,
+    dead_letter: Optional[DeadLetterFunc] = None,
+    max_backoff_seconds: float = 30.0,
+):
+    buffer = AggregationBuffer(
+        flush_func=flush_func,
+        flush_interval_ms=flush_interval_ms,
+        max_entries=max_entries,
+        name=name,
+        max_attempts=max_attempts,
+        dead_letter=dead_letter,
+        max_backoff_seconds=max_backoff_seconds,
+    )
+    buffer.start()
+    logger.info(f"[{name}] write-behind 버퍼 시작")
+    try:
+        yield buffer
+    finally:
+        await buffer.stop()
+        logger.info(f"[{name}] write-behind 버퍼 종료")
@@ -0,0 +1,176 @@
+import asyncio
+import json
+import logging
+from typing import Iterable, List, Sequence, Set, Tuple
+
+from core.infrastructure.cache.near_cache import NearCache
+
+logger = logging.getLogger(__name__)
+
+# 이 태그를 받으면 모든 near-cache를 비운다 (leaderboard 재생성 등)
+INVALIDATE_ALL = "*"
+
+
+def encode_tags(tags: Iterable[str], stale: bool = False) -> str:
+    """태그 목록은 삭제, {"stale": 태그 목록}은 stale 표시(값은 두고 다음 조회에서 재검증)"""
+    tags = sorted(set(tags))
+    return json.dumps({"stale": tags} if stale else tags, ensure_ascii=False)
+
+
+def decode_tags(data) -> Tuple[List[str], bool]:
+    """(태그 목록, stale 표시 여부)"""
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    tags = json.loads(data)
+    if isinstance(tags, dict):
+        return list(tags["stale"]), True
+    return ([tags] if isinstance(tags, str) else list(tags)), False
+
+
+class CacheInvalidationPublisher:
+    """
+    near-cache 무효화 태그(redis 키)를 pub/sub 채널로 발행한다.
+    - publish(): 즉시 발행, 받은 워커는 항목을 지운다 (쓰기 pipeline에 함께 실을 때는 queue()로 명령만 추가)
+    - mark(): 자주 바뀌는 키(인기 검색어 leaderboard 등)는 모아 두었다가 interval마다 한 번 stale 표시로 발행.
+      매 검색마다 바뀌는 키를 지우면 인기 항목이 계속 비어 redis로 몰리므로, 받은 워커는 값을 둔 채
+      다음 조회에서 이전 값을 돌려주며 백그라운드로 한 번만 다시 읽는다
+    """
+
+    def __init__(self, client, channel: str, interval_ms: int = 200) -> None:
+        self.client = client
+        self.channel = channel
+        self.interval = interval_ms / 1000
+        self._pending: Set[str] = set()
+        self.published = 0
+
+    def queue(self, pipe, tags: Iterable[str]) -> None:
+        pipe.publish(self.channel, encode_tags(tags))
+        self.published += 1
+
+    async def publish(self, tags: Iterable[str], stale: bool = False) -> None:
+        await self.client.publish(self.channel, encode_tags(tags, stale))
+        self.published += 1
+
+    def mark(self, tags: Iterable[str]) -> None:
+        self._pending.update(tags)
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        tags, self._pending = self._pending, set()
+        try:
+            await self.publish(tags, stale=True)
+        except Exception:
+            self._pending.update(tags)  # 다음 주기에 다시
+            raise
+
+    def stats(self) -> dict:
+        return {"channel": self.channel, "published": self.published, "pending": len(self._pending)}
+
+
+async def init_invalidation_publisher(client, channel: str, interval_ms: int = 200, enabled: bool = True):
+    """CacheInvalidationPublisher Resource. 모아 둔 태그를 interval_ms마다 발행한다. 비활성화 시 None"""
+    if not enabled:
+        yield None
+        return
+
+    publisher = CacheInvalidationPublisher(client, channel, interval_ms)
+
+    async def run() -> None:
+        while True:
+            await asyncio.sleep(publisher.interval)
+            try:
+                await publisher.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[near_cache] 무효화 발행 실패: {str(e)}")
+
+    task = asyncio.create_task(run(), name="near_cache_invalidation_publisher")
+    try:
+        yield publisher
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        try:
+            await publisher.flush()
+        except Exception:
+            pass
+
+
+def apply_invalidation(caches: Sequence[NearCache], tags: List[str], stale: bool = False) -> None:
+    for cache in caches:
+        if INVALIDATE_ALL in tags:
+            cache.clear()
+        elif stale:
+            cache.mark_stale_tags(tags)
+        else:
+            cache.invalidate_tags(tags)
+
+
+async def init_invalidation_subscriber(
+    client,
+    caches: Sequence[NearCache],
+    channel: str,
+    enabled: bool = True,
+    reconnect_delay_seconds: float = 1.0,
+):
+    """
+    무효화 채널을 구독해 이 워커의 near-cache에서 해당 태그의 항목만 지우는 Resource.
+    구독이 끊겼다 다시 붙으면 그 사이 메시지를 놓쳤을 수 있으므로 캐시를 모두 비운다.
+    """
+    if not enabled:
+        yield None
+        return
+
+    subscribed = asyncio.Event()
+
+    async def run() -> None:
+        first = True
+        while True:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(channel)
+                if not first:
+                    apply_invalidation(caches, [INVALIDATE_ALL])
+                    logger.info("[near_cache] 무효화 채널 재구독 - 캐시 초기화")
+                first = False
+                subscribed.set()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        apply_invalidation(caches, *decode_tags(message["data"]))
+                    except (ValueError, TypeError, KeyError):
+                        logger.warning(f"[near_cache] 잘못된 무효화 메시지: {message['data']!r}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[near_cache] 무효화 구독 끊김: {str(e)}")
+                # 끊긴 동안의 변경을 알 수 없으므로 바로 비우고 재연결
+                apply_invalidation(caches, [INVALIDATE_ALL])
+                await asyncio.sleep(reconnect_delay_seconds)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    task = asyncio.create_task(run(), name="near_cache_invalidation_subscriber")
+    # 첫 구독이 끝나기 전에 요청을 받으면 그 사이 무효화를 놓칠 수 있다
+    try:
+        await asyncio.wait_for(subscribed.wait(), timeout=5)
+    except asyncio.TimeoutError:
+        logger.warning("[near_cache] 무효화 채널 구독이 지연되고 있습니다")
+    logger.info(f"[near_cache] 무효화 채널 구독: {channel}")
+    try:
+        yield task
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
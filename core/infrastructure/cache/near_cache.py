@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires_at", "stale_until", "tags")
+
+    def __init__(self, value: Any, expires_at: float, stale_until: float, tags: Tuple[str, ...] = ()) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.tags = tags
+
+
+class NearCache:
+    """
+    워커 프로세스 내부 TTL + LRU 캐시.
+    - 같은 key의 동시 miss는 loader 한 번으로 합친다 (single-flight)
+    - ttl이 지났어도 stale_ttl 안이면 이전 값을 돌려주고 백그라운드에서 갱신한다
+    - 항목에 태그(원본 redis 키 등)를 달아 두면 invalidate_tags()로 해당 항목만 지울 수 있다
+    - mark_stale_tags()는 지우지 않고 만료만 시킨다: 다음 조회는 이전 값을 받고 갱신은 백그라운드에서 한 번만 한다
+      (stale_ttl이 0이면 지우는 것과 같다).
+      갱신을 replica에서 읽으면 replica 지연만큼 오래된 값을 다시 ttl 동안 캐시할 수 있다.
+      다음 stale 표시나 ttl 만료로 바로잡히므로 자주 바뀌는 leaderboard에는 허용하지만,
+      쓰기 직후 보여야 하는 값(최근 검색어 등)은 invalidate_tags()로 지우고 primary에서 읽어야 한다
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 1.0,
+        stale_ttl_seconds: float = 0.0,
+        max_size: int = 1024,
+        name: str = "near_cache",
+    ) -> None:
+        self.ttl = ttl_seconds
+        self.stale_ttl = stale_ttl_seconds
+        self.max_size = max_size
+        self.name = name
+
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._tag_index: Dict[str, Set[Hashable]] = {}
+        # 읽는 도중 무효화된 key는 읽은 값을 캐시에 넣지 않는다 (무효화 이전 값일 수 있음)
+        self._inflight_tags: Dict[Hashable, Tuple[str, ...]] = {}
+        self._dirty_inflight: Set[Hashable] = set()
+        # 요청과 분리해 실행 중인 loader task (GC로 사라지지 않도록 참조를 잡아 둔다)
+        self._load_tasks: Set[asyncio.Task] = set()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.load_errors = 0
+        self.invalidations = 0
+        self.stale_marks = 0
+
+    async def get_or_load(self, key: Hashable, loader: Loader, tags: Iterable[str] = ()) -> Any:
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now < entry.expires_at:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._refresh_in_background(key, loader, entry.tags)
+                return entry.value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        return await self._load(key, loader, tuple(tags))
+
+    async def _load(self, key: Hashable, loader: Loader, tags: Tuple[str, ...] = ()) -> Any:
+        # 처음 요청한 쪽이 취소돼도 기다리던 쪽이 CancelledError를 받지 않도록 읽기는 분리된 task에서 한다
+        return await asyncio.shield(self._start_load(key, loader, tags))
+
+    def _start_load(self, key: Hashable, loader: Loader, tags: Tuple[str, ...] = ()) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self._inflight_tags[key] = tags
+        task = asyncio.create_task(self._run_loader(key, loader, tags, future))
+        self._load_tasks.add(task)
+        task.add_done_callback(self._load_tasks.discard)
+        return future
+
+    async def _run_loader(self, key: Hashable, loader: Loader, tags: Tuple[str, ...], future: asyncio.Future) -> None:
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            # task 자체가 취소된 경우(종료 시)만 온다
+            future.cancel()
+            raise
+        except Exception as e:
+            self.load_errors += 1
+            future.set_exception(e)
+            # 기다리는 쪽이 없으면 "exception was never retrieved" 경고가 나므로 소비해 둔다
+            future.exception()
+        else:
+            if key not in self._dirty_inflight:
+                self.set(key, value, tags)
+            future.set_result(value)
+        finally:
+            self._inflight.pop(key, None)
+            self._inflight_tags.pop(key, None)
+            self._dirty_inflight.discard(key)
+
+    def _refresh_in_background(self, key: Hashable, loader: Loader, tags: Tuple[str, ...] = ()) -> None:
+        if key in self._inflight:
+            return
+
+        def log_failure(future: asyncio.Future) -> None:
+            if not future.cancelled() and future.exception() is not None:
+                logger.warning(f"[{self.name}] 백그라운드 갱신 실패 {key}: {str(future.exception())}")
+
+        self._start_load(key, loader, tags).add_done_callback(log_failure)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry.expires_at:
+            return None
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[str] = ()) -> None:
+        tags = tuple(tags)
+        self._remove(key)
+        now = time.monotonic()
+        expires_at = now + self.ttl
+        self._entries[key] = _CacheEntry(value, expires_at, expires_at + self.stale_ttl, tags)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_size:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._unindex(evicted_key, evicted)
+            self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unindex(key, entry)
+
+    def _unindex(self, key: Hashable, entry: _CacheEntry) -> None:
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def invalidate(self, key: Hashable) -> None:
+        self._remove(key)
+        if key in self._inflight:
+            self._dirty_inflight.add(key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """태그가 붙은 항목을 지우고 지운 개수를 돌려준다"""
+        tags = set(tags)
+        removed = 0
+        for tag in tags:
+            for key in self._tag_index.pop(tag, ()):
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._unindex(key, entry)
+                    removed += 1
+        for key, inflight_tags in self._inflight_tags.items():
+            if tags.intersection(inflight_tags):
+                self._dirty_inflight.add(key)
+        self.invalidations += removed
+        return removed
+
+    def mark_stale_tags(self, tags: Iterable[str]) -> int:
+        """태그가 붙은 항목을 만료(stale) 상태로 바꾸고 바꾼 개수를 돌려준다. 진행 중인 읽기 결과는 그대로 캐시한다"""
+        now = time.monotonic()
+        marked = 0
+        for tag in set(tags):
+            for key in self._tag_index.get(tag, ()):
+                entry = self._entries.get(key)
+                if entry is not None and entry.expires_at > now:
+                    entry.expires_at = now
+                    entry.stale_until = max(entry.stale_until, now + self.stale_ttl)
+                    marked += 1
+        self.stale_marks += marked
+        return marked
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tag_index.clear()
+        self._dirty_inflight.update(self._inflight)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "load_errors": self.load_errors,
+            "invalidations": self.invalidations,
+            "stale_marks": self.stale_marks,
+            "hit_ratio": round((self.hits + self.stale_hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
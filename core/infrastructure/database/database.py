@@ -1,7 +1,54 @@
+import logging
+import time
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+
+from core.infrastructure.metrics.sql_metrics import (
+    DB_POOL_CHECKOUT_WAIT,
+    instrument_engine,
+    register_pool_metrics,
+    unregister_pool_metrics,
+)
+
+logger = logging.getLogger(__name__)
+
+# 커넥션 획득이 이보다 오래 걸리면 pool 대기로 보고 경고
+SLOW_CHECKOUT_WARN_MS = 100
+
+# session이 커넥션을 요청한 시각. checkout 이벤트에서 대기 시간을 계산한다
+# (SQLAlchemy는 session/pool 작업을 도는 greenlet에 호출한 쪽 context를 넘기므로 이벤트끼리 값을 주고받는다)
+_checkout_requested_at: ContextVar[Optional[float]] = ContextVar("checkout_requested_at", default=None)
+
+
+class CheckoutTimedSession(Session):
+    """트랜잭션을 시작하는 시각(첫 쿼리가 커넥션을 요청하기 직전)을 남기는 Session. 커넥션을 미리 얻지 않는다"""
+
+
+@event.listens_for(CheckoutTimedSession, "after_transaction_create")
+def _mark_checkout_requested(session, transaction) -> None:
+    # autobegin은 첫 쿼리/flush가 커넥션을 얻기 바로 전에 root 트랜잭션을 만든다 (savepoint는 제외)
+    if transaction.parent is None:
+        _checkout_requested_at.set(time.perf_counter())
+
+
+def create_session_factory(engine):
+    return sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        sync_session_class=CheckoutTimedSession,
+        expire_on_commit=False,
+    )
+
+
+def _pyodbc_connection(dbapi_connection):
+    """aioodbc 어댑터(AsyncAdapt_aioodbc_connection -> aioodbc.Connection)에 감싸인 pyodbc 커넥션"""
+    connection = getattr(dbapi_connection, "_connection", dbapi_connection)
+    return getattr(connection, "_conn", connection)
 
 
 def create_dsn(
@@ -10,14 +57,102 @@ def create_dsn(
     database_host: str,
     database_port: int,
     database_name: str,
+    read_only: bool = False,
 ):
-    return f"mssql+aioodbc://{database_user}:{database_password}@{database_host}:{database_port}/{database_name}?driver=ODBC+Driver+17+for+SQL+Server"
+    dsn = f"mssql+aioodbc://{database_user}:{database_password}@{database_host}:{database_port}/{database_name}?driver=ODBC+Driver+17+for+SQL+Server"
+    # AlwaysOn 가용성 그룹의 읽기 가능 보조 복제본으로 연결
+    return f"{dsn}&ApplicationIntent=ReadOnly" if read_only else dsn
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class PoolMetrics:
+    """
+    pool 이벤트(connect/checkout/checkin/invalidate)로 집계하는 커넥션 풀 지표.
+    checkout 대기 시간 = session의 첫 쿼리가 커넥션을 요청한 시각부터 checkout 이벤트까지에서
+    그 사이 새 커넥션을 맺은 시간(do_connect ~ connect 이벤트)을 뺀 값. pool 슬롯 대기와 pre-ping만 남는다.
+    새로 맺은 시간은 connect_total_ms / connect_max_ms로 따로 본다.
+    """
+
+    def __init__(self, engine, name: str = "primary") -> None:
+        self.name = name
+        self.pool = engine.sync_engine.pool
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.wait_count = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.connect_total_ms = 0.0
+        self.connect_max_ms = 0.0
+
+        event.listen(engine.sync_engine, "do_connect", self._on_do_connect)
+        event.listen(engine.sync_engine, "connect", self._on_connect)
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine, "checkin", self._on_checkin)
+        event.listen(engine.sync_engine, "invalidate", self._on_invalidate)
+
+    def _on_do_connect(self, dialect, connection_record, cargs, cparams) -> None:
+        connection_record.info["connect_started_at"] = time.perf_counter()
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        self.connects += 1
+        started = connection_record.info.pop("connect_started_at", None)
+        if started is not None:
+            connect_ms = (time.perf_counter() - started) * 1000
+            self.connect_total_ms += connect_ms
+            self.connect_max_ms = max(self.connect_max_ms, connect_ms)
+            # 이 커넥션을 기다리던 checkout의 대기 시간에서 뺀다
+            connection_record.info["connect_ms"] = connect_ms
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        self.checkouts += 1
+        requested_at = _checkout_requested_at.get()
+        connect_ms = connection_record.info.pop("connect_ms", 0.0)
+        if requested_at is not None:
+            # 같은 context의 다음 checkout(session 밖의 engine.connect 등)이 이 값을 쓰지 않도록 비운다
+            _checkout_requested_at.set(None)
+            self.observe_wait(max((time.perf_counter() - requested_at) * 1000 - connect_ms, 0.0))
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        self.checkins += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        self.invalidations += 1
+
+    def observe_wait(self, wait_ms: float) -> None:
+        self.wait_count += 1
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+        DB_POOL_CHECKOUT_WAIT.observe(wait_ms / 1000, self.name)
+        if wait_ms >= SLOW_CHECKOUT_WARN_MS:
+            logger.warning(
+                f"DB 커넥션 획득 지연 {wait_ms:.0f}ms "
+                f"(in_use={self.pool.checkedout()}, overflow={max(self.pool.overflow(), 0)})"
+            )
+
+    def stats(self) -> dict:
+        return {
+            "pool_size": self.pool.size(),
+            "in_use": self.pool.checkedout(),
+            "idle": self.pool.checkedin(),
+            # QueuePool.overflow()는 pool_size만큼 음수에서 시작한다
+            "overflow": max(self.pool.overflow(), 0),
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "checkout_wait_count": self.wait_count,
+            "checkout_wait_avg_ms": round(self.wait_total_ms / self.wait_count, 2) if self.wait_count else 0.0,
+            "checkout_wait_max_ms": round(self.wait_max_ms, 2),
+            "connect_avg_ms": round(self.connect_total_ms / self.connects, 2) if self.connects else 0.0,
+            "connect_max_ms": round(self.connect_max_ms, 2),
+        }
+
+
 class Database:
     def __init__(
         self,
@@ -26,6 +161,18 @@ class Database:
         database_host: str,
         database_port: int,
         database_name: str,
+        echo: bool = False,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        pool_timeout: float = 30,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        fast_executemany: bool = False,
+        statement_timeout: int = 0,
+        name: str = "primary",
+        metrics_enabled: bool = True,
+        read_only: bool = False,
+        lag_query: str = "",
     ) -> None:
         dsn = create_dsn(
             database_user=database_user,
@@ -33,15 +180,37 @@ class Database:
             database_host=database_host,
             database_port=database_port,
             database_name=database_name,
+            read_only=read_only,
         )
 
-        self.engine = create_async_engine(url=dsn, echo=True)
-
-        self.async_session_factory = sessionmaker(
-            bind=self.engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
+        self.engine = create_async_engine(
+            url=dsn,
+            echo=echo,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            fast_executemany=fast_executemany,
         )
+        self.name = name
+        self.read_only = read_only
+        # replica 복제 지연(초)을 한 값으로 돌려주는 쿼리 (비어 있으면 연결 확인만)
+        self.lag_query = lag_query
+        self.pool_metrics = PoolMetrics(self.engine, name=name)
+        if statement_timeout:
+            self._set_statement_timeout(statement_timeout)
+        if metrics_enabled:
+            instrument_engine(self.engine, name=name)
+            register_pool_metrics(name, self.pool_metrics)
+
+        self.async_session_factory = create_session_factory(self.engine)
+
+    def _set_statement_timeout(self, seconds: int) -> None:
+        # pyodbc Connection.timeout: 이 커넥션에서 만드는 모든 cursor의 쿼리 timeout(초). 넘으면 HYT00 오류
+        @event.listens_for(self.engine.sync_engine, "connect")
+        def set_timeout(dbapi_connection, connection_record):
+            _pyodbc_connection(dbapi_connection).timeout = seconds
 
     @asynccontextmanager
     async def session(self):
@@ -53,3 +222,61 @@ class Database:
                 raise e
             finally:
                 await session.close()
+
+    def pool_stats(self) -> dict:
+        return self.pool_metrics.stats()
+
+    async def close(self) -> None:
+        unregister_pool_metrics(self.name, self.pool_metrics)
+        await self.engine.dispose()
+
+
+async def init_database(**kwargs):
+    """
+    워커(이벤트 루프)마다 엔진/커넥션 풀을 만들고 lifespan 종료 시 dispose 하는 Resource.
+    aioodbc 커넥션은 만든 루프에 묶이므로 프로세스 간/루프 간에 공유하지 않는다.
+    """
+    database = Database(**kwargs)
+    logger.info(f"[{database.name}] DB 엔진 생성")
+    try:
+        yield database
+    finally:
+        await database.close()
+        logger.info(f"[{database.name}] DB 엔진 종료")
+
+
+def _split_host(host: str, default_port):
+    host, _, port = host.partition(":")
+    return host, port or default_port
+
+
+async def init_database_replicas(hosts, database_port, **kwargs):
+    """
+    읽기 전용 replica 엔진 목록 Resource. hosts 항목은 "host" 또는 "host:port".
+    계정/DB/풀 설정은 primary와 같고 ApplicationIntent=ReadOnly로 연결한다.
+    """
+    replicas = []
+    for index, host in enumerate(hosts or []):
+        replica_host, replica_port = _split_host(host, database_port)
+        replicas.append(Database(
+            database_host=replica_host,
+            database_port=replica_port,
+            name=f"replica{index}",
+            read_only=True,
+            **kwargs,
+        ))
+    try:
+        yield replicas
+    finally:
+        for replica in replicas:
+            await replica.close()
+
+
+async def probe_database_replica(replica: Database, primary: Database):
+    """replica 연결 확인. lag_query가 있으면 그 결과(초)를 복제 지연으로 돌려준다"""
+    async with replica.engine.connect() as connection:
+        if not replica.lag_query:
+            await connection.execute(text("SELECT 1"))
+            return None
+        lag = (await connection.execute(text(replica.lag_query))).scalar()
+        return float(lag) if lag is not None else None
@@ -1,24 +1,148 @@
 # -*- coding: utf-8 -*-
 from dependency_injector import containers, providers
 
-from core.infrastructure.database.database import Database
+import redis.asyncio as aioredis
 
-from core.infrastructure.redis.client import RedisClient
+from core.infrastructure.cache.invalidation import init_invalidation_publisher
+from core.infrastructure.database.database import (
+    init_database,
+    init_database_replicas,
+    probe_database_replica,
+)
 
-async def provide_redis_client():
-    return await RedisClient.get_instance()
+from core.infrastructure.metrics.multiprocess import init_metrics_exporter
+from core.infrastructure.metrics.redis_metrics import instrument_redis
+from core.infrastructure.redis.auto_pipeline import AutoPipelineRedis
+from core.infrastructure.redis.client import REDIS_FAILOVER_ERRORS, RedisClient, probe_redis_replica
+from core.infrastructure.replica.router import init_replica_router
+
+def wrap_redis_client(client, metrics_enabled=True, auto_pipeline=False, auto_pipeline_window_us=0,
+                      auto_pipeline_max_batch=512):
+    if auto_pipeline:
+        # 원래 클라이언트와 connection pool을 공유하는 auto-pipelining 클라이언트로 교체
+        client = AutoPipelineRedis(client, window_us=auto_pipeline_window_us, max_batch=auto_pipeline_max_batch)
+    return instrument_redis(client) if metrics_enabled else client
+
+
+async def _drain(client) -> None:
+    if isinstance(client, AutoPipelineRedis):
+        await client.drain()
+
+
+async def provide_redis_client(metrics_enabled: bool = True, **auto_pipeline_options):
+    # 워커(이벤트 루프)마다 lifespan 안에서 만들고 종료 시 닫는다
+    client = wrap_redis_client(await RedisClient.get_instance(), metrics_enabled, **auto_pipeline_options)
+    try:
+        yield client
+    finally:
+        await _drain(client)
+        await RedisClient.close()
+
+
+async def provide_redis_replica_clients(urls, metrics_enabled: bool = True, **auto_pipeline_options):
+    raw_clients = [aioredis.from_url(url, encoding="utf-8", decode_responses=True) for url in urls or []]
+    clients = [wrap_redis_client(client, metrics_enabled, **auto_pipeline_options) for client in raw_clients]
+    try:
+        yield clients
+    finally:
+        for client in clients:
+            await _drain(client)
+        for client in raw_clients:
+            await client.aclose()
 
 
 class CoreContainer(containers.DeclarativeContainer):
     config = providers.Configuration(strict=True)
 
-    database = providers.Singleton(
-        Database,
+    # /metrics 응답. 멀티 워커면 워커별 snapshot 파일을 합산한다
+    metrics_exporter = providers.Resource(
+        init_metrics_exporter,
+        directory=config.METRICS_MULTIPROCESS_DIR,
+        write_interval_seconds=config.METRICS_MULTIPROCESS_WRITE_SECONDS,
+        enabled=config.METRICS_ENABLED,
+    )
+
+    database = providers.Resource(
+        init_database,
         database_user=config.mssql_user,
         database_password=config.mssql_pass,
         database_host=config.mssql_host,
         database_port=config.mssql_port,
         database_name=config.mssql_db,
+        echo=config.mssql_echo,
+        pool_size=config.mssql_pool_size,
+        max_overflow=config.mssql_max_overflow,
+        pool_timeout=config.mssql_pool_timeout,
+        pool_recycle=config.mssql_pool_recycle,
+        pool_pre_ping=config.mssql_pool_pre_ping,
+        fast_executemany=config.mssql_fast_executemany,
+        statement_timeout=config.mssql_statement_timeout,
+        metrics_enabled=config.METRICS_ENABLED,
+    )
+
+    redis_client = providers.Resource(
+        provide_redis_client,
+        metrics_enabled=config.METRICS_ENABLED,
+        auto_pipeline=config.REDIS_AUTO_PIPELINE,
+        auto_pipeline_window_us=config.REDIS_AUTO_PIPELINE_WINDOW_US,
+        auto_pipeline_max_batch=config.REDIS_AUTO_PIPELINE_MAX_BATCH,
+    )
+
+    cache_invalidation_publisher = providers.Resource(
+        init_invalidation_publisher,
+        client=redis_client,
+        channel=config.NEAR_CACHE_INVALIDATION_CHANNEL,
+        interval_ms=config.NEAR_CACHE_INVALIDATION_INTERVAL_MS,
+        enabled=config.NEAR_CACHE_INVALIDATION_ENABLED,
     )
 
-    redis_client = providers.Resource(provide_redis_client)
\ No newline at end of file
+    # ---- 읽기 전용 replica (설정이 없으면 라우터가 항상 primary를 돌려준다) ----
+
+    redis_replica_clients = providers.Resource(
+        provide_redis_replica_clients,
+        urls=config.REDIS_REPLICA_URLS,
+        metrics_enabled=config.METRICS_ENABLED,
+        auto_pipeline=config.REDIS_AUTO_PIPELINE,
+        auto_pipeline_window_us=config.REDIS_AUTO_PIPELINE_WINDOW_US,
+        auto_pipeline_max_batch=config.REDIS_AUTO_PIPELINE_MAX_BATCH,
+    )
+
+    redis_read_router = providers.Resource(
+        init_replica_router,
+        primary=redis_client,
+        replicas=redis_replica_clients,
+        probe=probe_redis_replica,
+        max_lag=config.REDIS_REPLICA_MAX_LAG_BYTES,
+        check_interval_seconds=config.REPLICA_HEALTH_CHECK_SECONDS,
+        failover_errors=REDIS_FAILOVER_ERRORS,
+        name="redis",
+    )
+
+    database_replicas = providers.Resource(
+        init_database_replicas,
+        hosts=config.mssql_replica_hosts,
+        database_port=config.mssql_port,
+        database_user=config.mssql_user,
+        database_password=config.mssql_pass,
+        database_name=config.mssql_db,
+        echo=config.mssql_echo,
+        pool_size=config.mssql_pool_size,
+        max_overflow=config.mssql_max_overflow,
+        pool_timeout=config.mssql_pool_timeout,
+        pool_recycle=config.mssql_pool_recycle,
+        pool_pre_ping=config.mssql_pool_pre_ping,
+        fast_executemany=config.mssql_fast_executemany,
+        statement_timeout=config.mssql_statement_timeout,
+        metrics_enabled=config.METRICS_ENABLED,
+        lag_query=config.mssql_replica_lag_query,
+    )
+
+    database_read_router = providers.Resource(
+        init_replica_router,
+        primary=database,
+        replicas=database_replicas,
+        probe=probe_database_replica,
+        max_lag=config.mssql_replica_max_lag_seconds,
+        check_interval_seconds=config.REPLICA_HEALTH_CHECK_SECONDS,
+        name="mssql",
+    )
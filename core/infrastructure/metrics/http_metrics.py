@@ -0,0 +1,69 @@
+import time
+from typing import Dict
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.infrastructure.metrics.registry import REGISTRY
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    route template(/keywords/get_popular_searches 등) 단위 latency histogram 수집.
+    실제 path가 아닌 template을 label로 써서 label 수가 늘어나지 않게 한다.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths=("/metrics",)) -> None:
+        self.app = app
+        self.excluded_paths = set(excluded_paths)
+        self._endpoint_routes: Dict[object, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                scope["method"],
+                self._route_template(scope),
+                str(status_code),
+            )
+
+    def _route_template(self, scope: Scope) -> str:
+        # 라우팅이 끝나면 router가 scope에 route/endpoint를 채운다
+        route = scope.get("route")
+        if route is not None and hasattr(route, "path"):
+            return route.path
+
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        if endpoint not in self._endpoint_routes:
+            app = scope.get("app")
+            for candidate in getattr(app, "routes", []):
+                if getattr(candidate, "endpoint", None) is endpoint:
+                    self._endpoint_routes[endpoint] = candidate.path
+                    break
+            else:
+                self._endpoint_routes[endpoint] = UNMATCHED_ROUTE
+        return self._endpoint_routes[endpoint]
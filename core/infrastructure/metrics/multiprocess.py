@@ -0,0 +1,154 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.infrastructure.metrics.registry import (
+    REGISTRY,
+    CallbackGauge,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    _HistogramChild,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def clear_multiprocess_dir(directory: str) -> None:
+    """워커를 띄우기 전(master)에 이전 실행의 워커 파일을 지운다"""
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name.endswith(".json"):
+            os.remove(os.path.join(directory, name))
+
+
+def merge_snapshots(snapshots: Iterable[Tuple[str, Dict[str, dict], bool]]) -> str:
+    """
+    워커별 snapshot [(pid, snapshot, live), ...]를 합쳐 Prometheus 텍스트로 만든다.
+    counter/histogram은 label별로 더하고 (종료된 워커 값도 포함해 단조 증가 유지),
+    gauge는 워커 상태이므로 live 워커 값만 pid label을 붙여 그대로 낸다.
+    """
+    merged: Dict[str, object] = {}
+    gauges: Dict[str, Tuple[dict, List[Tuple[tuple, float]]]] = {}
+    for pid, snapshot, live in snapshots:
+        for name, data in snapshot.items():
+            kind = data["type"]
+            if kind == "gauge":
+                if live:
+                    _, rows = gauges.setdefault(name, (data, []))
+                    rows.extend((tuple(labels) + (pid,), value) for labels, value in data["values"])
+                continue
+            if kind == "counter":
+                counter = merged.setdefault(name, Counter(name, data["documentation"], data["labelnames"]))
+                for labels, value in data["values"]:
+                    counter.inc(*labels, amount=value)
+            elif kind == "histogram":
+                histogram = merged.setdefault(
+                    name, Histogram(name, data["documentation"], data["labelnames"], data["buckets"])
+                )
+                for labels, bucket_counts, total, count in data["values"]:
+                    child = histogram._children.setdefault(tuple(labels), _HistogramChild(len(histogram.buckets)))
+                    child.bucket_counts = [a + b for a, b in zip(child.bucket_counts, bucket_counts)]
+                    child.sum += total
+                    child.count += count
+
+    for name, (data, rows) in gauges.items():
+        merged[name] = CallbackGauge(name, data["documentation"], (*data["labelnames"], "pid"), lambda rows=rows: rows)
+
+    lines: List[str] = []
+    for metric in merged.values():
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """
+    /metrics 응답을 만든다.
+    - directory가 없으면 이 프로세스의 registry만 렌더링 (단일 워커 전용)
+    - directory가 있으면 워커마다 <pid>.json으로 snapshot을 주기적으로 쓰고, 요청을 받은 워커가
+      자기 snapshot을 갱신한 뒤 디렉터리 전체를 합산한다 (prometheus_client multiprocess 모드와 같은 방식).
+      다른 워커 값은 최대 write_interval 만큼 늦을 수 있다
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry = REGISTRY,
+        directory: Optional[str] = None,
+        write_interval_seconds: float = 5.0,
+    ) -> None:
+        self.registry = registry
+        self.directory = directory or None
+        self.write_interval = write_interval_seconds
+        self.pid = str(os.getpid())
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, f"{self.pid}.json")
+
+    def write(self) -> None:
+        if not self.directory:
+            return
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.registry.snapshot(), f)
+        # 읽는 쪽이 반쯤 쓴 파일을 보지 않도록 교체
+        os.replace(temp_path, self.path)
+
+    def render(self) -> str:
+        if not self.directory:
+            return self.registry.render()
+        self.write()
+        return merge_snapshots(self._read_snapshots())
+
+    def _read_snapshots(self):
+        # gauge는 최근에 snapshot을 쓴 (살아 있는) 워커 것만 쓴다
+        live_after = time.time() - self.write_interval * 3
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    snapshot = json.load(f)
+                modified = os.path.getmtime(path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"[metrics] 워커 snapshot을 읽지 못함 {name}: {str(e)}")
+                continue
+            yield name[: -len(".json")], snapshot, modified >= live_after
+
+
+async def init_metrics_exporter(directory: str = "", write_interval_seconds: float = 5.0, enabled: bool = True):
+    """MetricsExporter Resource. directory가 있으면 종료할 때까지 주기적으로 이 워커의 snapshot을 쓴다"""
+    exporter = MetricsExporter(REGISTRY, directory if enabled else None, write_interval_seconds)
+    if not exporter.directory:
+        yield exporter
+        return
+
+    os.makedirs(exporter.directory, exist_ok=True)
+
+    async def run() -> None:
+        while True:
+            try:
+                exporter.write()
+            except OSError as e:
+                logger.warning(f"[metrics] snapshot 쓰기 실패: {str(e)}")
+            await asyncio.sleep(exporter.write_interval)
+
+    task = asyncio.create_task(run(), name="metrics_snapshot_writer")
+    logger.info(f"[metrics] 멀티 프로세스 집계: {exporter.directory}")
+    try:
+        yield exporter
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        # 종료한 워커의 counter도 합계에 남도록 마지막 값을 쓴다
+        try:
+            exporter.write()
+        except OSError:
+            pass
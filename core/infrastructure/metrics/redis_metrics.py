@@ -0,0 +1,64 @@
+import time
+
+from core.infrastructure.metrics.registry import REGISTRY
+
+REDIS_COMMAND_DURATION = REGISTRY.histogram(
+    "redis_command_duration_seconds",
+    "Redis command latency (pipelines are recorded as PIPELINE)",
+    ("command",),
+)
+REDIS_COMMAND_ERRORS = REGISTRY.counter(
+    "redis_command_errors_total",
+    "Redis command errors",
+    ("command",),
+)
+REDIS_PIPELINE_COMMANDS = REGISTRY.counter(
+    "redis_pipeline_commands_total",
+    "Commands sent inside pipelines",
+)
+
+
+def instrument_redis(client):
+    """
+    redis.asyncio.Redis 인스턴스의 execute_command/pipeline을 감싸 latency와 에러를 기록한다.
+    인스턴스 속성만 바꾸므로 같은 커넥션 풀을 쓰는 다른 클라이언트에는 영향이 없다.
+    """
+    if getattr(client, "_metrics_instrumented", False):
+        return client
+
+    original_execute_command = client.execute_command
+    original_pipeline = client.pipeline
+
+    async def execute_command(*args, **options):
+        command = str(args[0]).upper()
+        start = time.perf_counter()
+        try:
+            return await original_execute_command(*args, **options)
+        except Exception:
+            REDIS_COMMAND_ERRORS.inc(command)
+            raise
+        finally:
+            REDIS_COMMAND_DURATION.observe(time.perf_counter() - start, command)
+
+    def pipeline(*args, **kwargs):
+        pipe = original_pipeline(*args, **kwargs)
+        original_execute = pipe.execute
+
+        async def execute(*execute_args, **execute_kwargs):
+            REDIS_PIPELINE_COMMANDS.inc(amount=len(pipe))
+            start = time.perf_counter()
+            try:
+                return await original_execute(*execute_args, **execute_kwargs)
+            except Exception:
+                REDIS_COMMAND_ERRORS.inc("PIPELINE")
+                raise
+            finally:
+                REDIS_COMMAND_DURATION.observe(time.perf_counter() - start, "PIPELINE")
+
+        pipe.execute = execute
+        return pipe
+
+    client.execute_command = execute_command
+    client.pipeline = pipeline
+    client._metrics_instrumented = True
+    return client
@@ -0,0 +1,188 @@
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 초 단위 latency 버킷 (0.5ms ~ 10s)
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def snapshot(self) -> dict:
+        return {
+            "type": "counter",
+            "documentation": self.documentation,
+            "labelnames": list(self.labelnames),
+            "values": [[list(labelvalues), value] for labelvalues, value in list(self._values.items())],
+        }
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for labelvalues, value in list(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class _HistogramChild:
+    __slots__ = ("bucket_counts", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        self.bucket_counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram:
+    """
+    버킷 경계를 미리 정해 두고 observe 시 해당 버킷 하나만 증가시키는 histogram.
+    누적(cumulative) 값은 렌더링할 때 계산한다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._children: Dict[LabelValues, _HistogramChild] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        child = self._children.get(labelvalues)
+        if child is None:
+            child = self._children.setdefault(labelvalues, _HistogramChild(len(self.buckets)))
+        child.bucket_counts[bisect_left(self.buckets, value)] += 1
+        child.sum += value
+        child.count += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "type": "histogram",
+            "documentation": self.documentation,
+            "labelnames": list(self.labelnames),
+            "buckets": list(self.buckets[:-1]),
+            "values": [
+                [list(labelvalues), list(child.bucket_counts), child.sum, child.count]
+                for labelvalues, child in list(self._children.items())
+            ],
+        }
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labelvalues, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, child.bucket_counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labelvalues, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class CallbackGauge:
+    """렌더링 시점에 callback을 호출해 값을 읽는 gauge. callback은 [(label values, value), ...] 반환"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Iterable[Tuple[LabelValues, float]]],
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def snapshot(self) -> dict:
+        return {
+            "type": "gauge",
+            "documentation": self.documentation,
+            "labelnames": list(self.labelnames),
+            "values": [[list(labelvalues), value] for labelvalues, value in self.callback()],
+        }
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        for labelvalues, value in self.callback():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets or DEFAULT_LATENCY_BUCKETS))
+
+    def gauge_callback(self, name: str, documentation: str, labelnames: Sequence[str], callback) -> CallbackGauge:
+        # 같은 이름이면 마지막 callback으로 교체 (재시작/재생성된 자원 반영)
+        gauge = CallbackGauge(name, documentation, labelnames, callback)
+        with self._lock:
+            self._metrics[name] = gauge
+        return gauge
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, dict]:
+        """프로세스 간 합산용 (JSON으로 저장 가능한) 현재 값"""
+        return {name: metric.snapshot() for name, metric in list(self._metrics.items())}
+
+
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,77 @@
+import time
+from typing import Dict
+
+from sqlalchemy import event
+
+from core.infrastructure.metrics.registry import REGISTRY
+
+SQL_STATEMENT_DURATION = REGISTRY.histogram(
+    "sql_statement_duration_seconds",
+    "SQL statement latency by database and statement type",
+    ("database", "statement"),
+)
+SQL_STATEMENT_ERRORS = REGISTRY.counter(
+    "sql_statement_errors_total",
+    "SQL statement errors by database and statement type",
+    ("database", "statement"),
+)
+DB_POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent acquiring a pooled DB connection",
+    ("database",),
+)
+
+_STATEMENT_TYPES = ("SELECT", "INSERT", "UPDATE", "DELETE", "MERGE", "WITH")
+
+# database 이름 -> PoolMetrics (pool gauge 렌더링용)
+_pools: Dict[str, object] = {}
+
+
+def _statement_type(statement: str) -> str:
+    head = statement.lstrip()[:6].upper()
+    for statement_type in _STATEMENT_TYPES:
+        if head.startswith(statement_type):
+            return statement_type
+    return "OTHER"
+
+
+def instrument_engine(engine, name: str = "primary") -> None:
+    """AsyncEngine의 cursor 실행 이벤트로 statement latency를 기록한다"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info["query_start_time"].pop()
+        SQL_STATEMENT_DURATION.observe(time.perf_counter() - start, name, _statement_type(statement))
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
+        SQL_STATEMENT_ERRORS.inc(name, _statement_type(exception_context.statement or ""))
+
+
+def register_pool_metrics(name: str, pool_metrics) -> None:
+    _pools[name] = pool_metrics
+
+
+def unregister_pool_metrics(name: str, pool_metrics=None) -> None:
+    # 다른 엔진이 같은 이름으로 다시 등록했으면 건드리지 않는다
+    if pool_metrics is None or _pools.get(name) is pool_metrics:
+        _pools.pop(name, None)
+
+
+def _pool_gauge(key: str):
+    def collect():
+        return [((name,), metrics.stats()[key]) for name, metrics in list(_pools.items())]
+    return collect
+
+
+REGISTRY.gauge_callback("db_pool_size", "Configured pool size", ("database",), _pool_gauge("pool_size"))
+REGISTRY.gauge_callback("db_pool_in_use", "Checked-out connections", ("database",), _pool_gauge("in_use"))
+REGISTRY.gauge_callback("db_pool_overflow", "Overflow connections in use", ("database",), _pool_gauge("overflow"))
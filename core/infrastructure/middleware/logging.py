@@ -1,66 +1,142 @@
 import logging
+import queue
+import random
 import time
-import json
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
-
-class AccessLoggingMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
-        self.logger = logging.getLogger("api.access")
-
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        req_body = await self._get_request_body(request)
-        client_host = request.client.host if request.client else "unknown"
-
-        self.logger.info(
-            f"[REQUEST] {request.method} {request.url.path} | "
-            f"From: {client_host} | Body: {req_body}"
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ACCESS_LOGGER_NAME = "api.access"
+
+_listener: Optional[QueueListener] = None
+
+
+class _RecordQueueHandler(QueueHandler):
+    # 같은 프로세스 안의 queue로만 보내므로 event loop에서 포맷하지 않고 record를 그대로 넘긴다
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def start_access_log_listener() -> None:
+    """access logger의 handler를 queue 뒤로 옮겨 로그 I/O가 event loop를 막지 않도록 한다"""
+    global _listener
+    if _listener is not None:
+        return
+
+    logger = logging.getLogger(ACCESS_LOGGER_NAME)
+    handlers = list(logger.handlers)
+    if not handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+        handlers = [handler]
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(_RecordQueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_access_log_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()  # 남은 record를 모두 처리한 뒤 종료
+        _listener = None
+
+
+class AccessLoggingMiddleware:
+    """
+    BaseHTTPMiddleware를 거치지 않는 순수 ASGI access log 미들웨어.
+    method/path/status/소요시간은 항상 남기고, body는 샘플링된 요청이나 에러 응답일 때만
+    앞부분(max_body_bytes)만 남긴다. body를 통째로 읽어 두지 않는다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 0.0,
+        route_sample_rates: Optional[Dict[str, float]] = None,
+        max_body_bytes: int = 300,
+    ):
+        self.app = app
+        self.logger = logging.getLogger(ACCESS_LOGGER_NAME)
+        self.sample_rate = sample_rate
+        # 긴 prefix가 먼저 매칭되도록 정렬
+        self.route_sample_rates = sorted(
+            (route_sample_rates or {}).items(), key=lambda item: len(item[0]), reverse=True
         )
+        self.max_body_bytes = max_body_bytes
 
-        try:
-            response = await call_next(request)
-            duration = int((time.time() - start_time) * 1000)
-            resp_body = await self._get_response_body(response)
-            self.logger.info(
-                f"[RESPONSE] {request.method} {request.url.path} | "
-                f"Status: {response.status_code} | Time: {duration}ms | Body: {resp_body}"
-            )
-            return response
+    def _sample_rate_for(self, path: str) -> float:
+        for prefix, rate in self.route_sample_rates:
+            if path.startswith(prefix):
+                return rate
+        return self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method, path = scope["method"], scope["path"]
+        rate = self._sample_rate_for(path)
+        sampled = rate > 0 and (rate >= 1 or random.random() < rate)
+        limit = self.max_body_bytes
+
+        status_code = 500
+        req_body = bytearray()
+        resp_body = bytearray()
+        capture_response = sampled
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request" and len(req_body) < limit:
+                req_body.extend(message.get("body", b"")[: limit - len(req_body)])
+            return message
 
-        except Exception as e:
-            duration = int((time.time() - start_time) * 1000)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, capture_response
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                capture_response = sampled or status_code >= 400
+            elif message["type"] == "http.response.body" and capture_response and len(resp_body) < limit:
+                resp_body.extend(message.get("body", b"")[: limit - len(resp_body)])
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except Exception:
+            duration = int((time.perf_counter() - start_time) * 1000)
             self.logger.exception(
-                f"[ERROR] {request.method} {request.url.path} | "
-                f"Error: {str(e)} | Time: {duration}ms"
+                "[ERROR] %s %s | From: %s | Time: %dms | Body: %s",
+                method, path, _client_host(scope), duration, _decode(req_body),
             )
             raise
 
-    async def _get_request_body(self, request: Request):
-        try:
-            body = await request.body()
+        duration = int((time.perf_counter() - start_time) * 1000)
+        if capture_response:
+            self.logger.info(
+                "[ACCESS] %s %s | From: %s | Status: %d | Time: %dms | Request: %s | Response: %s",
+                method, path, _client_host(scope), status_code, duration,
+                _decode(req_body), _decode(resp_body),
+            )
+        else:
+            self.logger.info(
+                "[ACCESS] %s %s | From: %s | Status: %d | Time: %dms",
+                method, path, _client_host(scope), status_code, duration,
+            )
 
-            try:
-                parsed = json.loads(body.decode())
-                return json.dumps(parsed)[:300]
-            except Exception:
-                return body.decode()[:300]
-        except Exception:
-            return "[unavailable]"
 
-    async def _get_response_body(self, response: Response):
+def _client_host(scope: Scope) -> str:
+    client = scope.get("client")
+    return client[0] if client else "unknown"
 
-        if hasattr(response, "body_iterator"):
-            return "[streaming/large body]"
-        try:
-            body = b""
-            async for chunk in response.body_iterator:
-                body += chunk
-                if len(body) > 512:
-                    break
-            return body.decode(errors="ignore")[:300]
-        except Exception:
-            return "[unavailable]"
+
+def _decode(body: bytearray) -> str:
+    return bytes(body).decode(errors="ignore")
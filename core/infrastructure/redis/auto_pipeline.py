@@ -0,0 +1,140 @@
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from core.infrastructure.metrics.registry import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+REDIS_AUTOPIPELINE_BATCHES = REGISTRY.counter(
+    "redis_autopipeline_batches_total",
+    "Round trips sent by the auto-pipelining client",
+)
+REDIS_AUTOPIPELINE_COMMANDS = REGISTRY.counter(
+    "redis_autopipeline_commands_total",
+    "Commands coalesced by the auto-pipelining client",
+)
+
+# 커넥션 상태를 바꾸거나 응답을 오래 기다리는 명령은 묶지 않고 바로 보낸다
+UNBATCHED_COMMANDS = frozenset({
+    "WATCH", "UNWATCH", "MULTI", "EXEC", "DISCARD",
+    "SUBSCRIBE", "PSUBSCRIBE", "SSUBSCRIBE", "UNSUBSCRIBE", "PUNSUBSCRIBE", "SUNSUBSCRIBE", "MONITOR",
+    "BLPOP", "BRPOP", "BRPOPLPUSH", "BLMOVE", "BLMPOP", "BZPOPMIN", "BZPOPMAX", "BZMPOP",
+    "XREAD", "XREADGROUP", "WAIT", "WAITAOF",
+    "SELECT", "AUTH", "HELLO", "CLIENT", "QUIT", "RESET",
+})
+
+_Pending = Tuple[tuple, dict, asyncio.Future]
+
+
+class AutoPipelineRedis(aioredis.Redis):
+    """
+    같은 이벤트 루프 tick(또는 window_us 안)에 들어온 단일 명령들을 pipeline 하나로 묶어 보내는 클라이언트.
+    원래 클라이언트와 connection pool을 공유하며, 호출하는 쪽은 일반 Redis처럼 await 하면 자기 응답을 받는다.
+    명시적인 pipeline()/트랜잭션과 blocking/pubsub 명령은 그대로 동작한다.
+    """
+
+    def __init__(self, client: aioredis.Redis, window_us: int = 0, max_batch: int = 512) -> None:
+        super().__init__(connection_pool=client.connection_pool)
+        self.window = window_us / 1_000_000
+        self.max_batch = max_batch
+        self._pending: List[_Pending] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._tasks = set()
+
+        self.commands = 0
+        self.batches = 0
+        self.max_batch_seen = 0
+
+    async def execute_command(self, *args, **options):
+        if str(args[0]).upper() in UNBATCHED_COMMANDS:
+            return await super().execute_command(*args, **options)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((args, options, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            # 지금 실행 중인 다른 코루틴들이 명령을 더 쌓을 수 있도록 다음 tick(또는 window 뒤)에 보낸다
+            if self.window > 0:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[_Pending]) -> None:
+        self.commands += len(batch)
+        self.batches += 1
+        self.max_batch_seen = max(self.max_batch_seen, len(batch))
+        REDIS_AUTOPIPELINE_COMMANDS.inc(amount=len(batch))
+        REDIS_AUTOPIPELINE_BATCHES.inc()
+
+        if len(batch) == 1:
+            args, options, future = batch[0]
+            try:
+                result = await super().execute_command(*args, **options)
+            except BaseException as e:
+                _set_exception(future, e)
+            else:
+                _set_result(future, result)
+            return
+
+        try:
+            # instrument_redis가 인스턴스의 pipeline()을 감싸므로 클래스 메서드를 직접 불러 이중 집계를 피한다
+            # (묶인 명령은 호출한 쪽의 execute_command에서 이미 하나씩 기록됨)
+            async with aioredis.Redis.pipeline(self, transaction=False) as pipe:
+                for args, options, _ in batch:
+                    pipe.execute_command(*args, **options)
+                results = await pipe.execute(raise_on_error=False)
+        except BaseException as e:
+            # 연결 오류 등 pipeline 전체 실패는 묶인 호출 모두에 전달
+            for _, _, future in batch:
+                _set_exception(future, e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                _set_exception(future, result)
+            else:
+                _set_result(future, result)
+
+    async def drain(self) -> None:
+        """대기 중인 명령을 모두 보내고 끝날 때까지 기다린다 (종료 전 호출)"""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "commands": self.commands,
+            "batches": self.batches,
+            "avg_batch": round(self.commands / self.batches, 2) if self.batches else 0.0,
+            "max_batch": self.max_batch_seen,
+            "window_us": int(self.window * 1_000_000),
+        }
+
+
+def _set_result(future: asyncio.Future, result) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, error: BaseException) -> None:
+    if not future.done():
+        future.set_exception(error)
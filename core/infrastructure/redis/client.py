@@ -1,53 +1,94 @@
 import redis.asyncio as aioredis
-from fastapi import FastAPI
-from core.setting.settings import settings
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+from core.setting.settings import get_settings
 import logging
 import asyncio
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 logger = logging.getLogger(__name__)
 
 class RedisClient:
-    _instance: Optional[aioredis.Redis] = None
-    _lock = asyncio.Lock()  # 동시성 제어를 위한 락 추가
+    """
+    이벤트 루프별 redis 클라이언트.
+    redis.asyncio 커넥션은 만든 루프에서만 쓸 수 있으므로 워커(루프)마다 따로 만들고,
+    락도 클래스 정의 시점이 아니라 해당 루프에서 처음 필요할 때 만든다.
+    """
+    _instances: Dict[asyncio.AbstractEventLoop, aioredis.Redis] = {}
+    _locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+    @classmethod
+    def _current_lock(cls) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        # 닫힌 루프(reload, 테스트 등)의 흔적은 정리
+        for stale in [stale for stale in cls._locks if stale.is_closed()]:
+            cls._locks.pop(stale, None)
+            cls._instances.pop(stale, None)
+        lock = cls._locks.get(loop)
+        if lock is None:
+            lock = cls._locks[loop] = asyncio.Lock()
+        return lock
 
     @classmethod
     async def get_instance(cls) -> aioredis.Redis:
-        async with cls._lock:
-            if cls._instance is None:
+        async with cls._current_lock():
+            loop = asyncio.get_running_loop()
+            instance = cls._instances.get(loop)
+            if instance is None:
                 try:
                     logger.info("Redis 연결 초기화 중...")
-                    cls._instance = await aioredis.from_url(
+                    settings = get_settings()
+                    instance = aioredis.from_url(
                         f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
                         db=settings.REDIS_DB,
                         password=settings.REDIS_PASSWORD,
                         encoding="utf-8",
                         decode_responses=True
                     )
-                    await cls._instance.ping()
+                    await instance.ping()
+                    cls._instances[loop] = instance
                     logger.info("Redis 연결 성공")
                 except Exception as e:
                     logger.error(f"Redis 연결 실패: {str(e)}")
-                    cls._instance = None  # 실패 시 None으로 설정
                     raise
 
-            return cls._instance
+            return instance
 
     @classmethod
     async def close(cls) -> None:
-        async with cls._lock:
-            if cls._instance:
+        async with cls._current_lock():
+            instance = cls._instances.pop(asyncio.get_running_loop(), None)
+            if instance:
                 try:
                     logger.info("Redis 연결 종료 중...")
-                    await cls._instance.close()
-                    cls._instance = None
+                    await instance.aclose()
                     logger.info("Redis 연결 종료 완료")
                 except Exception as e:
                     logger.error(f"Redis 연결 종료 중 오류 발생: {str(e)}")
                     raise
 
 
-def setup_redis(app: FastAPI) -> None:
+# replica 읽기 실패 시 primary로 다시 읽을 오류
+REDIS_FAILOVER_ERRORS = (RedisConnectionError, RedisTimeoutError, OSError)
+
+
+async def probe_redis_replica(replica: aioredis.Redis, primary: aioredis.Redis) -> Optional[float]:
+    """
+    replica 복제 상태 확인. master 링크가 끊겼거나 동기화 중이면 예외,
+    정상이면 primary와의 복제 offset 차이(bytes)를 돌려준다.
+    """
+    info = await replica.info("replication")
+    if info.get("role") not in ("slave", "replica"):
+        return 0.0  # 승격된 replica 등 - 읽기엔 문제 없음
+    if info.get("master_link_status") != "up" or int(info.get("master_sync_in_progress", 0)):
+        raise RedisConnectionError(f"replication link {info.get('master_link_status')}")
+    primary_info = await primary.info("replication")
+    return float(max(int(primary_info.get("master_repl_offset", 0)) - int(info.get("slave_repl_offset", 0)), 0))
+
+
+def setup_redis(app: "FastAPI") -> None:
     @app.on_event("startup")
     async def startup_redis_client() -> None:
         app.state.redis = await RedisClient.get_instance()
@@ -0,0 +1,183 @@
+import asyncio
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from core.infrastructure.metrics.registry import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# replica 상태 확인 probe(replica, primary): 정상이면 복제 지연(모르면 None)을 돌려주고 비정상이면 예외.
+# 지연 단위는 probe가 정한다 (redis: 복제 offset bytes, MSSQL: 초) - max_lag도 같은 단위
+Probe = Callable[[T, T], Awaitable[Optional[float]]]
+
+REPLICA_READS = REGISTRY.counter(
+    "replica_reads_total",
+    "Reads routed by the replica router",
+    ("router", "target"),
+)
+REPLICA_FALLBACKS = REGISTRY.counter(
+    "replica_read_fallbacks_total",
+    "Replica reads that failed and were retried on the primary",
+    ("router",),
+)
+
+
+class ReplicaRouter(Generic[T]):
+    """
+    읽기 전용 요청을 replica로 보내는 라우터.
+    - refresh()가 주기적으로 replica health/lag를 확인하고 정상인 replica만 round-robin 대상으로 둔다
+    - 정상 replica가 없거나 replica 읽기가 연결 오류로 실패하면 primary에서 읽는다
+    """
+
+    def __init__(
+        self,
+        primary: T,
+        replicas: Sequence[T],
+        probe: Probe,
+        max_lag: float = 5.0,
+        failover_errors: Tuple[Type[BaseException], ...] = (ConnectionError, OSError, asyncio.TimeoutError),
+        name: str = "replica",
+    ) -> None:
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.probe = probe
+        self.max_lag = max_lag
+        self.failover_errors = failover_errors
+        self.name = name
+        self._healthy: List[T] = []
+        self._cycle = itertools.cycle([])
+        self._status: Dict[int, dict] = {}
+        self.fallbacks = 0
+
+    def _set_healthy(self, healthy: List[T]) -> None:
+        self._healthy = healthy
+        self._cycle = itertools.cycle(healthy)
+
+    async def refresh(self) -> int:
+        """모든 replica를 확인해 정상 목록을 갱신하고 정상 replica 수를 돌려준다"""
+        if not self.replicas:
+            return 0
+        results = await asyncio.gather(*(self.probe(replica, self.primary) for replica in self.replicas), return_exceptions=True)
+        healthy = []
+        for index, (replica, result) in enumerate(zip(self.replicas, results)):
+            if isinstance(result, BaseException):
+                status = {"healthy": False, "lag": None, "error": str(result)}
+            elif result is not None and result > self.max_lag:
+                status = {"healthy": False, "lag": result, "error": "lag"}
+            else:
+                status = {"healthy": True, "lag": result, "error": None}
+                healthy.append(replica)
+            if self._status.get(index, {}).get("healthy") != status["healthy"]:
+                log = logger.info if status["healthy"] else logger.warning
+                log(f"[{self.name}] replica#{index} {'정상' if status['healthy'] else '제외'}: {status}")
+            self._status[index] = status
+        self._set_healthy(healthy)
+        return len(healthy)
+
+    def choose(self) -> T:
+        """읽기 대상: 정상 replica 중 round-robin, 없으면 primary"""
+        if not self._healthy:
+            return self.primary
+        return next(self._cycle)
+
+    def mark_failed(self, replica: T, error: BaseException) -> None:
+        # 다음 refresh까지 후보에서 뺀다
+        self.fallbacks += 1
+        REPLICA_FALLBACKS.inc(self.name)
+        if replica in self._healthy:
+            self._set_healthy([target for target in self._healthy if target is not replica])
+            logger.warning(f"[{self.name}] replica 읽기 실패로 primary 사용: {error}")
+
+    def _target_label(self, target: T) -> str:
+        return "primary" if target is self.primary else "replica"
+
+    async def run(self, operation: Callable[[T], Awaitable[R]]) -> R:
+        """operation(target)을 replica에서 실행하고 연결 오류면 primary에서 다시 실행"""
+        target = self.choose()
+        REPLICA_READS.inc(self.name, self._target_label(target))
+        if target is self.primary:
+            return await operation(target)
+        try:
+            return await operation(target)
+        except self.failover_errors as e:
+            self.mark_failed(target, e)
+        return await operation(self.primary)
+
+    @asynccontextmanager
+    async def session(self):
+        """
+        session()을 가진 대상(Database)용 읽기 세션.
+        replica 연결에 실패하면 primary 세션을 연다. 세션을 넘겨준 뒤의 예외는 그대로 올린다.
+        """
+        target = self.choose()
+        REPLICA_READS.inc(self.name, self._target_label(target))
+        if target is not self.primary:
+            entered = False
+            try:
+                async with target.session() as session:
+                    entered = True
+                    yield session
+                return
+            except Exception as e:
+                if entered:
+                    raise
+                self.mark_failed(target, e)
+        async with self.primary.session() as session:
+            yield session
+
+    def stats(self) -> dict:
+        return {
+            "replicas": len(self.replicas),
+            "healthy": len(self._healthy),
+            "max_lag": self.max_lag,
+            "fallbacks": self.fallbacks,
+            "status": [self._status.get(index) for index in range(len(self.replicas))],
+        }
+
+
+async def init_replica_router(
+    primary,
+    replicas: Sequence,
+    probe: Probe,
+    max_lag: float = 5.0,
+    check_interval_seconds: float = 5.0,
+    failover_errors: Optional[Tuple[Type[BaseException], ...]] = None,
+    name: str = "replica",
+):
+    """
+    ReplicaRouter Resource. 시작 시 한 번 확인한 뒤 check_interval_seconds마다 replica 상태를 갱신한다.
+    replica가 없으면 항상 primary를 돌려주는 라우터가 된다.
+    """
+    kwargs = {"failover_errors": failover_errors} if failover_errors else {}
+    router = ReplicaRouter(primary, replicas, probe, max_lag=max_lag, name=name, **kwargs)
+    if not router.replicas:
+        yield router
+        return
+
+    await router.refresh()
+
+    async def run() -> None:
+        while True:
+            await asyncio.sleep(check_interval_seconds)
+            try:
+                await router.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(f"[{name}] replica 상태 확인 실패")
+
+    task = asyncio.create_task(run(), name=f"{name}_health_check")
+    logger.info(f"[{name}] replica {len(router.replicas)}개 (정상 {len(router._healthy)}개)")
+    try:
+        yield router
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
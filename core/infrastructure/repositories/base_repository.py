@@ -1,8 +1,11 @@
+import base64
+import binascii
+import json
 from abc import ABC, abstractmethod
 from contextlib import AbstractAsyncContextManager
-from typing import Callable, Generic, List, Type, TypeVar, Optional
+from typing import Any, AsyncIterator, Callable, Generic, List, Sequence, Tuple, Type, TypeVar, Optional
 
-from sqlalchemy import insert, select
+from sqlalchemy import and_, delete, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.infrastructure.entities.entity import Entity
@@ -14,7 +17,44 @@ CreateEntity = TypeVar("CreateEntity", bound=Entity)
 ReturnEntity = TypeVar("ReturnEntity", bound=Entity)
 UpdateEntity = TypeVar("UpdateEntity", bound=Entity)
 
+
+def encode_cursor(sort_key: str, descending: bool, values: Sequence[Any]) -> str:
+    """마지막 행의 (정렬 값, id)를 담은 불투명 cursor. 날짜/Decimal 등은 문자열로 담는다"""
+    payload = {"k": sort_key, "d": descending, "v": list(values)}
+    raw = json.dumps(payload, default=str, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str, descending: bool, columns) -> List[Any]:
+    """encode_cursor의 역. 다른 정렬 조건으로 만든 cursor나 깨진 cursor는 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = payload["v"]
+        matches = payload["k"] == sort_key and payload["d"] == descending and len(values) == len(columns)
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise ValueError("invalid cursor")
+    if not matches:
+        raise ValueError("cursor does not match the requested sort order")
+    return [_restore_cursor_value(column, value) for column, value in zip(columns, values)]
+
+
+def _restore_cursor_value(column, value):
+    python_type = column.type.python_type
+    if value is None or isinstance(value, python_type):
+        return value
+    try:
+        if hasattr(python_type, "fromisoformat"):  # date, datetime, time
+            return python_type.fromisoformat(value)
+        return python_type(value)
+    except (TypeError, ValueError):
+        raise ValueError("invalid cursor")
+
+
 class BaseRepository(ABC, Generic[CreateEntity, ReturnEntity, UpdateEntity]):
+    # create_datas가 INSERT 한 번에 보내는 최대 행 수 (MSSQL 파라미터 제한에 걸리면 더 잘게 나뉜다)
+    bulk_insert_chunk_size: int = 1000
+
     def __init__(self, session_factory: SessionFactory) -> None:
         self.session_factory = session_factory
 
@@ -32,22 +72,32 @@ class BaseRepository(ABC, Generic[CreateEntity, ReturnEntity, UpdateEntity]):
         return self.entity_cls(**vars(orm_obj))
 
     async def create_data(self, create_data: CreateEntity) -> ReturnEntity:
+        # INSERT ... OUTPUT inserted.* 한 번으로 DB 기본값/identity까지 받아온다 (refresh 없음)
         async with self.session_factory() as session:
-            orm_obj = self.model(**create_data.model_dump(exclude_none=True))
-            session.add(orm_obj)
+            statement = insert(self.model).values(**create_data.model_dump(exclude_none=True)).returning(self.model)
+            entity = self._to_entity((await session.scalars(statement)).one())
             await session.commit()
-            await session.refresh(orm_obj)
-        return self._to_entity(orm_obj)
+        return entity
 
-    async def create_datas(self, create_datas: List[CreateEntity]) -> List[ReturnEntity]:
+    async def create_datas(
+        self, create_datas: List[CreateEntity], chunk_size: Optional[int] = None
+    ) -> List[ReturnEntity]:
+        """
+        executemany(insertmanyvalues)로 chunk_size 행씩 INSERT ... OUTPUT 하고
+        입력 순서대로 결과를 돌려준다. 다시 SELECT 하지 않는다.
+        """
+        if not create_datas:
+            return []
+        values = [cd.model_dump(exclude_none=True) for cd in create_datas]
+        statement = (
+            insert(self.model)
+            .returning(self.model, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=chunk_size or self.bulk_insert_chunk_size)
+        )
         async with self.session_factory() as session:
-            values = [cd.model_dump(exclude_none=True) for cd in create_datas]
-            result = await session.execute(insert(self.model).values(values))
+            entities = [self._to_entity(obj) for obj in await session.scalars(statement, values)]
             await session.commit()
-            
-            ids = [row[0] for row in result.inserted_primary_key_rows]
-            result = await session.execute(select(self.model).where(self.model.id.in_(ids)))
-            return [self._to_entity(obj) for obj in result.scalars().all()]
+        return entities
 
     async def get_datas(self, page: int, page_size: int) -> List[ReturnEntity]:
         async with self.session_factory() as session:
@@ -56,6 +106,81 @@ class BaseRepository(ABC, Generic[CreateEntity, ReturnEntity, UpdateEntity]):
             )
             return [self._to_entity(obj) for obj in result.scalars().all()]
 
+    async def get_datas_by_cursor(
+        self,
+        page_size: int,
+        cursor: Optional[str] = None,
+        sort_key: str = "id",
+        descending: bool = False,
+        filters: Sequence = (),
+    ) -> Tuple[List[ReturnEntity], Optional[str]]:
+        """
+        keyset(seek) 페이지네이션. OFFSET 없이 (sort_key, id)가 cursor 다음인 행부터 읽으므로
+        몇 번째 페이지든 비용이 같다. (sort_key, id) 인덱스가 있어야 하고 sort_key는 NULL이 없어야 한다.
+        다음 페이지가 없으면 next_cursor는 None.
+        """
+        columns = self._cursor_columns(sort_key)
+        query = select(self.model).where(*filters)
+        if cursor:
+            after = decode_cursor(cursor, sort_key, descending, columns)
+            query = query.where(self._after_cursor(columns, after, descending))
+        query = query.order_by(*(c.desc() if descending else c.asc() for c in columns)).limit(page_size + 1)
+
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            objs = result.scalars().all()
+
+        next_cursor = None
+        if len(objs) > page_size:
+            objs = objs[:page_size]
+            last = objs[-1]
+            mapper = self.model.__mapper__
+            values = [getattr(last, mapper.get_property_by_column(c).key) for c in columns]
+            next_cursor = encode_cursor(sort_key, descending, values)
+        return [self._to_entity(obj) for obj in objs], next_cursor
+
+    async def stream(
+        self,
+        batch_size: int = 1000,
+        sort_key: str = "id",
+        filters: Sequence = (),
+    ) -> AsyncIterator[ReturnEntity]:
+        """
+        서버 측 cursor(stream_scalars)로 batch_size 행씩 받아 한 건씩 돌려준다.
+        전체를 메모리에 올리지 않으므로 export 같은 대량 순회에 쓴다.
+        중간에 멈추면 generator가 닫힐 때까지 session(커넥션)을 계속 잡고 있으므로,
+        끝까지 읽지 않을 수 있는 쪽은 contextlib.aclosing(repository.stream(...))으로 감싸 쓴다.
+        """
+        columns = self._cursor_columns(sort_key)
+        query = select(self.model).where(*filters).order_by(*columns).execution_options(yield_per=batch_size)
+        async with self.session_factory() as session:
+            result = await session.stream_scalars(query)
+            async for obj in result:
+                yield self._to_entity(obj)
+
+    def _cursor_columns(self, sort_key: str):
+        # id를 마지막 정렬 키로 붙여 정렬 값이 같은 행도 순서가 정해지게 한다
+        if sort_key not in self.model.__table__.columns:
+            raise ValueError(f"unknown sort key: {sort_key}")
+        columns = [self.model.__table__.columns[sort_key]]
+        if sort_key != "id":
+            columns.append(self.model.__table__.columns["id"])
+        return columns
+
+    @staticmethod
+    def _after_cursor(columns, values, descending):
+        # MSSQL은 (a, b) > (x, y) 행 값 비교를 지원하지 않아 OR/AND로 풀어 쓴다
+        conditions = []
+        for i, column in enumerate(columns):
+            beyond = column < values[i] if descending else column > values[i]
+            conditions.append(and_(*(c == v for c, v in zip(columns[:i], values[:i])), beyond))
+        if len(columns) == 1:
+            return conditions[0]
+        # OR만 있으면 SQL Server가 seek 범위를 못 잡아 인덱스를 처음부터 훑는다.
+        # 결과는 같은 중복 조건 a >= x (내림차순은 a <= x)를 앞에 붙여 seek predicate로 쓰게 한다
+        leading = columns[0] <= values[0] if descending else columns[0] >= values[0]
+        return and_(leading, or_(*conditions))
+
     async def get_data_by_data_id(self, data_id: int) -> Optional[ReturnEntity]:
         async with self.session_factory() as session:
             result = await session.execute(select(self.model).filter(self.model.id == data_id))
@@ -73,23 +198,32 @@ class BaseRepository(ABC, Generic[CreateEntity, ReturnEntity, UpdateEntity]):
             return [self._to_entity(obj) for obj in result.scalars().all()]
 
     async def update_data_by_data_id(self, data_id: int, update_data: UpdateEntity) -> Optional[ReturnEntity]:
+        values = update_data.model_dump(exclude_none=True)
+        if not values:  # 바꿀 값이 없으면 UPDATE 대신 현재 행을 돌려준다
+            return await self.get_data_by_data_id(data_id)
+        # UPDATE ... OUTPUT inserted.* 한 번으로 조회/수정/재조회를 대신한다 (행이 없으면 None)
+        statement = (
+            update(self.model)
+            .where(self.model.id == data_id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
         async with self.session_factory() as session:
-            result = await session.execute(select(self.model).filter(self.model.id == data_id))
-            obj = result.scalar_one_or_none()
-            if not obj:
-                return None
-            for key, value in update_data.model_dump(exclude_none=True).items():
-                setattr(obj, key, value)
+            obj = (await session.scalars(statement)).one_or_none()
+            entity = self._to_entity(obj) if obj else None
             await session.commit()
-            await session.refresh(obj)
-        return self._to_entity(obj)
+        return entity
 
     async def delete_data_by_data_id(self, data_id: int) -> bool:
+        # DELETE ... OUTPUT deleted.id: 지운 행이 있었는지 같은 round trip에서 안다
+        statement = (
+            delete(self.model)
+            .where(self.model.id == data_id)
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
         async with self.session_factory() as session:
-            result = await session.execute(select(self.model).filter(self.model.id == data_id))
-            obj = result.scalar_one_or_none()
-            if not obj:
-                return False
-            await session.delete(obj)
+            deleted = (await session.scalars(statement)).one_or_none()
             await session.commit()
-            return True
+        return deleted is not None
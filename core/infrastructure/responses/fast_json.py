@@ -0,0 +1,58 @@
+import json
+import logging
+from typing import Any
+
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson을 못 쓰면 표준 json으로 (느리지만 동작은 같다)
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _default(obj: Any):
+    # alias/field serializer/중첩 모델이 response_model과 같은 모양으로 나오도록 pydantic 직렬화를 쓴다
+    # (검증은 하지 않는다)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def check_fast_json() -> bool:
+    """
+    orjson은 pyproject 의존성이지만 import에 실패해도 (wheel이 없는 플랫폼 등) 표준 json으로 동작한다.
+    그 경우 응답 직렬화가 느려지므로 기동 시 한 번 경고한다
+    """
+    if orjson is None:
+        logger.warning("orjson이 설치되지 않아 FastJSONResponse가 표준 json으로 직렬화합니다")
+        return False
+    return True
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    검증 없이 바로 직렬화하는 JSON 응답 (신뢰하는 내부 데이터 전용).
+
+    라우트가 이 응답 객체를 직접 반환하면 FastAPI는 response_model 검증과 jsonable_encoder를
+    건너뛴다. 데코레이터의 response_model은 OpenAPI 스키마 용도로만 남겨 둔다.
+
+        @router.get("/items", response_model=List[ItemDto], response_class=FastJSONResponse)
+        async def items():
+            return FastJSONResponse(await service.items())
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,64 @@
+import heapq
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy hitter sketch (Metwally et al.).
+    capacity 개의 counter만 유지하며, 가득 차면 가장 작은 counter를 새 항목에 넘겨준다.
+    추정값은 실제값 이상이고 오차는 넘겨받은 최소값(error) 이하이다.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._counts: Dict[Hashable, int] = {}
+        self._errors: Dict[Hashable, int] = {}
+        # (count, item) lazy min-heap. 갱신된 항목은 새로 push 하고 꺼낼 때 오래된 값을 버린다
+        self._heap: List[Tuple[int, Hashable]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._counts
+
+    def offer(self, item: Hashable, amount: int = 1) -> Tuple[int, Optional[Hashable]]:
+        """item을 amount 만큼 세고 (추정 count, 밀려난 item)을 반환"""
+        evicted = None
+        if item in self._counts:
+            self._counts[item] += amount
+        elif len(self._counts) < self.capacity:
+            self._counts[item] = amount
+            self._errors[item] = 0
+        else:
+            min_count, evicted = self._pop_min()
+            del self._counts[evicted]
+            del self._errors[evicted]
+            self._counts[item] = min_count + amount
+            self._errors[item] = min_count
+
+        heapq.heappush(self._heap, (self._counts[item], item))
+        if len(self._heap) > self.capacity * 4:
+            self._compact()
+        return self._counts[item], evicted
+
+    def _pop_min(self) -> Tuple[int, Hashable]:
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self._counts.get(item) == count:
+                return count, item
+
+    def _compact(self) -> None:
+        self._heap = [(count, item) for item, count in self._counts.items()]
+        heapq.heapify(self._heap)
+
+    def estimate(self, item: Hashable) -> int:
+        return self._counts.get(item, 0)
+
+    def error(self, item: Hashable) -> int:
+        return self._errors.get(item, 0)
+
+    def top(self, k: int) -> List[Tuple[Hashable, int]]:
+        return heapq.nlargest(k, self._counts.items(), key=lambda entry: entry[1])
@@ -0,0 +1,37 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+async def init_periodic_task(
+    job: Callable[[], Awaitable[object]],
+    interval_seconds: float,
+    name: str = "periodic_task",
+):
+    """
+    job을 interval_seconds 간격으로 반복 실행하는 백그라운드 작업 Resource.
+    job 예외는 로그만 남기고 다음 주기에 다시 시도한다.
+    """
+    async def run() -> None:
+        while True:
+            try:
+                await job()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(f"[{name}] 주기 작업 실패")
+            await asyncio.sleep(interval_seconds)
+
+    task = asyncio.create_task(run(), name=name)
+    logger.info(f"[{name}] 주기 작업 시작 (interval={interval_seconds}s)")
+    try:
+        yield task
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info(f"[{name}] 주기 작업 종료")
@@ -0,0 +1,58 @@
+import inspect
+import logging
+import time
+from typing import Awaitable, Callable, Dict
+
+from dependency_injector import providers
+
+logger = logging.getLogger(__name__)
+
+
+async def init_startup_task(
+    job: Callable[[], Awaitable[object]],
+    enabled: bool = True,
+    name: str = "startup_task",
+):
+    """
+    lifespan 시작 시 한 번 실행되는 작업 Resource.
+    실패해도 서버 기동은 막지 않고 로그만 남긴다.
+    """
+    if not enabled:
+        return None
+
+    start = time.monotonic()
+    try:
+        result = await job()
+    except Exception:
+        logger.exception(f"[{name}] 시작 작업 실패")
+        return None
+    logger.info(f"[{name}] 시작 작업 완료 ({int((time.monotonic() - start) * 1000)}ms): {result}")
+    return result
+
+
+async def init_resources_timed(container) -> Dict[str, float]:
+    """
+    container.init_resources()와 같지만 Resource를 하나씩 초기화하며 provider별 소요 시간(ms)을 잰다.
+    먼저 필요한 다른 Resource는 그 자리에서 함께 초기화되므로 요청한 provider 시간에 포함된다.
+    """
+    timings = {}
+    for name, provider in container.providers.items():
+        if not isinstance(provider, providers.Resource) or provider.initialized:
+            continue
+        start = time.perf_counter()
+        result = provider.init()
+        if inspect.isawaitable(result):
+            await result
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+    return timings
+
+
+def check_startup_budget(timings: Dict[str, float], budget_ms: float = 0, name: str = "lifespan") -> bool:
+    """기동 시간을 로그로 남기고 예산(ms)을 넘었는지 돌려준다. budget_ms <= 0 이면 검사하지 않는다"""
+    total = round(sum(timings.values()), 1)
+    slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)
+    logger.info(f"[{name}] 초기화 {total}ms: {dict(slowest)}")
+    if budget_ms > 0 and total > budget_ms:
+        logger.warning(f"[{name}] 초기화 시간 {total}ms가 예산 {budget_ms}ms를 넘었습니다 (가장 느린 항목: {slowest[0]})")
+        return False
+    return True
@@ -0,0 +1,59 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Index, Integer, Unicode, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.infrastructure.database.database import Base
+
+
+class PopularSearches(Base):
+    __tablename__ = "PopularSearches"
+    __table_args__ = (
+        # MERGE 기반 원자적 증가를 위해 (term, category, date)당 한 행만 허용
+        UniqueConstraint(
+            "search_term", "search_category", "search_date",
+            name="uq_popular_searches_term_category_date",
+        ),
+        # 날짜 범위 집계/하루치 차감이 테이블을 보지 않고 인덱스만 읽도록 search_count 포함
+        Index(
+            "ix_popular_searches_date_term_category",
+            "search_date", "search_term", "search_category",
+            mssql_include=["search_count"],
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    search_term: Mapped[str] = mapped_column(Unicode(200), nullable=False)
+    search_category: Mapped[str] = mapped_column(Unicode(50), nullable=False)
+    search_date: Mapped[date] = mapped_column(Date, nullable=False)
+    search_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class PopularSearchRollup(Base):
+    """
+    최근 window_days일 (term, category) 누적 합계. PopularSearches 증가분을 같은 트랜잭션에서
+    더하고, 기간 밖으로 밀려난 날짜는 주기 작업이 하루씩 빼 준다.
+    """
+    __tablename__ = "PopularSearchRollup"
+    __table_args__ = (
+        # window별 top-N을 정렬 없이 인덱스 순서로 읽는다 (total_count 역방향 탐색)
+        Index(
+            "ix_popular_search_rollup_window_count",
+            "window_days", "total_count",
+            mssql_include=["search_term", "search_category"],
+        ),
+    )
+
+    window_days: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    search_term: Mapped[str] = mapped_column(Unicode(200), primary_key=True)
+    search_category: Mapped[str] = mapped_column(Unicode(50), primary_key=True)
+    total_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class PopularSearchRollupState(Base):
+    """window별 rollup에 포함된 첫 날짜 (window_start 이후의 모든 날짜가 합산되어 있다)"""
+    __tablename__ = "PopularSearchRollupState"
+
+    window_days: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    window_start: Mapped[date] = mapped_column(Date, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
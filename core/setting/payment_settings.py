@@ -0,0 +1,117 @@
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import ClassVar, Dict, List, Optional
+
+from pydantic_settings import BaseSettings
+
+
+class Environment(str, Enum):
+    DEVELOPMENT = "development"
+    STAGING = "staging"
+    PRODUCTION = "production"
+
+class PaymentSettings(BaseSettings):
+    # 환경 설정
+    ENVIRONMENT: Environment = Environment.DEVELOPMENT
+    
+    # 토스페이먼츠 키 설정
+    TOSS_CLIENT_KEY: str
+    TOSS_SECRET_KEY: str
+    TOSS_LIVE_CLIENT_KEY: Optional[str] = None
+    TOSS_LIVE_SECRET_KEY: Optional[str] = None
+
+
+
+
+    # CST_PLATFORM: str = "service"  # 실 서버는 "service", 테스트는 "test"
+    CST_PLATFORM: str = "test"      # 테스트 환경
+    IS_TEST_MODE: bool = True       # 테스트 모드 활성화
+    
+    '''
+    # [테스트 카드 정보]
+    # 카드번호: 4111-1111-1111-1111
+    # 만료일: 12/24
+    # CVC: 123
+    '''
+
+    # 도메인 및 결제 관련 URL 설정
+    BASE_DOMAIN: str = "dev.tvcf.co.kr"
+    FRONT_DOMAIN: str = "front.tvcf.co.kr"
+    PAYMENT_URL: str = f"https://{FRONT_DOMAIN}/payment"
+
+    SUPPORT_CONTACT: str = "02-3447-0101"
+    SUPPORT_EMAIL: str = "support@tvcf.co.kr"
+    
+    # PG API 엔드포인트
+
+    TOSS_API_URL: str = "https://api.tosspayments.com"
+    TOSS_PAY_URL: str = f"{TOSS_API_URL}/v1"
+    LGD_PAY_URL: str = "https://pgapi.tosspayments.com/v2/payments"
+    LGD_CANCEL_URL: str = "https://pgapi.tosspayments.com/v1/payments/cancel"
+    
+    # 결제 취소 권한 설정
+    PAYMENT_CANCEL_ALLOWED_ROLES: List[int] = [3, 4, 5, 6, 7]  # 관리자 권한을 가진 usertype
+    
+    # 로깅 설정
+    LOG_LEVEL: str = "INFO"
+    PAYMENT_LOG_DIR: Path = Path("logs/payment")
+    PAYMENT_ERROR_LOG_FILE: str = "payment_error.log"
+    PAYMENT_ACCESS_LOG_FILE: str = "payment_access.log"
+    
+    # 결제 상태 코드
+    PAYMENT_STATUS_SUCCESS: str = "0000"  # PG사 성공 응답 코드
+    
+    
+    # 테스트 모드 설정
+    IS_TEST_MODE: bool = True
+
+    # 테스트용 설정 (ClassVar로 정의)
+    TEST_PG_CONFIG: ClassVar[Dict[str, str]] = {
+        "CST_PLATFORM": "test",
+        "CST_MID": "tvcf3447",
+        "LGD_MID": "ttvcf3447",  # 테스트용 상점 ID에는 't' 접두어 필요
+    }
+
+    TEST_CARD_INFO: ClassVar[Dict[str, str]] = {
+        "card_number": "9100000000000000",
+        "expiry_date": "12/25",
+        "birth": "800101",
+        "card_pwd": "00"
+    }
+
+    @property
+    def is_production(self) -> bool:
+        """프로덕션 환경 여부"""
+        return self.ENVIRONMENT == Environment.PRODUCTION
+    
+    @property
+    def active_toss_client_key(self) -> str:
+        """현재 환경에 맞는 클라이언트 키 반환"""
+        if self.is_production and self.TOSS_LIVE_CLIENT_KEY:
+            return self.TOSS_LIVE_CLIENT_KEY
+        return self.TOSS_CLIENT_KEY
+    
+    @property
+    def active_toss_secret_key(self) -> str:
+        """현재 환경에 맞는 시크릿 키 반환"""
+        if self.is_production and self.TOSS_LIVE_SECRET_KEY:
+            return self.TOSS_LIVE_SECRET_KEY
+        return self.TOSS_SECRET_KEY
+
+    model_config = {
+        "env_file": ".env",
+        "extra": "allow"
+    }
+
+
+@lru_cache(maxsize=None)
+def get_payment_settings() -> PaymentSettings:
+    return PaymentSettings()
+
+
+def __getattr__(name: str):
+    # `from core.setting.payment_settings import payment_settings`는 처음 접근할 때 생성
+    if name == "payment_settings":
+        return get_payment_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,8 @@
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pytz import timezone
-from pathlib import Path
-from enum import Enum
-from typing import List, Dict, Any, ClassVar, Optional
+from functools import lru_cache
+from typing import Dict, Any, List
 
 
 class Settings(BaseSettings):
@@ -13,6 +12,79 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6380
     REDIS_DB: int = 0
     REDIS_PASSWORD: str = "" 
+    # 읽기 전용 replica (redis://host:port/db, 비어 있으면 primary만 사용)
+    REDIS_REPLICA_URLS: List[str] = []
+    # primary와의 복제 offset 차이가 이보다 크면 해당 replica에서 읽지 않는다
+    REDIS_REPLICA_MAX_LAG_BYTES: int = 1024 * 1024
+    # redis/MSSQL replica health/lag 확인 주기
+    REPLICA_HEALTH_CHECK_SECONDS: float = 5.0
+    # 같은 이벤트 루프 tick에 들어온 단일 명령을 pipeline 하나로 묶어 보낸다 (auto-pipelining)
+    REDIS_AUTO_PIPELINE: bool = False
+    # 0이면 다음 tick까지만 모으고, 양수면 그 시간(µs)만큼 더 모은다
+    REDIS_AUTO_PIPELINE_WINDOW_US: int = 0
+    REDIS_AUTO_PIPELINE_MAX_BATCH: int = 512
+
+    # /metrics (Prometheus) 수집 여부. 끄면 /metrics 라우트도 등록하지 않는다
+    METRICS_ENABLED: bool = True
+    # 워커별 metrics snapshot을 모아 합산할 디렉터리. 비어 있으면 /metrics는 요청을 받은 워커 값만 보여 준다
+    # (run_server.py --prod에서 워커가 2개 이상이면 비어 있을 때 임시 디렉터리를 만들어 채운다)
+    METRICS_MULTIPROCESS_DIR: str = ""
+    METRICS_MULTIPROCESS_WRITE_SECONDS: float = 5.0
+
+    # 인기 검색어 write-behind 설정
+    POPULAR_SEARCH_FLUSH_INTERVAL_MS: int = 500
+    POPULAR_SEARCH_FLUSH_MAX_ENTRIES: int = 1000
+    # 데이터 오류(제약 위반 등)로 배치 flush가 연속 이만큼 실패하면 배치를 나눠 문제 행만 로그를 남기고 버린다.
+    # DB 연결 오류는 버리지 않고 지수 backoff(최대 MAX_BACKOFF_SECONDS)로 재시도한다
+    POPULAR_SEARCH_FLUSH_MAX_ATTEMPTS: int = 5
+    POPULAR_SEARCH_FLUSH_MAX_BACKOFF_SECONDS: float = 30.0
+
+    # 전체 기간 leaderboard 크기 제한 (0 = 제한 없음)
+    POPULAR_SEARCH_MAX_MEMBERS: int = 0
+    POPULAR_SEARCH_TRIM_INTERVAL_SECONDS: int = 300
+    # MSSQL rollup으로 미리 합산할 기간(일) 목록. 마이그레이션 0003 적용 후 예: [30]
+    POPULAR_SEARCH_ROLLUP_WINDOWS: List[int] = []
+    POPULAR_SEARCH_ROLLUP_INTERVAL_SECONDS: int = 600
+    # heavy hitter sketch 크기 (0 = 사용 안 함)와 redis 승격 기준
+    POPULAR_SEARCH_SKETCH_CAPACITY: int = 0
+    POPULAR_SEARCH_PROMOTE_THRESHOLD: int = 3
+
+    # redis leaderboard 재생성 (MSSQL -> redis)
+    POPULAR_SEARCH_REBUILD_ON_STARTUP: bool = True
+    POPULAR_SEARCH_REBUILD_CHUNK_SIZE: int = 5000
+
+    # 기간별(1h/24h/7d) 인기 검색어 갱신 주기. 워커마다 돌지만 30초 SET NX 락으로 그 사이 한 워커만 갱신한다
+    POPULAR_WINDOW_REFRESH_SECONDS: int = 60
+
+    # 인기 검색어 조회 near-cache (워커 프로세스 메모리)
+    # 무효화 구독을 쓰면 값이 바뀔 때 지워지므로 TTL은 구독이 끊겼을 때의 안전장치 역할
+    POPULAR_SEARCH_CACHE_TTL_SECONDS: float = 30.0
+    POPULAR_SEARCH_CACHE_STALE_SECONDS: float = 10.0
+    POPULAR_SEARCH_CACHE_MAX_SIZE: int = 1024
+
+    # 최근 검색어 조회 near-cache (사용자별, 자주 조회하는 사용자 위주로 LRU)
+    RECENT_SEARCH_CACHE_TTL_SECONDS: float = 60.0
+    RECENT_SEARCH_CACHE_MAX_SIZE: int = 10000
+
+    # near-cache 무효화 (redis pub/sub). 끄면 위 TTL로만 갱신되므로 TTL을 짧게 잡을 것
+    NEAR_CACHE_INVALIDATION_ENABLED: bool = True
+    NEAR_CACHE_INVALIDATION_CHANNEL: str = "near_cache:invalidate"
+    # 매 검색마다 바뀌는 leaderboard 무효화는 모아서 이 간격으로 stale 표시로 발행 (지우지 않고 재검증)
+    NEAR_CACHE_INVALIDATION_INTERVAL_MS: int = 200
+
+    # 비로그인(anonymous cookie) 최근 검색어 보관 기간 (접근 시마다 연장)
+    RECENT_SEARCH_ANONYMOUS_TTL_SECONDS: int = 14 * 24 * 3600
+
+    # 검색어 자동완성 색인
+    AUTOCOMPLETE_MAX_PREFIX_LENGTH: int = 15
+    AUTOCOMPLETE_PER_PREFIX: int = 10
+
+    # 기동 시간 예산 (ms, 0 = 검사 안 함). 넘으면 lifespan에서 경고 로그
+    STARTUP_LIFESPAN_BUDGET_MS: int = 0
+
+    # access log 샘플링 (body는 샘플링된 요청/에러 응답만 기록)
+    ACCESS_LOG_SAMPLE_RATE: float = 0.01
+    ACCESS_LOG_ROUTE_SAMPLE_RATES: Dict[str, float] = {}
 
     # MSSQL 설정
     mssql_lib: str
@@ -23,6 +95,21 @@ class Settings(BaseSettings):
     mssql_db: str
     mssql_db_temp: str
     mssql_driver: str
+    # 엔진/커넥션 풀 프로파일 (운영 기본값)
+    mssql_echo: bool = False
+    mssql_pool_size: int = 10
+    mssql_max_overflow: int = 20
+    mssql_pool_timeout: float = 30
+    mssql_pool_recycle: int = 1800
+    mssql_pool_pre_ping: bool = True
+    mssql_fast_executemany: bool = False
+    # 쿼리 timeout(초, pyodbc Connection.timeout). 0이면 제한 없음
+    mssql_statement_timeout: int = 30
+    # 집계 조회용 읽기 전용 replica ("host" 또는 "host:port", 계정/DB는 primary와 동일)
+    mssql_replica_hosts: List[str] = []
+    mssql_replica_max_lag_seconds: float = 30
+    # replica 복제 지연(초)을 한 값으로 돌려주는 쿼리 (비어 있으면 연결 확인만)
+    mssql_replica_lag_query: str = ""
 
     # Elasticsearch 설정
     elastic_node: str
@@ -82,108 +169,20 @@ class Settings(BaseSettings):
     # model_config = SettingsConfigDict(env_file=".env", extra="allow")
     model_config = SettingsConfigDict(env_file=(".env", "utf-8"), extra="allow")
 
-settings = Settings()
-
-class Environment(str, Enum):
-    DEVELOPMENT = "development"
-    STAGING = "staging"
-    PRODUCTION = "production"
-
-class PaymentSettings(BaseSettings):
-    # 환경 설정
-    ENVIRONMENT: Environment = Environment.DEVELOPMENT
-    
-    # 토스페이먼츠 키 설정
-    TOSS_CLIENT_KEY: str
-    TOSS_SECRET_KEY: str
-    TOSS_LIVE_CLIENT_KEY: Optional[str] = None
-    TOSS_LIVE_SECRET_KEY: Optional[str] = None
-
-
-
-
-    # CST_PLATFORM: str = "service"  # 실 서버는 "service", 테스트는 "test"
-    CST_PLATFORM: str = "test"      # 테스트 환경
-    IS_TEST_MODE: bool = True       # 테스트 모드 활성화
-    
-    '''
-    # [테스트 카드 정보]
-    # 카드번호: 4111-1111-1111-1111
-    # 만료일: 12/24
-    # CVC: 123
-    '''
-
-    # 도메인 및 결제 관련 URL 설정
-    BASE_DOMAIN: str = "dev.tvcf.co.kr"
-    FRONT_DOMAIN: str = "front.tvcf.co.kr"
-    PAYMENT_URL: str = f"https://{FRONT_DOMAIN}/payment"
-
-    SUPPORT_CONTACT: str = "02-3447-0101"
-    SUPPORT_EMAIL: str = "support@tvcf.co.kr"
-    
-    # PG API 엔드포인트
-
-    TOSS_API_URL: str = "https://api.tosspayments.com"
-    TOSS_PAY_URL: str = f"{TOSS_API_URL}/v1"
-    LGD_PAY_URL: str = "https://pgapi.tosspayments.com/v2/payments"
-    LGD_CANCEL_URL: str = "https://pgapi.tosspayments.com/v1/payments/cancel"
-    
-    # 결제 취소 권한 설정
-    PAYMENT_CANCEL_ALLOWED_ROLES: List[int] = [3, 4, 5, 6, 7]  # 관리자 권한을 가진 usertype
-    
-    # 로깅 설정
-    LOG_LEVEL: str = "INFO"
-    PAYMENT_LOG_DIR: Path = Path("logs/payment")
-    PAYMENT_ERROR_LOG_FILE: str = "payment_error.log"
-    PAYMENT_ACCESS_LOG_FILE: str = "payment_access.log"
-    
-    # 결제 상태 코드
-    PAYMENT_STATUS_SUCCESS: str = "0000"  # PG사 성공 응답 코드
-    
-    
-    # 테스트 모드 설정
-    IS_TEST_MODE: bool = True
-
-    # 테스트용 설정 (ClassVar로 정의)
-    TEST_PG_CONFIG: ClassVar[Dict[str, str]] = {
-        "CST_PLATFORM": "test",
-        "CST_MID": "tvcf3447",
-        "LGD_MID": "ttvcf3447",  # 테스트용 상점 ID에는 't' 접두어 필요
-    }
-
-    TEST_CARD_INFO: ClassVar[Dict[str, str]] = {
-        "card_number": "9100000000000000",
-        "expiry_date": "12/25",
-        "birth": "800101",
-        "card_pwd": "00"
-    }
-
-    @property
-    def is_production(self) -> bool:
-        """프로덕션 환경 여부"""
-        return self.ENVIRONMENT == Environment.PRODUCTION
-    
-    @property
-    def active_toss_client_key(self) -> str:
-        """현재 환경에 맞는 클라이언트 키 반환"""
-        if self.is_production and self.TOSS_LIVE_CLIENT_KEY:
-            return self.TOSS_LIVE_CLIENT_KEY
-        return self.TOSS_CLIENT_KEY
-    
-    @property
-    def active_toss_secret_key(self) -> str:
-        """현재 환경에 맞는 시크릿 키 반환"""
-        if self.is_production and self.TOSS_LIVE_SECRET_KEY:
-            return self.TOSS_LIVE_SECRET_KEY
-        return self.TOSS_SECRET_KEY
-
-    model_config = {
-        "env_file": ".env",
-        "extra": "allow"
-    }
-
-
-
-
-# 설정 인스턴스 생성
-payment_settings = PaymentSettings()
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """env 파일/환경변수를 한 번만 읽어 프로세스 전체에서 같은 Settings를 쓴다"""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # 기존 `from core.setting.settings import settings` 호환: 처음 접근할 때 생성
+    if name == "settings":
+        return get_settings()
+    # 결제 설정은 core.setting.payment_settings로 이동 (필요한 곳에서만 로드)
+    if name in ("PaymentSettings", "payment_settings", "Environment"):
+        from core.setting import payment_settings as payment_module
+        if name == "payment_settings":
+            return payment_module.get_payment_settings()
+        return getattr(payment_module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,57 @@
+"""PopularSearches 중복 행 정리 후 (term, category, date) unique 제약 추가
+
+기존 테이블은 alembic 도입 전부터 존재하므로 생성은 하지 않는다.
+중복 행은 가장 작은 id 행으로 search_count를 합산한 뒤 나머지를 삭제한다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "PopularSearches"
+CONSTRAINT = "uq_popular_searches_term_category_date"
+
+
+def upgrade() -> None:
+    op.execute(sa.text(f"""
+        WITH dup AS (
+            SELECT MIN(id) AS keep_id, SUM(search_count) AS total_count
+              FROM {TABLE}
+             GROUP BY search_term, search_category, search_date
+            HAVING COUNT(*) > 1
+        )
+        UPDATE p
+           SET p.search_count = dup.total_count
+          FROM {TABLE} p
+          JOIN dup ON p.id = dup.keep_id
+    """))
+    op.execute(sa.text(f"""
+        DELETE p
+          FROM {TABLE} p
+         WHERE EXISTS (
+            SELECT 1
+              FROM {TABLE} k
+             WHERE k.search_term = p.search_term
+               AND k.search_category = p.search_category
+               AND k.search_date = p.search_date
+               AND k.id < p.id
+         )
+    """))
+    op.create_unique_constraint(
+        CONSTRAINT, TABLE, ["search_term", "search_category", "search_date"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(CONSTRAINT, TABLE, type_="unique")
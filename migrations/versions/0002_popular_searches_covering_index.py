@@ -0,0 +1,36 @@
+"""PopularSearches (search_date, term, category) INCLUDE (search_count) covering index
+
+날짜 범위 집계와 rollup 하루치 차감이 clustered index(id)를 훑지 않고 이 인덱스만 읽는다.
+대형 테이블에서는 ONLINE 옵션을 지원하는 에디션이면 점검 시간 없이 만들 수 있다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "PopularSearches"
+INDEX = "ix_popular_searches_date_term_category"
+
+
+def upgrade() -> None:
+    op.create_index(
+        INDEX,
+        TABLE,
+        ["search_date", "search_term", "search_category"],
+        mssql_include=["search_count"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, table_name=TABLE)
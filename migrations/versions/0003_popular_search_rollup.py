@@ -0,0 +1,54 @@
+"""PopularSearchRollup / PopularSearchRollupState 테이블 추가
+
+rollup은 비어 있는 채로 만든다. 상태 행이 없는 window는 첫 주기 작업이 PopularSearches에서
+한 번에 채우고, 이후로는 증가분 반영과 하루 단위 차감으로 유지된다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_TABLE = "PopularSearchRollup"
+STATE_TABLE = "PopularSearchRollupState"
+ROLLUP_INDEX = "ix_popular_search_rollup_window_count"
+
+
+def upgrade() -> None:
+    op.create_table(
+        ROLLUP_TABLE,
+        sa.Column("window_days", sa.Integer(), nullable=False, autoincrement=False),
+        sa.Column("search_term", sa.Unicode(200), nullable=False),
+        sa.Column("search_category", sa.Unicode(50), nullable=False),
+        sa.Column("total_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("window_days", "search_term", "search_category"),
+    )
+    op.create_index(
+        ROLLUP_INDEX,
+        ROLLUP_TABLE,
+        ["window_days", "total_count"],
+        mssql_include=["search_term", "search_category"],
+    )
+    op.create_table(
+        STATE_TABLE,
+        sa.Column("window_days", sa.Integer(), nullable=False, autoincrement=False),
+        sa.Column("window_start", sa.Date(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("window_days"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(STATE_TABLE)
+    op.drop_index(ROLLUP_INDEX, table_name=ROLLUP_TABLE)
+    op.drop_table(ROLLUP_TABLE)
@@ -1,44 +1,126 @@
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Request, Response, Query, Cookie
-from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Cookie
+from typing import List, Literal, Optional
 
 from app.di.container import Container
 from app.keywords.application.services.keyword_service import KeywordService
 
 from app.keywords.application.dto.keyword_dto import (
+    AutocompleteResponseDto,
+    BatchKeywordEventRequestDto,
+    BatchKeywordEventResponseDto,
     PopularSearchResponseDto,
+    RecentSearchResponseDto,
     UpdatePopularRequestDto
 )
+from core.infrastructure.responses.fast_json import FastJSONResponse
 
 router = APIRouter(prefix="/keywords")
 
-@router.get("/get_popular_searches", summary="인기 검색어 조회")
+# 조회 응답은 서버가 만든 데이터라 재검증 없이 FastJSONResponse로 바로 직렬화한다 (response_model은 문서용)
+@router.get(
+    "/get_popular_searches",
+    summary="인기 검색어 조회",
+    response_model=List[PopularSearchResponseDto],
+    response_class=FastJSONResponse,
+)
 @inject
 async def get_popular_searches(
     category: str = Query(None),
     limit: int = Query(10, ge=1, le=100),
+    window: Optional[Literal["1h", "24h", "7d"]] = Query(None, description="미지정 시 전체 기간"),
     keyword_service: KeywordService = Depends(Provide[Container.keyword_service]),
-) -> List[PopularSearchResponseDto]:
-    return await keyword_service.get_popular_searches(category, limit)
+):
+    return FastJSONResponse(await keyword_service.get_popular_searches(category, limit, window))
+
+@router.get(
+    "/autocomplete",
+    summary="검색어 자동완성 (초성 검색 지원)",
+    response_model=List[AutocompleteResponseDto],
+    response_class=FastJSONResponse,
+)
+@inject
+async def autocomplete(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    keyword_service: KeywordService = Depends(Provide[Container.keyword_service]),
+):
+    return FastJSONResponse(await keyword_service.autocomplete(q, limit))
 
 @router.post("/update_popular_search", summary="인기 검색어 업데이트")
 @inject
 async def update_popular_search(
     update_data: UpdatePopularRequestDto,
+    anonymous_id: Optional[str] = Cookie(None),
+    keyword_service: KeywordService = Depends(Provide[Container.keyword_service]),
+):
+    reason = keyword_service.validate_keyword_event(update_data, strict_category=False)
+    if reason:
+        raise HTTPException(status_code=400, detail=reason)
+    return await keyword_service.update_popular_search(update_data=update_data, redis_key=anonymous_id)
+
+@router.post("/batch_update_popular_search", summary="인기 검색어 일괄 업데이트")
+@inject
+async def batch_update_popular_search(
+    batch: BatchKeywordEventRequestDto,
+    anonymous_id: Optional[str] = Cookie(None),
+    keyword_service: KeywordService = Depends(Provide[Container.keyword_service]),
+) -> BatchKeywordEventResponseDto:
+    return await keyword_service.batch_update_popular_search(batch, redis_key=anonymous_id)
+
+@router.post("/rebuild_popular_searches", summary="인기 검색어 redis leaderboard 재생성 (MSSQL 기준)")
+@inject
+async def rebuild_popular_searches(
+    keyword_service: KeywordService = Depends(Provide[Container.keyword_service]),
+):
+    return await keyword_service.rebuild_popular_searches()
+
+@router.get("/popular_search_buffer", summary="인기 검색어 DB 반영 버퍼 상태 조회")
+@inject
+async def get_popular_search_buffer_stats(
+    keyword_service: KeywordService = Depends(Provide[Container.keyword_service]),
+):
+    return keyword_service.get_popular_search_buffer_stats()
+
+@router.get("/popular_search_cache", summary="인기 검색어 near-cache 상태 조회")
+@inject
+async def get_popular_search_cache_stats(
+    keyword_service: KeywordService = Depends(Provide[Container.keyword_service]),
+):
+    return keyword_service.get_popular_search_cache_stats()
+
+@router.get("/recent_search_cache", summary="최근 검색어 near-cache 상태 조회")
+@inject
+async def get_recent_search_cache_stats(
+    keyword_service: KeywordService = Depends(Provide[Container.keyword_service]),
+):
+    return keyword_service.get_recent_search_cache_stats()
+
+@router.get(
+    "/get_recent_searches",
+    summary="최근 검색어 조회",
+    response_model=List[RecentSearchResponseDto],
+    response_class=FastJSONResponse,
+)
+@inject
+async def get_recent_searches(
+    category: str = Query(None),
+    anonymous_id: Optional[str] = Cookie(None),
     keyword_service: KeywordService = Depends(Provide[Container.keyword_service]),
 ):
-    return await keyword_service.update_popular_search(update_data=update_data)
+    if not anonymous_id:
+        return FastJSONResponse([])
+    return FastJSONResponse(await keyword_service.get_recent_searches(redis_key=anonymous_id, category=category))
 
 @router.post("/add_recent_search", summary="인기 검색어 업데이트")
 @inject
 async def update_popular_search_before(
-    request: Request,
-    response: Response,
     update_data: UpdatePopularRequestDto,
-    auth_result: Tuple[Optional[UserResponse], AuthStatus, Request] = Depends(
-        get_optional_user
-    ),
     anonymous_id: Optional[str] = Cookie(None),
     keyword_service: KeywordService = Depends(Provide[Container.keyword_service]),
 ):
-    return await keyword_service.add_recent_search()
\ No newline at end of file
+    if not anonymous_id:
+        raise HTTPException(status_code=400, detail="anonymous_id cookie is required")
+    return await keyword_service.add_recent_search(
+        redis_key=anonymous_id, term=update_data.term, category=update_data.category
+    )
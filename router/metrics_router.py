@@ -0,0 +1,15 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.di.container import Container
+from core.infrastructure.metrics.multiprocess import MetricsExporter
+
+router = APIRouter()
+
+@router.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+@inject
+async def metrics(
+    exporter: MetricsExporter = Depends(Provide[Container.metrics_exporter]),
+):
+    return PlainTextResponse(exporter.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,36 @@
+import argparse
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+
+async def migrate(batch_size: int):
+    from core.infrastructure.redis.client import RedisClient
+    from core.setting.settings import get_settings
+    from app.keywords.infrastructure.repositories.redis_repository import KeywordRedisRepository
+
+    settings = get_settings()
+    client = await RedisClient.get_instance()
+    try:
+        repo = KeywordRedisRepository(
+            client,
+            recent_search_anonymous_ttl_seconds=settings.RECENT_SEARCH_ANONYMOUS_TTL_SECONDS,
+        )
+        # 배포 후 한 번 실행: 조회 시 lazy 마이그레이션이 닿지 않는 (다시 오지 않는) 사용자의 list까지 정리한다
+        keys, migrated = await repo.migrate_all_legacy_recent_searches(batch_size=batch_size)
+        logging.info(f"이전 최근 검색어 list 마이그레이션 완료: {keys}개 키, {migrated}건")
+    finally:
+        await RedisClient.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--env", required=False, default="dev")
+    parser.add_argument("--batch-size", required=False, type=int, default=1000)
+    args = parser.parse_args()
+
+    load_dotenv(dotenv_path=f"_env/{args.env}.env", override=True)
+    logging.basicConfig(level=logging.INFO)
+
+    asyncio.run(migrate(args.batch_size))
@@ -0,0 +1,38 @@
+import argparse
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+
+async def backfill(batch_size: int):
+    from core.infrastructure.redis.client import RedisClient
+    from core.setting.settings import get_settings
+    from app.keywords.infrastructure.repositories.redis_repository import KeywordRedisRepository
+
+    settings = get_settings()
+    client = await RedisClient.get_instance()
+    try:
+        repo = KeywordRedisRepository(
+            client,
+            autocomplete_max_prefix_length=settings.AUTOCOMPLETE_MAX_PREFIX_LENGTH,
+            autocomplete_per_prefix=settings.AUTOCOMPLETE_PER_PREFIX,
+        )
+        migrated = await repo.backfill_category_popular_searches(batch_size=batch_size)
+        logging.info(f"카테고리별 인기 검색어 backfill 완료: {migrated}건")
+        indexed = await repo.rebuild_autocomplete_index(batch_size=batch_size)
+        logging.info(f"자동완성 색인 재생성 완료: {indexed}건")
+    finally:
+        await RedisClient.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--env", required=False, default="dev")
+    parser.add_argument("--batch-size", required=False, type=int, default=1000)
+    args = parser.parse_args()
+
+    load_dotenv(dotenv_path=f"_env/{args.env}.env", override=True)
+    logging.basicConfig(level=logging.INFO)
+
+    asyncio.run(backfill(args.batch_size))
@@ -1,19 +1,72 @@
 import argparse
+import importlib.util
+import os
+import tempfile
 
 import uvicorn
 from dotenv import load_dotenv
-from app.main import app
 
 
-def main():
-    uvicorn.run(app, host="127.0.0.1", port=8000, lifespan="auto")
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def prepare_metrics_dir(workers):
+    # 워커마다 metrics registry가 따로라 /metrics가 한 워커 값만 보여 주지 않도록 공유 디렉터리로 합산한다
+    if os.getenv("METRICS_ENABLED", "true").lower() in ("0", "false", "no"):
+        return
+    directory = os.getenv("METRICS_MULTIPROCESS_DIR")
+    if not directory and workers > 1:
+        directory = tempfile.mkdtemp(prefix="metrics-")
+        os.environ["METRICS_MULTIPROCESS_DIR"] = directory
+    if directory:
+        from core.infrastructure.metrics.multiprocess import clear_multiprocess_dir
+        clear_multiprocess_dir(directory)
+
+
+def main(args):
+    if args.prod:
+        prepare_metrics_dir(args.workers)
+        # 워커마다 app.main을 새로 import 하므로 import string으로 넘긴다.
+        # redis/DB 리소스는 각 워커의 lifespan에서 만들고 닫는다 (Container Resource)
+        uvicorn.run(
+            "app.main:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            loop="uvloop" if _available("uvloop") else "auto",
+            http="httptools" if _available("httptools") else "auto",
+            lifespan="on",
+            proxy_headers=True,
+            forwarded_allow_ips=args.forwarded_allow_ips,
+            timeout_keep_alive=args.keep_alive,
+            backlog=args.backlog,
+            access_log=False,  # access log는 AccessLoggingMiddleware가 샘플링해서 남긴다
+        )
+        return
+
+    # env 파일을 읽은 뒤에 import 해야 Settings가 올바른 값으로 만들어진다
+    from app.main import app
+    uvicorn.run(app, host=args.host, port=args.port, lifespan="auto")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--env", required=False, default="dev")
+    parser.add_argument("--prod", action="store_true", help="멀티 워커 + uvloop/httptools 운영 모드")
+    parser.add_argument("--host", default=None, help="기본: SERVER_HOST 또는 127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="기본: SERVER_PORT 또는 8000")
+    parser.add_argument("--workers", type=int, default=None, help="운영 모드 워커 수 (기본: SERVER_WORKERS 또는 CPU 코어 수)")
+    parser.add_argument("--keep-alive", type=int, default=5, help="keep-alive timeout(초)")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--forwarded-allow-ips", default=None, help="기본: FORWARDED_ALLOW_IPS 또는 127.0.0.1")
     args = parser.parse_args()
 
+    # 워커 프로세스는 이 환경변수를 그대로 물려받는다
     load_dotenv(dotenv_path=f"_env/{args.env}.env", override=True)
+    args.host = args.host or os.getenv("SERVER_HOST", "127.0.0.1")
+    args.port = args.port or int(os.getenv("SERVER_PORT", "8000"))
+    args.workers = args.workers or int(os.getenv("SERVER_WORKERS", os.cpu_count() or 1))
+    args.forwarded_allow_ips = args.forwarded_allow_ips or os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
 
-    main()
+    main(args)
@@ -0,0 +1,123 @@
+import random
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Type
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.infrastructure.database.database import Base
+from core.infrastructure.entities.entity import Entity
+from core.infrastructure.repositories.base_repository import BaseRepository
+from core.models.model import PopularSearches
+
+
+@pytest.fixture
+def anyio_backend():
+    # pytest.mark.anyio가 붙은 async 테스트는 anyio pytest plugin이 asyncio 루프에서만 돌린다
+    return "asyncio"
+
+
+@pytest.fixture
+async def redis():
+    """fakeredis 클라이언트 (Lua 스크립트 실행에 lupa 필요)"""
+    client = fake_aioredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+
+class SqliteDatabase:
+    """MSSQL 대신 쓰는 aiosqlite in-memory DB. Database와 같은 session() 인터페이스를 제공"""
+
+    def __init__(self) -> None:
+        self.engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        self.async_session_factory = sessionmaker(bind=self.engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def session(self):
+        async with self.async_session_factory() as session:
+            try:
+                yield session
+            except Exception as e:
+                await session.rollback()
+                raise e
+            finally:
+                await session.close()
+
+
+@pytest.fixture
+async def sqlite_database():
+    database = SqliteDatabase()
+    async with database.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield database
+    await database.engine.dispose()
+
+
+class PopularSearchRow(Entity):
+    id: int
+    search_term: str
+    search_category: str
+    search_date: date
+    search_count: int
+
+
+class PopularSearchRowRepository(BaseRepository[PopularSearchRow, PopularSearchRow, PopularSearchRow]):
+    @property
+    def model(self) -> Type[PopularSearches]:
+        return PopularSearches
+
+    @property
+    def entity_cls(self) -> Type[PopularSearchRow]:
+        return PopularSearchRow
+
+    def _to_entity(self, orm_obj) -> PopularSearchRow:
+        return PopularSearchRow.model_validate(orm_obj, from_attributes=True)
+
+
+@pytest.fixture
+def popular_search_row_repository():
+    """session_factory를 받아 PopularSearches용 BaseRepository를 만드는 함수"""
+    return PopularSearchRowRepository
+
+
+@pytest.fixture
+def seed_popular_searches():
+    """PopularSearches에 rows 개 행을 넣는 함수. search_count는 0~96이 반복되어 값이 같은 행이 많다"""
+
+    async def seed(database, rows: int) -> None:
+        start = date(2026, 1, 1)
+        async with database.session() as session:
+            await session.execute(insert(PopularSearches), [
+                {
+                    "search_term": f"term{i}",
+                    "search_category": f"c{i % 10}",
+                    "search_date": start + timedelta(days=i % 365),
+                    "search_count": i % 97,
+                }
+                for i in range(rows)
+            ])
+            await session.commit()
+
+    return seed
+
+
+@pytest.fixture
+def zipf_terms():
+    """rank r 검색어의 가중치가 1 / r^exponent 인 검색어 목록을 만드는 함수 (seed가 같으면 같은 순서)"""
+
+    def terms(size: int, seed: int = 1, distinct_terms: int = 10000, exponent: float = 1.1):
+        cum_weights = list(accumulate(1 / rank ** exponent for rank in range(1, distinct_terms + 1)))
+        population = [f"검색어{rank}" for rank in range(1, distinct_terms + 1)]
+        return random.Random(seed).choices(population, cum_weights=cum_weights, k=size)
+
+    return terms
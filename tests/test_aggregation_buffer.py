@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from core.infrastructure.buffer.aggregation_buffer import AggregationBuffer
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_poison_row_is_dead_lettered_after_max_attempts():
+    flushed, dead = [], []
+
+    async def flush_func(items):
+        if any(key == "bad" for key, _ in items):
+            raise IntegrityError("MERGE popular_searches", {}, Exception("constraint violation"))
+        flushed.extend(items)
+
+    buffer = AggregationBuffer(flush_func, max_attempts=3, dead_letter=dead.extend)
+    buffer.add("good", 2)
+    buffer.add("bad")
+    results = [await buffer.flush() for _ in range(4)]
+    stats = buffer.stats()
+
+    # 두 번은 배치째 되돌리고, 세 번째 실패에서 배치를 나눠 good만 반영한다
+    assert results == [0, 0, 1, 0]
+    assert flushed == [("good", 2)]
+    assert dead == [("bad", 1)]
+    assert stats["pending_entries"] == 0 and stats["dead_lettered"] == 1 and stats["flush_failures"] == 3
+    assert stats["flush_count"] == 1 and stats["last_flush_size"] == 1
+
+
+async def test_outage_keeps_rows_and_backs_off():
+    calls, dead = [], []
+    database_up = False
+
+    async def flush_func(items):
+        calls.append(list(items))
+        if not database_up:
+            raise OperationalError("MERGE popular_searches", {}, Exception("communication link failure"))
+
+    buffer = AggregationBuffer(flush_func, max_attempts=1, max_entries=1, dead_letter=dead.extend)
+    buffer.add("a")
+    failed = [await buffer.flush() for _ in range(10)]
+    buffer._flush_event.clear()
+    buffer.add("a")
+    during = buffer.stats()
+
+    # 장애 중에는 backoff 동안 다시 보내지 않고, 넘쳐도 flush를 앞당기지 않으며, 아무것도 버리지 않는다
+    assert failed == [0] * 10 and len(calls) == 1 and not buffer._flush_event.is_set()
+    assert during["pending_entries"] == 1 and during["backoff_remaining_ms"] > 0 and dead == []
+
+    database_up = True
+    assert await buffer.flush(force=True) == 1 and calls[-1] == [("a", 2)]
+    stats = buffer.stats()
+    assert stats["backoff_remaining_ms"] == 0 and stats["flush_count"] == 1
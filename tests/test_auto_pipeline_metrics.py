@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+from core.infrastructure.di.core_container import wrap_redis_client
+from core.infrastructure.metrics.redis_metrics import REDIS_COMMAND_DURATION, REDIS_PIPELINE_COMMANDS
+
+pytestmark = pytest.mark.anyio
+
+
+def recorded():
+    get, pipeline = (REDIS_COMMAND_DURATION._children.get((command,)) for command in ("GET", "PIPELINE"))
+    return (
+        get.count if get else 0,
+        pipeline.count if pipeline else 0,
+        REDIS_PIPELINE_COMMANDS._values.get((), 0),
+    )
+
+
+async def test_auto_batches_are_not_counted_again_as_pipelines(redis):
+    client = wrap_redis_client(redis, auto_pipeline=True)
+    before = recorded()
+    values = await asyncio.gather(*(client.get(f"k{i}") for i in range(3)))
+    after = recorded()
+
+    assert values == [None] * 3 and client.stats()["batches"] == 1
+    # 명령은 GET으로 한 번씩만 기록되고, 자동 배치는 PIPELINE으로 다시 집계되지 않는다
+    assert tuple(a - b for a, b in zip(after, before)) == (3, 0, 0)
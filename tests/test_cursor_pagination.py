@@ -0,0 +1,50 @@
+from contextlib import aclosing, asynccontextmanager
+
+import pytest
+
+from core.models.model import PopularSearches
+
+pytestmark = pytest.mark.anyio
+
+
+def test_after_cursor_leads_with_a_seekable_range(popular_search_row_repository):
+    columns = [PopularSearches.__table__.c.search_count, PopularSearches.__table__.c.id]
+    condition = popular_search_row_repository._after_cursor(columns, [5, 10], descending=True)
+    leading = condition.clauses[0].compile(compile_kwargs={"literal_binds": True})
+    assert str(leading).endswith("search_count <= 5")
+
+
+async def test_cursor_pages_cover_ties_in_both_directions(
+    sqlite_database, seed_popular_searches, popular_search_row_repository
+):
+    await seed_popular_searches(sqlite_database, 300)
+    open_sessions = []
+
+    @asynccontextmanager
+    async def session_factory():
+        open_sessions.append(1)
+        try:
+            async with sqlite_database.session() as session:
+                yield session
+        finally:
+            open_sessions.pop()
+
+    repository = popular_search_row_repository(session_factory)
+    walked = {}
+    for descending in (False, True):
+        ids, cursor = [], None
+        while True:
+            rows, cursor = await repository.get_datas_by_cursor(
+                7, cursor, sort_key="search_count", descending=descending
+            )
+            ids.extend(row.id for row in rows)
+            if cursor is None:
+                break
+        walked[descending] = ids
+    async with aclosing(repository.stream(batch_size=50)) as rows:
+        async for _ in rows:
+            break  # 중간에 멈춰도 닫히면 session을 돌려준다
+
+    assert len(walked[False]) == len(set(walked[False])) == 300
+    assert sorted(walked[True]) == list(range(1, 301))
+    assert open_sessions == []
@@ -0,0 +1,64 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from core.infrastructure.database.database import Database, PoolMetrics, _pyodbc_connection, create_session_factory
+
+pytestmark = pytest.mark.anyio
+
+
+def sqlite_database(tmp_path, pool_size):
+    # pyodbc 없이 Database.session()과 PoolMetrics를 aiosqlite 엔진으로 돌린다
+    database = object.__new__(Database)
+    database.engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", pool_size=pool_size, max_overflow=0
+    )
+    database.pool_metrics = PoolMetrics(database.engine, name="test")
+    database.async_session_factory = create_session_factory(database.engine)
+    return database
+
+
+async def test_checkout_wait_comes_from_pool_events_and_excludes_connect(tmp_path):
+    database = sqlite_database(tmp_path, pool_size=1)
+
+    async def hold(seconds):
+        async with database.session() as session:
+            await session.execute(text("SELECT 1"))
+            await asyncio.sleep(seconds)
+
+    async with database.session():
+        pass  # 쿼리 없는 session은 커넥션을 얻지 않는다
+    idle = database.pool_stats()["checkouts"]
+    await asyncio.gather(hold(0.2), hold(0))
+    stats = database.pool_stats()
+    await database.engine.dispose()
+
+    assert idle == 0
+    assert stats["checkouts"] == 2 and stats["checkout_wait_count"] == 2
+    assert stats["connects"] == 1
+    # 두 번째 session은 첫 번째가 돌려줄 때까지 pool 슬롯을 기다렸다
+    assert stats["checkout_wait_max_ms"] >= 150
+
+
+async def test_time_before_the_first_query_is_not_checkout_wait(tmp_path):
+    database = sqlite_database(tmp_path, pool_size=1)
+    async with database.session() as session:
+        await asyncio.sleep(0.2)  # 쿼리 전 앱 작업
+        await session.execute(text("SELECT 1"))
+        await session.commit()
+        await session.execute(text("SELECT 1"))
+    stats = database.pool_stats()
+    await database.engine.dispose()
+
+    # commit 뒤 다음 쿼리도 새로 checkout 하며 따로 잰다
+    assert stats["checkout_wait_count"] == 2 and stats["checkout_wait_max_ms"] < 100
+
+
+def test_statement_timeout_reaches_the_wrapped_pyodbc_connection():
+    raw = SimpleNamespace(timeout=0)
+    adapted = SimpleNamespace(_connection=SimpleNamespace(_conn=raw))
+    _pyodbc_connection(adapted).timeout = 30
+    assert raw.timeout == 30
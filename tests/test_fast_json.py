@@ -0,0 +1,23 @@
+import json
+
+from pydantic import BaseModel, Field, field_serializer
+
+from core.infrastructure.responses.fast_json import dumps
+
+
+class Inner(BaseModel):
+    score: float
+
+    @field_serializer("score")
+    def round_score(self, score):
+        return round(score, 1)
+
+
+class Outer(BaseModel):
+    term: str = Field(alias="searchTerm")
+    inner: Inner
+
+
+def test_models_follow_pydantic_serialization():
+    model = Outer.model_construct(term="a", inner=Inner.model_construct(score=1.26))
+    assert json.loads(dumps([model])) == [{"searchTerm": "a", "inner": {"score": 1.3}}]
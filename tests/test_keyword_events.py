@@ -0,0 +1,102 @@
+import time
+
+import pytest
+
+from app.keywords.infrastructure.repositories.redis_keys import (
+    popular_bucket_key,
+    popular_member,
+    recent_search_key,
+)
+from app.keywords.infrastructure.repositories.redis_repository import KeywordRedisRepository
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_failure_after_counting_is_reported_as_counted(redis):
+    repository = KeywordRedisRepository(redis)
+    # 최근 검색어 키가 다른 타입이면 카운터 다음 명령만 실패한다
+    await redis.set(recent_search_key("broken"), "x")
+    (counted, error), (ok_counted, ok_error) = await repository.record_keyword_events(
+        [("a", "c", "broken"), ("b", "c", "ok")]
+    )
+    top = await repository.get_popular_searches()
+
+    # 재시도하면 중복 집계되므로 실패가 아니라 "카운트 반영 + 부수 쓰기 실패"로 돌려준다
+    assert counted and error is not None
+    assert ok_counted and ok_error is None
+    assert {(entry.term, entry.count) for entry in top} == {("a", 1), ("b", 1)}
+
+
+async def test_rebuild_keeps_increments_made_while_loading(redis):
+    repository = KeywordRedisRepository(redis)
+    await repository.record_keyword_events([("a", "c", None)] * 3)
+
+    async def chunks():
+        yield [("a", "c", 10), ("b", "c", 5)]
+        # 적재 도중 들어온 검색
+        await repository.record_keyword_events([("a", "c", None), ("new", "c", None)])
+        yield [("d", "c", 1)]
+
+    rows = await repository.replace_popular_searches(chunks())
+    top = await repository.get_popular_searches(limit=10)
+    by_category = await repository.get_popular_searches(category="c", limit=10)
+
+    expected = {("a", 11), ("b", 5), ("d", 1), ("new", 1)}
+    assert rows == 3
+    assert {(entry.term, entry.count) for entry in top} == expected
+    assert {(entry.term, entry.count) for entry in by_category} == expected
+    assert [key async for key in redis.scan_iter(match="*rebuild:*")] == []
+
+
+async def test_lock_is_released_and_extended_only_by_its_owner(redis):
+    repository = KeywordRedisRepository(redis)
+    token = await repository.acquire_lock("job", ttl_seconds=60)
+
+    assert await repository.acquire_lock("job", ttl_seconds=60) is None
+    assert not await repository.extend_lock("job", "other", 60)
+    assert not await repository.release_lock("job", "other")
+    assert await repository.extend_lock("job", token, 60)
+    assert await repository.release_lock("job", token)
+    assert await redis.exists("lock:job") == 0
+
+
+async def test_windows_weight_the_oldest_bucket_and_run_once_per_lock(redis, monkeypatch):
+    hour = 500000
+    # 현재 시간의 3/4이 지난 시점
+    monkeypatch.setattr(time, "time", lambda: (hour + 0.75) * 3600)
+    repository = KeywordRedisRepository(redis)
+    await repository.record_keyword_events([("now", "c", None)] * 2)
+    # 1h 창의 시작 쪽(직전 시간) 버킷은 1/4만 남아 있다
+    for term in ("before", "now"):
+        await redis.zincrby(popular_bucket_key(hour - 1), 8, popular_member(term, "c"))
+
+    assert await repository.materialize_popular_windows()
+    assert not await repository.materialize_popular_windows()
+    top = await repository.get_popular_searches(window="1h")
+    assert [(entry.term, entry.count) for entry in top] == [("now", 4), ("before", 2)]
+
+
+async def test_legacy_recent_search_list_is_migrated_on_read_and_by_scan(redis):
+    repository = KeywordRedisRepository(redis, recent_search_anonymous_ttl_seconds=60)
+    # 이전 형식: redis_key 이름 그대로의 list, 앞쪽이 최근 (중복 포함)
+    await redis.rpush("visitor", "b:c", "a:c", "b:c")
+    await redis.rpush("gone", "x:c")
+
+    expected = [{"term": "b", "category": "c"}, {"term": "a", "category": "c"}]
+    assert await repository.get_recent_searches("visitor") == expected
+    assert await repository.get_recent_searches("visitor") == expected
+    assert await repository.migrate_all_legacy_recent_searches() == (1, 1)
+    assert await redis.exists("visitor", "gone") == 0
+    assert await redis.zrevrange(recent_search_key("gone"), 0, -1) == ["x:c"]
+    assert await redis.ttl(recent_search_key("gone")) > 0
+
+
+async def test_category_with_colon_round_trips_through_members(redis):
+    repository = KeywordRedisRepository(redis)
+    await repository.record_keyword_events([("a:b", "x:50%", "visitor")] * 2)
+
+    assert popular_member("a:b", "x:50%") == "a:b:x%3A50%25"
+    top = await repository.get_popular_searches()
+    assert [(entry.term, entry.category, entry.count) for entry in top] == [("a:b", "x:50%", 2)]
+    assert [entry.term for entry in await repository.get_popular_searches(category="x:50%")] == ["a:b"]
+    assert await repository.get_recent_searches("visitor") == [{"term": "a:b", "category": "x:50%"}]
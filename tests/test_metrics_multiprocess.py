@@ -0,0 +1,31 @@
+from core.infrastructure.metrics.multiprocess import MetricsExporter
+from core.infrastructure.metrics.registry import MetricsRegistry
+
+
+def worker_registry(requests, latency, pool_in_use):
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests", ("route",)).inc("/a", amount=requests)
+    registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0)).observe(latency, "/a")
+    registry.gauge_callback("pool_in_use", "In use", ("database",), lambda: [(("main",), pool_in_use)])
+    return registry
+
+
+def test_workers_are_summed_and_gauges_keep_a_pid_label(tmp_path):
+    first = MetricsExporter(worker_registry(3, 0.05, 2), str(tmp_path))
+    second = MetricsExporter(worker_registry(4, 0.5, 5), str(tmp_path))
+    first.pid, second.pid = "101", "102"
+    first.write()
+
+    lines = second.render().splitlines()
+
+    assert 'requests_total{route="/a"} 7' in lines
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 2' in lines
+    assert 'latency_seconds_count{route="/a"} 2' in lines
+    assert 'pool_in_use{database="main",pid="101"} 2' in lines
+    assert 'pool_in_use{database="main",pid="102"} 5' in lines
+
+
+def test_without_directory_only_this_process_is_rendered():
+    registry = worker_registry(3, 0.05, 2)
+    assert MetricsExporter(registry).render() == registry.render()
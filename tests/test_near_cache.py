@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from core.infrastructure.cache.invalidation import apply_invalidation, decode_tags, encode_tags
+from core.infrastructure.cache.near_cache import NearCache
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_stale_mark_keeps_serving_and_revalidates_once():
+    cache = NearCache(ttl_seconds=60, stale_ttl_seconds=10)
+    loads = []
+
+    async def loader():
+        loads.append(len(loads))
+        return len(loads)
+
+    first = await cache.get_or_load("top", loader, tags=("popular_searches",))
+    apply_invalidation([cache], *decode_tags(encode_tags(["popular_searches"], stale=True)))
+    # 지우지 않았으므로 이전 값을 바로 받고, 동시에 몰린 조회도 갱신은 한 번만
+    served = await asyncio.gather(*(cache.get_or_load("top", loader) for _ in range(5)))
+    await asyncio.sleep(0)
+    refreshed = await cache.get_or_load("top", loader)
+    stats = cache.stats()
+
+    assert (first, served, refreshed, len(loads)) == (1, [1] * 5, 2, 2)
+    assert stats["size"] == 1 and stats["stale_marks"] == 1 and stats["invalidations"] == 0
+
+
+def test_hard_invalidation_still_evicts():
+    cache = NearCache(ttl_seconds=60)
+    cache.set("recent", ["a"], tags=("recent_searches:anon:x",))
+    tags, stale = decode_tags(encode_tags(["recent_searches:anon:x"]))
+    apply_invalidation([cache], tags, stale)
+    assert not stale and cache.get("recent") is None
+
+
+async def test_cancelled_leader_does_not_cancel_waiters():
+    cache = NearCache(ttl_seconds=60)
+    release = asyncio.Event()
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        await release.wait()
+        return "value"
+
+    leader = asyncio.create_task(cache.get_or_load("top", loader))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_load("top", loader))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter == "value"
+    assert leader.cancelled() and cache.get("top") == "value" and len(loads) == 1
@@ -0,0 +1,40 @@
+from collections import Counter
+
+from app.keywords.infrastructure.repositories.popular_search_gate import PopularSearchGate
+
+
+def drive(gate, terms):
+    exact, forwarded = Counter(), Counter()
+    for term in terms:
+        exact[term] += 1
+        forwarded[term] += gate.admit(term)
+    return exact, forwarded
+
+
+def test_zipf_stream_forwards_top_n_counts_without_overcounting(zipf_terms):
+    gate = PopularSearchGate(capacity=1000, promote_threshold=3)
+    exact, forwarded = drive(gate, zipf_terms(200_000, seed=1))
+
+    # 보장 하한만 넘기므로 어떤 term도 실제 횟수보다 많이 반영되지 않는다
+    assert all(forwarded[term] <= count for term, count in exact.items())
+    assert sum(forwarded.values()) <= sum(exact.values())
+
+    top_n = 100
+    exact_top = [term for term, _ in exact.most_common(top_n)]
+    forwarded_top = {term for term, _ in forwarded.most_common(top_n)}
+    assert len(forwarded_top & set(exact_top)) / top_n >= 0.95
+    for term in exact_top[:10]:
+        assert forwarded[term] >= exact[term] * 0.99
+
+
+def test_unique_terms_on_full_sketch_are_not_promoted():
+    gate = PopularSearchGate(capacity=100, promote_threshold=3)
+    _, forwarded = drive(gate, [f"term{i}" for i in range(20_000)])
+
+    assert sum(forwarded.values()) == 0
+
+
+def test_promotion_forwards_guaranteed_count_once_then_increments():
+    gate = PopularSearchGate(capacity=10, promote_threshold=3)
+
+    assert [gate.admit("a") for _ in range(5)] == [0, 0, 3, 1, 1]